@@ -1,7 +1,7 @@
 import gzip
 import time
 import contextlib
-from typing import ClassVar, Iterator, List, IO, Any, Optional, Type, Generic
+from typing import ClassVar, Dict, Iterator, List, IO, Any, Optional, Type, Generic
 
 from dlt.common.metrics import DataWriterMetrics
 from dlt.common.typing import TDataItem, TDataItems
@@ -24,6 +24,45 @@ def new_file_id() -> str:
     return uniq_id(5)
 
 
+class WriterBuffersBudget:
+    """Memory budget shared by buffers of many writers.
+
+    Writers reserve estimated sizes of buffered items. When the budget is exceeded, the largest buffers
+    are flushed first until usage drops to `low_watermark` of the budget.
+    """
+
+    def __init__(self, max_bytes: int, low_watermark: float = 0.75) -> None:
+        self.max_bytes = max_bytes
+        self.low_watermark = low_watermark
+        self.used_bytes = 0
+        self.flushes_count = 0
+        self._writers: Dict[int, "BufferedDataWriter[Any]"] = {}
+
+    def reserve(self, writer: "BufferedDataWriter[Any]", size: int) -> None:
+        self._writers[id(writer)] = writer
+        self.used_bytes += size
+        if self.used_bytes > self.max_bytes:
+            self._flush_largest()
+
+    def release(self, writer: "BufferedDataWriter[Any]", size: int) -> None:
+        self.used_bytes -= size
+
+    def unregister(self, writer: "BufferedDataWriter[Any]") -> None:
+        self._writers.pop(id(writer), None)
+
+    def _flush_largest(self) -> None:
+        target_bytes = self.max_bytes * self.low_watermark
+        for writer in sorted(
+            self._writers.values(), key=lambda w: w.buffered_items_bytes, reverse=True
+        ):
+            if self.used_bytes <= target_bytes or writer.buffered_items_bytes == 0:
+                break
+            writer._flush_items()
+            # flushed writer may be other than the one being written to
+            writer._rotate_file_if_full()
+            self.flushes_count += 1
+
+
 class BufferedDataWriter(Generic[TWriter]):
     @configspec
     class BufferedDataWriterConfiguration(BaseConfiguration):
@@ -31,10 +70,16 @@ class BufferedDataWriter(Generic[TWriter]):
         file_max_items: Optional[int] = None
         file_max_bytes: Optional[int] = None
         disable_compression: bool = False
+        buffers_max_bytes: Optional[int] = None
+        """Memory budget shared by buffers of all writers in item storage. When set, buffers grow until
+        the budget is exceeded instead of flushing every `buffer_max_items`"""
         _caps: Optional[DestinationCapabilitiesContext] = None
 
         __section__: ClassVar[str] = known_sections.DATA_WRITER
 
+    DEFAULT_ROW_SIZE: ClassVar[int] = 256
+    """Estimated size of a buffered row before first flush measures it"""
+
     @with_config(spec=BufferedDataWriterConfiguration)
     def __init__(
         self,
@@ -46,6 +91,7 @@ class BufferedDataWriter(Generic[TWriter]):
         file_max_bytes: int = None,
         disable_compression: bool = False,
         _caps: DestinationCapabilitiesContext = None,
+        buffers_budget: WriterBuffersBudget = None,
     ):
         self.writer_spec = writer_spec
         if self.writer_spec.requires_destination_capabilities and not _caps:
@@ -56,6 +102,10 @@ class BufferedDataWriter(Generic[TWriter]):
         # validate if template has correct placeholders
         self.file_name_template = file_name_template
         self.closed_files: List[DataWriterMetrics] = []  # all fully processed files
+        self.buffers_budget = buffers_budget
+        if buffers_budget:
+            # buffer size is controlled by the shared budget, only max items in file apply
+            buffer_max_items = file_max_items or 2**63
         # buffered items must be less than max items in file
         self.buffer_max_items = min(buffer_max_items, file_max_items or buffer_max_items)
         # Explicitly configured max size supersedes destination limit
@@ -71,6 +121,9 @@ class BufferedDataWriter(Generic[TWriter]):
         self._file_name: str = None
         self._buffered_items: List[TDataItem] = []
         self._buffered_items_count: int = 0
+        self.buffered_items_bytes: int = 0
+        """Estimated size of buffered items, tracked when buffers budget is used"""
+        self._row_size: float = self.DEFAULT_ROW_SIZE
         self._writer: TWriter = None
         self._file: IO[Any] = None
         self._created: float = None
@@ -108,20 +161,18 @@ class BufferedDataWriter(Generic[TWriter]):
         self._buffered_items_count += new_rows_count
         # set last modification date
         self._last_modified = time.time()
+        if self.buffers_budget:
+            items_bytes = self._estimate_items_bytes(item, new_rows_count)
+            self.buffered_items_bytes += items_bytes
+            # may flush this or other writers
+            self.buffers_budget.reserve(self, items_bytes)
         # flush if max buffer exceeded, the second path of the expression prevents empty data frames to pile up in the buffer
         if (
             self._buffered_items_count >= self.buffer_max_items
             or len(self._buffered_items) >= self.buffer_max_items
         ):
             self._flush_items()
-        # rotate the file if max_bytes exceeded
-        if self._file:
-            # rotate on max file size
-            if self.file_max_bytes and self._file.tell() >= self.file_max_bytes:
-                self._rotate_file()
-            # rotate on max items
-            elif self.file_max_items and self._writer.items_count >= self.file_max_items:
-                self._rotate_file()
+        self._rotate_file_if_full()
         return new_rows_count
 
     def write_empty_file(self, columns: TTableSchemaColumns) -> DataWriterMetrics:
@@ -181,7 +232,13 @@ class BufferedDataWriter(Generic[TWriter]):
         """Flushes the data, writes footer (skip_flush is True), collects metrics and closes the underlying file."""
         # like regular files, we do not except on double close
         if not self._closed:
-            self._flush_and_close_file(skip_flush=skip_flush)
+            try:
+                self._flush_and_close_file(skip_flush=skip_flush)
+            finally:
+                if self.buffers_budget:
+                    # items not flushed are dropped
+                    self._release_buffered_bytes()
+                    self.buffers_budget.unregister(self)
             self._closed = True
 
     @property
@@ -234,6 +291,15 @@ class BufferedDataWriter(Generic[TWriter]):
         self._created = time.time()
         return metrics
 
+    def _rotate_file_if_full(self) -> None:
+        if self._file:
+            # rotate on max file size
+            if self.file_max_bytes and self._file.tell() >= self.file_max_bytes:
+                self._rotate_file()
+            # rotate on max items
+            elif self.file_max_items and self._writer.items_count >= self.file_max_items:
+                self._rotate_file()
+
     def _flush_items(self, allow_empty_file: bool = False) -> None:
         if self._buffered_items or allow_empty_file:
             # we only open a writer when there are any items in the buffer and first flush is requested
@@ -247,10 +313,19 @@ class BufferedDataWriter(Generic[TWriter]):
                 self._writer.write_header(self._current_columns)
             # write buffer
             if self._buffered_items:
-                self._writer.write_data(self._buffered_items)
+                if self.buffers_budget:
+                    file_pos = self._file.tell()
+                    self._writer.write_data(self._buffered_items)
+                    # measure serialized size of a row to estimate size of the next buffers
+                    if self._buffered_items_count and (written := self._file.tell() - file_pos):
+                        self._row_size = written / self._buffered_items_count
+                else:
+                    self._writer.write_data(self._buffered_items)
             # reset buffer and counter
             self._buffered_items.clear()
             self._buffered_items_count = 0
+            if self.buffers_budget:
+                self._release_buffered_bytes()
 
     def _flush_and_close_file(
         self, allow_empty_file: bool = False, skip_flush: bool = False
@@ -285,6 +360,17 @@ class BufferedDataWriter(Generic[TWriter]):
         self._last_modified = None
         return metrics
 
+    def _estimate_items_bytes(self, item: TDataItems, rows_count: int) -> int:
+        """Estimates memory taken by `item`, arrow tables and batches report their size"""
+        items = item if isinstance(item, list) else [item]
+        if items and isinstance(getattr(items[0], "nbytes", None), int):
+            return sum(i.nbytes for i in items)
+        return int(rows_count * self._row_size)
+
+    def _release_buffered_bytes(self) -> None:
+        self.buffers_budget.release(self, self.buffered_items_bytes)
+        self.buffered_items_bytes = 0
+
     def _ensure_open(self) -> None:
         if self._closed:
             raise BufferedDataWriterClosed(self._file_name)
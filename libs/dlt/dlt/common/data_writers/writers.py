@@ -367,7 +367,27 @@ class ParquetDataWriter(DataWriter):
         self.writer = self._create_writer(self.schema)
 
     def write_data(self, items: Sequence[TDataItem]) -> None:
-        super().write_data(items)
+        from dlt.common.libs.pyarrow import pyarrow
+
+        # columnar json normalizer may buffer arrow tables together with regular rows
+        tables: List[pyarrow.Table] = []
+        rows: List[TDataItem] = []
+        for item in items:
+            if isinstance(item, dict):
+                rows.append(item)
+            else:
+                if rows:
+                    tables.append(self._rows_to_table(rows))
+                    rows = []
+                tables.append(self._conform_arrow_item(item))
+        if rows:
+            tables.append(self._rows_to_table(rows))
+        table = tables[0] if len(tables) == 1 else pyarrow.concat_tables(tables)
+        self.items_count += table.num_rows
+        # Write
+        self.writer.write_table(table, row_group_size=self.parquet_format.row_group_size)
+
+    def _rows_to_table(self, items: Sequence[TDataItem]) -> "pa.Table":
         from dlt.common.libs.pyarrow import pyarrow
 
         # serialize json types and replace with strings
@@ -382,8 +402,22 @@ class ParquetDataWriter(DataWriter):
         # detect non-null columns receiving nulls. above v.19 it is checked in `write_table`
         if Version(pyarrow.__version__).major < 19:
             table = table.cast(self.schema)
-        # Write
-        self.writer.write_table(table, row_group_size=self.parquet_format.row_group_size)
+        return table
+
+    def _conform_arrow_item(self, item: TDataItem) -> "pa.Table":
+        """Casts arrow table or batch to the writer schema, adding missing columns as nulls"""
+        from dlt.common.libs.pyarrow import pyarrow
+
+        names = set(item.schema.names)
+        arrays = [
+            (
+                item.column(field.name).cast(field.type)
+                if field.name in names
+                else pyarrow.nulls(item.num_rows, field.type)
+            )
+            for field in self.schema
+        ]
+        return pyarrow.Table.from_arrays(arrays, schema=self.schema)
 
     def close(self) -> None:  # noqa
         if self.writer:
@@ -1,5 +1,7 @@
 from typing import Any, Callable, List, Literal, Optional, Sequence, TypeVar, Union
 
+from typing_extensions import NotRequired
+
 from dlt.common.typing import TSortOrder, TTableHintTemplate, TColumnNames, TypedDict
 
 TCursorValue = TypeVar("TCursorValue", bound=Any)
@@ -7,12 +9,15 @@ LastValueFunc = Callable[[Sequence[TCursorValue]], Any]
 OnCursorValueMissing = Literal["raise", "include", "exclude"]
 
 TIncrementalRange = Literal["open", "closed"]
+TUniqueHashesFormat = Literal["digest", "compact"]
 
 
 class IncrementalColumnState(TypedDict):
     initial_value: Optional[Any]
     last_value: Optional[Any]
     unique_hashes: List[str]
+    unique_hashes_compact: NotRequired[bytes]
+    """Sorted 64 bit hashes of rows at `last_value` when `compact` unique hashes format is used"""
 
 
 class IncrementalArgs(TypedDict, total=False):
@@ -28,3 +33,4 @@ class IncrementalArgs(TypedDict, total=False):
     on_cursor_value_missing: Optional[OnCursorValueMissing]
     range_start: Optional[TIncrementalRange]
     range_end: Optional[TIncrementalRange]
+    unique_hashes_format: Optional[TUniqueHashesFormat]
@@ -6,6 +6,7 @@ from typing import (
     Optional,
     Set,
     List,
+    Tuple,
     Type,
     Union,
     Any,
@@ -46,6 +47,8 @@ _PYDANTIC_2 = False
 try:
     from pydantic import PydanticDeprecatedSince20
 
+    from pydantic import TypeAdapter
+
     _PYDANTIC_2 = True
     # hide deprecation warning
     import warnings
@@ -306,6 +309,17 @@ def create_list_model(
     )
 
 
+def create_list_validator(model: Type[_TPydanticModel]) -> Any:
+    """Creates a validator for lists of `model` instances: a `TypeAdapter` on Pydantic 2
+    and a list model created with `create_list_model` on Pydantic 1.
+
+    Building a validator compiles the model schema so it should be created once and reused.
+    """
+    if _PYDANTIC_2:
+        return TypeAdapter(List[model])  # type: ignore[valid-type]
+    return create_list_model(model)
+
+
 def validate_and_filter_items(
     table_name: str,
     list_model: Type[ListModel[_TPydanticModel]],
@@ -322,74 +336,129 @@ def validate_and_filter_items(
     try:
         return list_model(items=items).items
     except ValidationError as e:
-        deleted: Set[int] = set()
-        for err in e.errors():
-            # TODO: we can get rid of most of the code if we use LenientList as explained above
-            if len(err["loc"]) >= 2:
-                err_idx = int(err["loc"][1])
-                if err_idx in deleted:
-                    # already dropped
-                    continue
-                err_item = items[err_idx - len(deleted)]
-            else:
-                # top level error which means misalignment of list model and items
+        invalid_idx = _get_invalid_items(
+            table_name, list_model, items, e, (), column_mode, data_mode
+        )
+        # remove items in place, as before
+        items[:] = [item for idx, item in enumerate(items) if idx not in invalid_idx]
+        # validate again with error items removed
+        return validate_and_filter_items(table_name, list_model, items, column_mode, data_mode)
+
+
+def validate_and_dump_items(
+    table_name: str,
+    model: Type[_TPydanticModel],
+    list_validator: Any,
+    items: List[TDataItem],
+    column_mode: TSchemaEvolutionMode,
+    data_mode: TSchemaEvolutionMode,
+) -> List[Dict[str, Any]]:
+    """Validates list of `items` against `model` like `validate_and_filter_items` but returns validated items
+    as dicts with aliased keys, equivalent to calling `dict(by_alias=True)` on each parsed model.
+    `list_validator` must be created with `create_list_validator` for `model`.
+
+    On Pydantic 2 the batch is validated and dumped with a single call each to the `TypeAdapter`,
+    so no per-item Python code runs when the batch is valid. Non validating items are found in a single
+    pass over the errors and removed before the batch is validated again.
+    """
+    if not _PYDANTIC_2:
+        return [
+            m.dict(by_alias=True)
+            for m in validate_and_filter_items(
+                table_name, list_validator, items, column_mode, data_mode
+            )
+        ]
+
+    adapter: TypeAdapter[List[_TPydanticModel]] = list_validator
+    while True:
+        try:
+            return adapter.dump_python(  # type: ignore[no-any-return]
+                adapter.validate_python(items), by_alias=True
+            )
+        except ValidationError as e:
+            # report locations like the list model does
+            invalid_idx = _get_invalid_items(
+                table_name, model, items, e, ("items",), column_mode, data_mode
+            )
+            items = [item for idx, item in enumerate(items) if idx not in invalid_idx]
+
+
+def _get_invalid_items(
+    table_name: str,
+    schema_model: Type[BaseModel],
+    items: List[TDataItem],
+    e: ValidationError,
+    loc_prefix: Tuple[Any, ...],
+    column_mode: TSchemaEvolutionMode,
+    data_mode: TSchemaEvolutionMode,
+) -> Set[int]:
+    """Returns indexes of `items` that failed validation and must be discarded. Raises on the first
+    item that violates a frozen contract. `loc_prefix` is prepended to Pydantic error locations so
+    the item index is always the second element.
+    """
+    invalid_idx: Set[int] = set()
+    for err in e.errors():
+        loc = loc_prefix + tuple(err["loc"])
+        # TODO: we can get rid of most of the code if we use LenientList as explained above
+        if len(loc) >= 2:
+            err_idx = int(loc[1])
+            if err_idx in invalid_idx:
+                # already dropped
+                continue
+            err_item = items[err_idx]
+        else:
+            # top level error which means misalignment of list model and items
+            raise DataValidationError(
+                None,
+                table_name,
+                str(loc),
+                "columns",
+                "freeze",
+                schema_model,
+                {"columns": "freeze"},
+                items,
+                err["msg"],
+            ) from e
+        # raise on freeze
+        if err["type"] == "extra_forbidden":
+            if column_mode == "freeze":
                 raise DataValidationError(
                     None,
                     table_name,
-                    str(err["loc"]),
+                    str(loc),
                     "columns",
                     "freeze",
-                    list_model,
+                    schema_model,
                     {"columns": "freeze"},
-                    items,
+                    err_item,
                     err["msg"],
                 ) from e
-            # raise on freeze
-            if err["type"] == "extra_forbidden":
-                if column_mode == "freeze":
-                    raise DataValidationError(
-                        None,
-                        table_name,
-                        str(err["loc"]),
-                        "columns",
-                        "freeze",
-                        list_model,
-                        {"columns": "freeze"},
-                        err_item,
-                        err["msg"],
-                    ) from e
-                elif column_mode == "discard_row":
-                    # pop at the right index
-                    items.pop(err_idx - len(deleted))
-                    # store original index so we do not pop again
-                    deleted.add(err_idx)
-                else:
-                    raise NotImplementedError(
-                        f"`{column_mode=:}` not implemented for Pydantic validation"
-                    )
+            elif column_mode == "discard_row":
+                invalid_idx.add(err_idx)
             else:
-                if data_mode == "freeze":
-                    raise DataValidationError(
-                        None,
-                        table_name,
-                        str(err["loc"]),
-                        "data_type",
-                        "freeze",
-                        list_model,
-                        {"data_type": "freeze"},
-                        err_item,
-                        err["msg"],
-                    ) from e
-                elif data_mode == "discard_row":
-                    items.pop(err_idx - len(deleted))
-                    deleted.add(err_idx)
-                else:
-                    raise NotImplementedError(
-                        f"`{data_mode=:}` not implemented for Pydantic validation"
-                    )
-
-        # validate again with error items removed
-        return validate_and_filter_items(table_name, list_model, items, column_mode, data_mode)
+                raise NotImplementedError(
+                    f"`{column_mode=:}` not implemented for Pydantic validation"
+                )
+        else:
+            if data_mode == "freeze":
+                raise DataValidationError(
+                    None,
+                    table_name,
+                    str(loc),
+                    "data_type",
+                    "freeze",
+                    schema_model,
+                    {"data_type": "freeze"},
+                    err_item,
+                    err["msg"],
+                ) from e
+            elif data_mode == "discard_row":
+                invalid_idx.add(err_idx)
+            else:
+                raise NotImplementedError(
+                    f"`{data_mode=:}` not implemented for Pydantic validation"
+                )
+    return invalid_idx
 
 
 def validate_and_filter_item(
@@ -5,7 +5,7 @@ try:
     from sqlalchemy import MetaData, Table, Column, create_engine
     from sqlalchemy.engine import Engine, URL, make_url, Row
     from sqlalchemy.sql import sqltypes, Select, Executable
-    from sqlalchemy.sql.elements import TextClause
+    from sqlalchemy.sql.elements import TextClause, ColumnElement
     from sqlalchemy.sql.sqltypes import TypeEngine
     from sqlalchemy.exc import CompileError
     import sqlalchemy as sa
@@ -34,6 +34,7 @@ __all__ = [
     "Select",
     "Executable",
     "TextClause",
+    "ColumnElement",
     "TypeEngine",
     "CompileError",
     "sa",
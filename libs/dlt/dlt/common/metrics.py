@@ -76,11 +76,42 @@ class ExtractMetrics(StepMetrics):
     """Hints passed to the resources"""
 
 
+class NormalizeWorkerMetrics(NamedTuple):
+    worker_id: str
+    tasks_count: int
+    files_count: int
+    files_size: int
+    busy_time: float
+    """Time in seconds the worker spent processing tasks"""
+    utilization: float
+    """Fraction of the package processing time the worker was busy"""
+    discarded_tasks_count: int = 0
+    """Number of tasks whose results were thrown away due to schema conflicts and redone"""
+    discarded_items_count: int = 0
+    """Number of items written by discarded tasks"""
+
+    def __add__(self, other: Tuple[object, ...], /) -> Tuple[object, ...]:  # type: ignore[override]
+        if isinstance(other, NormalizeWorkerMetrics):
+            return NormalizeWorkerMetrics(
+                self.worker_id if self.worker_id == other.worker_id else "",
+                self.tasks_count + other.tasks_count,
+                self.files_count + other.files_count,
+                self.files_size + other.files_size,
+                self.busy_time + other.busy_time,
+                self.utilization + other.utilization,
+                self.discarded_tasks_count + other.discarded_tasks_count,
+                self.discarded_items_count + other.discarded_items_count,
+            )
+        return NotImplemented
+
+
 class NormalizeMetrics(StepMetrics):
     job_metrics: Dict[str, DataWriterMetrics]
     """Metrics collected per job id during writing of job file"""
     table_metrics: Dict[str, DataWriterMetrics]
     """Job metrics aggregated by table"""
+    worker_metrics: Dict[str, NormalizeWorkerMetrics]
+    """Work done and utilization aggregated by worker"""
 
 
 class LoadJobMetrics(NamedTuple):
@@ -282,6 +282,7 @@ class NormalizeInfo(StepInfo[NormalizeMetrics], _NormalizeInfo):  # type: ignore
         load_metrics: Dict[str, List[Any]] = {
             "job_metrics": [],
             "table_metrics": [],
+            "worker_metrics": [],
         }
         for load_id, metrics_list in self.metrics.items():
             for idx, metrics in enumerate(metrics_list):
@@ -294,6 +295,10 @@ class NormalizeInfo(StepInfo[NormalizeMetrics], _NormalizeInfo):  # type: ignore
                         metrics["table_metrics"], key_name="table_name", extend=extend
                     )
                 )
+                load_metrics["worker_metrics"].extend(
+                    {**worker_metrics._asdict(), **extend}
+                    for worker_metrics in metrics.get("worker_metrics", {}).values()
+                )
         d.update(load_metrics)
         return d
 
@@ -50,6 +50,8 @@ class LoadStorageConfiguration(BaseConfiguration):
     delete_completed_jobs: bool = (
         False  # if set to true the folder with completed jobs will be deleted
     )
+    jobs_journal: bool = False
+    """When true, the loader records job states in an append-only journal and job files are not moved between state folders"""
 
 
 FileSystemCredentials = Union[
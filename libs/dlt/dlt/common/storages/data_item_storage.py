@@ -1,7 +1,8 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from abc import ABC, abstractmethod
 
 from dlt.common import logger
+from dlt.common.configuration import with_config
 from dlt.common.metrics import DataWriterMetrics
 from dlt.common.schema import TTableSchemaColumns
 from dlt.common.typing import TDataItems
@@ -10,6 +11,7 @@ from dlt.common.data_writers import (
     DataWriter,
     FileWriterSpec,
 )
+from dlt.common.data_writers.buffered import WriterBuffersBudget
 
 
 class DataItemStorage(ABC):
@@ -17,8 +19,27 @@ class DataItemStorage(ABC):
         self.writer_spec = writer_spec
         self.writer_cls = DataWriter.writer_class_from_spec(writer_spec)
         self.buffered_writers: Dict[str, BufferedDataWriter[DataWriter]] = {}
+        self._buffers_budget: WriterBuffersBudget = None
+        self._buffers_budget_resolved = False
         super().__init__(*args)
 
+    @property
+    def buffers_budget(self) -> Optional[WriterBuffersBudget]:
+        """Memory budget shared by buffers of all writers, resolved from config when first writer is created"""
+        if not self._buffers_budget_resolved:
+            self._buffers_budget = self._create_buffers_budget()
+            self._buffers_budget_resolved = True
+        return self._buffers_budget
+
+    @staticmethod
+    @with_config(spec=BufferedDataWriter.BufferedDataWriterConfiguration)
+    def _create_buffers_budget(
+        buffers_max_bytes: Optional[int] = None,
+    ) -> Optional[WriterBuffersBudget]:
+        if buffers_max_bytes:
+            return WriterBuffersBudget(buffers_max_bytes)
+        return None
+
     def _get_writer(
         self, load_id: str, schema_name: str, table_name: str
     ) -> BufferedDataWriter[DataWriter]:
@@ -30,6 +51,8 @@ class DataItemStorage(ABC):
             kwargs = {}
             if self.writer_spec.file_max_items:
                 kwargs["file_max_items"] = self.writer_spec.file_max_items
+            if self.buffers_budget:
+                kwargs["buffers_budget"] = self.buffers_budget
             path = self._get_data_item_path_template(load_id, schema_name, table_name)
             writer = BufferedDataWriter(self.writer_spec, path, **kwargs)
             self.buffered_writers[writer_id] = writer
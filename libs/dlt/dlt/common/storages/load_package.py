@@ -8,6 +8,7 @@ import humanize
 from pathlib import PurePath
 from pendulum.datetime import DateTime
 from typing import (
+    IO,
     ClassVar,
     Dict,
     Iterable,
@@ -314,6 +315,107 @@ class LoadPackageInfo(SupportsHumanize, _LoadPackageInfo):
         return self.asstr(verbosity=0)
 
 
+class TJobsJournalEntry(TypedDict):
+    """A single line of the jobs journal that records a state transition of a job"""
+
+    job: str
+    """File name of the job"""
+    state: Optional[TPackageJobState]
+    """State the job transitioned to, None if the job was deleted"""
+    ts: float
+    """Timestamp of the transition"""
+    new_job: NotRequired[str]
+    """New file name of the job ie. when retry count is increased"""
+    size: NotRequired[int]
+    """Size of the job file, recorded when the job is added"""
+    created_at: NotRequired[float]
+    """Modification time of the job file, recorded when the job is added"""
+    message: NotRequired[str]
+    """Exception message of a failed job"""
+
+
+class JournaledJob(NamedTuple):
+    """State of a job as recorded in the jobs journal"""
+
+    state: TPackageJobState
+    size: int
+    created_at: float
+    updated_at: float
+    failed_message: Optional[str]
+
+
+class PackageJobsJournal:
+    """Append-only journal of job state transitions in a single load package.
+
+    Each entry is a json line written with a single append so a crash may leave at most one partially
+    written line at the end of the journal. Such line is ignored when replaying and truncated before the
+    next append. States of all jobs are kept in `jobs`, entries appended by other instances are replayed
+    on `refresh`.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.jobs: Dict[str, JournaledJob] = {}
+        self._offset = 0
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Replays entries appended to the journal since the last refresh"""
+        size = os.path.getsize(self.path)
+        if size == self._offset:
+            return
+        if size < self._offset:
+            # journal was recreated
+            self.jobs.clear()
+            self._offset = 0
+        with open(self.path, "rb") as f:
+            self._replay(f)
+
+    def append(self, *entries: TJobsJournalEntry) -> None:
+        data = b"".join(json.dumpb(entry) + b"\n" for entry in entries)
+        with open(self.path, "r+b") as f:
+            if f.seek(0, os.SEEK_END) != self._offset:
+                self._replay(f)
+                # drop partially written entry
+                f.seek(self._offset)
+                f.truncate()
+            f.write(data)
+        self._offset += len(data)
+        for entry in entries:
+            self._apply(entry)
+
+    @staticmethod
+    def create(path: str, entries: Sequence[TJobsJournalEntry]) -> "PackageJobsJournal":
+        """Atomically creates journal at `path` with initial `entries`"""
+        FileStorage.save_atomic(
+            os.path.dirname(path),
+            os.path.basename(path),
+            b"".join(json.dumpb(entry) + b"\n" for entry in entries),
+            file_type="b",
+        )
+        return PackageJobsJournal(path)
+
+    def _replay(self, f: IO[bytes]) -> None:
+        f.seek(self._offset)
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            self._apply(json.loadb(line))
+            self._offset += len(line)
+
+    def _apply(self, entry: TJobsJournalEntry) -> None:
+        job = self.jobs.pop(entry["job"], None)
+        if entry["state"] is None:
+            return
+        if job is None:
+            job = JournaledJob(
+                entry["state"], entry.get("size", 0), entry.get("created_at", entry["ts"]), 0, None
+            )
+        self.jobs[entry.get("new_job", entry["job"])] = job._replace(
+            state=entry["state"], updated_at=entry["ts"], failed_message=entry.get("message")
+        )
+
+
 class PackageStorage:
     NEW_JOBS_FOLDER: ClassVar[TPackageJobState] = "new_jobs"
     FAILED_JOBS_FOLDER: ClassVar[TPackageJobState] = "failed_jobs"
@@ -333,11 +435,15 @@ class PackageStorage:
     LOAD_PACKAGE_STATE_FILE_NAME = (  # internal state of the load package, will not be synced to the destination
         "load_package_state.json"
     )
+    JOBS_JOURNAL_FILE_NAME = (  # job states of packages with journal layout, job files stay in new_jobs
+        "jobs_journal.jsonl"
+    )
 
     def __init__(self, storage: FileStorage, initial_state: TLoadPackageStatus) -> None:
         """Creates storage that manages load packages with root at `storage` and initial package state `initial_state`"""
         self.storage = storage
         self.initial_state = initial_state
+        self._journals: Dict[str, PackageJobsJournal] = {}
 
     #
     # List jobs
@@ -352,9 +458,24 @@ class PackageStorage:
         return os.path.join(self.get_package_path(load_id), state)
 
     def get_job_file_path(self, load_id: str, state: TPackageJobState, file_name: str) -> str:
-        """Get path to job with `file_name` in `state` in package `load_id`, relative to the storage root"""
+        """Get path to job with `file_name` in `state` in package `load_id`, relative to the storage root
+
+        NOTE: in packages with jobs journal all job files stay in new jobs folder
+        """
+        if state != PackageStorage.NEW_JOBS_FOLDER and (
+            load_id in self._journals or self.has_jobs_journal(load_id)
+        ):
+            state = PackageStorage.NEW_JOBS_FOLDER
         return os.path.join(self.get_job_state_folder_path(load_id, state), file_name)
 
+    def get_jobs_journal_path(self, load_id: str) -> str:
+        """Gets path to the jobs journal of package `load_id`, relative to the storage root"""
+        return os.path.join(self.get_package_path(load_id), PackageStorage.JOBS_JOURNAL_FILE_NAME)
+
+    def has_jobs_journal(self, load_id: str) -> bool:
+        """Checks if package `load_id` records job states in the jobs journal"""
+        return self.storage.has_file(self.get_jobs_journal_path(load_id))
+
     def list_packages(self) -> Sequence[str]:
         """Lists all load ids in storage, earliest first
 
@@ -365,17 +486,23 @@ class PackageStorage:
         return sorted(loads)
 
     def list_new_jobs(self, load_id: str) -> Sequence[str]:
+        if journal := self._get_jobs_journal(load_id):
+            return self._list_journaled_jobs(load_id, journal, PackageStorage.NEW_JOBS_FOLDER)
         new_jobs = self.storage.list_folder_files(
             self.get_job_state_folder_path(load_id, PackageStorage.NEW_JOBS_FOLDER)
         )
         return new_jobs
 
     def list_started_jobs(self, load_id: str) -> Sequence[str]:
+        if journal := self._get_jobs_journal(load_id):
+            return self._list_journaled_jobs(load_id, journal, PackageStorage.STARTED_JOBS_FOLDER)
         return self.storage.list_folder_files(
             self.get_job_state_folder_path(load_id, PackageStorage.STARTED_JOBS_FOLDER)
         )
 
     def list_failed_jobs(self, load_id: str) -> Sequence[str]:
+        if journal := self._get_jobs_journal(load_id):
+            return self._list_journaled_jobs(load_id, journal, PackageStorage.FAILED_JOBS_FOLDER)
         return [
             file
             for file in self.storage.list_folder_files(
@@ -411,10 +538,15 @@ class PackageStorage:
                 )
             )
         )
+        journal = self._get_jobs_journal(load_id)
         for file in self.list_failed_jobs(load_id):
             failed_jobs.append(
                 self._read_job_file_info(
-                    load_id, "failed_jobs", ParsedLoadJobFileName.parse(file), package_created_at
+                    load_id,
+                    journal,
+                    "failed_jobs",
+                    ParsedLoadJobFileName.parse(file),
+                    package_created_at,
                 )
             )
         return failed_jobs
@@ -433,6 +565,19 @@ class PackageStorage:
         self, load_id: str, job_file_path: str, job_state: TPackageJobState = "new_jobs"
     ) -> None:
         """Adds new job by moving the `job_file_path` into `new_jobs` of package `load_id`"""
+        if journal := self._get_jobs_journal(load_id):
+            imported_path = self.storage.atomic_import(
+                job_file_path,
+                self.get_job_state_folder_path(load_id, PackageStorage.NEW_JOBS_FOLDER),
+            )
+            journal.append(
+                self._new_journal_entry(
+                    job_state,
+                    FileStorage.get_file_name_from_file_path(imported_path),
+                    self.storage.make_full_path(imported_path),
+                )
+            )
+            return
         self.storage.atomic_import(
             job_file_path, self.get_job_state_folder_path(load_id, job_state)
         )
@@ -443,6 +588,16 @@ class PackageStorage:
         )
 
     def fail_job(self, load_id: str, file_name: str, failed_message: Optional[str]) -> str:
+        if journal := self._get_jobs_journal(load_id):
+            # exception is recorded in the journal
+            return self._record_job_transition(
+                load_id,
+                journal,
+                PackageStorage.STARTED_JOBS_FOLDER,
+                PackageStorage.FAILED_JOBS_FOLDER,
+                file_name,
+                failed_message=failed_message,
+            )
         # save the exception to failed jobs
         if failed_message:
             self.storage.save(
@@ -514,9 +669,46 @@ class PackageStorage:
         # TODO: also modify state
         return load_path
 
+    def create_jobs_journal(self, load_id: str) -> None:
+        """Switches package `load_id` to journal layout. Job files are moved to new jobs folder once and
+        all further job state transitions are appended to the jobs journal instead of moving the files.
+        """
+        if self.has_jobs_journal(load_id):
+            return
+        new_jobs_path = self.get_job_state_folder_path(load_id, PackageStorage.NEW_JOBS_FOLDER)
+        entries: List[TJobsJournalEntry] = []
+        for state, jobs in self.get_load_package_jobs(load_id).items():
+            for job in jobs:
+                file_name = job.file_name()
+                job_path = self.get_job_file_path(load_id, state, file_name)
+                entry = self._new_journal_entry(
+                    state, file_name, self.storage.make_full_path(job_path)
+                )
+                if state == PackageStorage.FAILED_JOBS_FOLDER:
+                    if failed_message := self.get_job_failed_message(load_id, job):
+                        entry["message"] = failed_message
+                if state != PackageStorage.NEW_JOBS_FOLDER:
+                    self.storage.atomic_rename(job_path, os.path.join(new_jobs_path, file_name))
+                entries.append(entry)
+        self._journals[load_id] = PackageJobsJournal.create(
+            self.storage.make_full_path(self.get_jobs_journal_path(load_id)), entries
+        )
+
     def remove_completed_jobs(self, load_id: str) -> None:
         """Deletes completed jobs. If package has failed jobs, nothing gets deleted."""
         has_failed_jobs = len(self.list_failed_jobs(load_id)) > 0
+        if not has_failed_jobs and (journal := self._get_jobs_journal(load_id)):
+            completed_jobs = [
+                file_name
+                for file_name, job in journal.jobs.items()
+                if job.state == PackageStorage.COMPLETED_JOBS_FOLDER
+            ]
+            for file_name in completed_jobs:
+                self.storage.delete(
+                    self.get_job_file_path(load_id, PackageStorage.NEW_JOBS_FOLDER, file_name)
+                )
+            ts = precise_time()
+            journal.append(*({"job": f, "state": None, "ts": ts} for f in completed_jobs))
         # delete completed jobs
         if not has_failed_jobs:
             self.storage.delete_folder(
@@ -531,6 +723,7 @@ class PackageStorage:
                 return
             raise LoadPackageNotFound(load_id)
         self.storage.delete_folder(package_path, recursively=True)
+        self._journals.pop(load_id, None)
 
     def load_schema(self, load_id: str) -> Schema:
         return Schema.from_dict(self._load_schema(load_id), validate_schema=False)
@@ -592,7 +785,18 @@ class PackageStorage:
         package_path = self.get_package_path(load_id)
         if not self.storage.has_folder(package_path):
             raise LoadPackageNotFound(load_id)
+        return self._get_load_package_jobs(load_id, self._get_jobs_journal(load_id))
+
+    def _get_load_package_jobs(
+        self, load_id: str, journal: Optional[PackageJobsJournal]
+    ) -> Dict[TPackageJobState, List[ParsedLoadJobFileName]]:
         all_jobs: Dict[TPackageJobState, List[ParsedLoadJobFileName]] = {}
+        if journal:
+            for state in WORKING_FOLDERS:
+                all_jobs[state] = []
+            for file_name, job in journal.jobs.items():
+                all_jobs[job.state].append(ParsedLoadJobFileName.parse(file_name))
+            return all_jobs
         for state in WORKING_FOLDERS:
             jobs: List[ParsedLoadJobFileName] = []
             with contextlib.suppress(FileNotFoundError):
@@ -612,7 +816,11 @@ class PackageStorage:
         NOTE: do not call this function often. it should be used only to generate metrics
         """
         package_path = self.get_package_path(load_id)
-        package_jobs = self.get_load_package_jobs(load_id)
+        if not self.storage.has_folder(package_path):
+            raise LoadPackageNotFound(load_id)
+        # resolve the journal once and use it for all jobs in the package
+        journal = self._get_jobs_journal(load_id)
+        package_jobs = self._get_load_package_jobs(load_id, journal)
 
         package_created_at: DateTime = None
         package_state = self.initial_state
@@ -638,7 +846,8 @@ class PackageStorage:
         all_job_infos: Dict[TPackageJobState, List[LoadJobInfo]] = {}
         for state, jobs in package_jobs.items():
             all_job_infos[state] = [
-                self._read_job_file_info(load_id, state, job, package_created_at) for job in jobs
+                self._read_job_file_info(load_id, journal, state, job, package_created_at)
+                for job in jobs
             ]
 
         return LoadPackageInfo(
@@ -653,7 +862,21 @@ class PackageStorage:
 
     def get_job_failed_message(self, load_id: str, job: ParsedLoadJobFileName) -> str:
         """Get exception message of a failed job."""
-        rel_path = self.get_job_file_path(load_id, "failed_jobs", job.file_name())
+        if journal := self._get_jobs_journal(load_id):
+            journaled_job = journal.jobs.get(job.file_name())
+            if journaled_job is None or journaled_job.state != PackageStorage.FAILED_JOBS_FOLDER:
+                raise FileNotFoundError(
+                    self.get_job_file_path(load_id, "failed_jobs", job.file_name())
+                )
+            return journaled_job.failed_message
+        return self._read_job_failed_message(load_id, job)
+
+    def _read_job_failed_message(self, load_id: str, job: ParsedLoadJobFileName) -> str:
+        """Reads exception message of a failed job from a package without jobs journal"""
+        rel_path = os.path.join(
+            self.get_job_state_folder_path(load_id, PackageStorage.FAILED_JOBS_FOLDER),
+            job.file_name(),
+        )
         if not self.storage.has_file(rel_path):
             raise FileNotFoundError(rel_path)
         failed_message: str = None
@@ -681,16 +904,35 @@ class PackageStorage:
     def _read_job_file_info(
         self,
         load_id: str,
+        journal: Optional[PackageJobsJournal],
         state: TPackageJobState,
         job: ParsedLoadJobFileName,
         now: DateTime = None,
     ) -> LoadJobInfo:
-        """Creates job info by reading additional props from storage"""
+        """Creates job info from the `journal` of the package or by reading additional props from storage"""
+        if journal:
+            journaled_job = journal.jobs[job.file_name()]
+            return LoadJobInfo(
+                state,
+                self.storage.make_full_path(
+                    os.path.join(
+                        self.get_job_state_folder_path(load_id, PackageStorage.NEW_JOBS_FOLDER),
+                        job.file_name(),
+                    )
+                ),
+                journaled_job.size,
+                pendulum.from_timestamp(journaled_job.created_at),
+                (now.timestamp() if now else precise_time()) - journaled_job.created_at,
+                job,
+                journaled_job.failed_message,
+            )
         failed_message = None
         if state == "failed_jobs":
-            failed_message = self.get_job_failed_message(load_id, job)
+            failed_message = self._read_job_failed_message(load_id, job)
         full_path = os.path.join(
-            self.storage.storage_path, self.get_job_file_path(load_id, state, job.file_name())
+            self.storage.storage_path,
+            self.get_job_state_folder_path(load_id, state),
+            job.file_name(),
         )
         st = os.stat(full_path)
         return LoadJobInfo(
@@ -718,12 +960,85 @@ class PackageStorage:
         # ensure we move file names, not paths
         assert file_name == FileStorage.get_file_name_from_file_path(file_name)
 
+        if journal := self._get_jobs_journal(load_id):
+            return self._record_job_transition(
+                load_id, journal, source_folder, dest_folder, file_name, new_file_name
+            )
         dest_path = self.get_job_file_path(load_id, dest_folder, new_file_name or file_name)
         self.storage.atomic_rename(
             self.get_job_file_path(load_id, source_folder, file_name), dest_path
         )
         return self.storage.make_full_path(dest_path)
 
+    def _record_job_transition(
+        self,
+        load_id: str,
+        journal: PackageJobsJournal,
+        source_folder: TPackageJobState,
+        dest_folder: TPackageJobState,
+        file_name: str,
+        new_file_name: str = None,
+        failed_message: str = None,
+    ) -> str:
+        """Records job transition in the journal. Job file is renamed in place if `new_file_name` is set"""
+        source_path = self.get_job_state_folder_path(load_id, PackageStorage.NEW_JOBS_FOLDER)
+        job = journal.jobs.get(file_name)
+        if job is None or job.state != source_folder:
+            raise FileNotFoundError(os.path.join(source_path, file_name))
+        entry: TJobsJournalEntry = {"job": file_name, "state": dest_folder, "ts": precise_time()}
+        if new_file_name:
+            self.storage.atomic_rename(
+                os.path.join(source_path, file_name), os.path.join(source_path, new_file_name)
+            )
+            entry["new_job"] = new_file_name
+        if failed_message:
+            entry["message"] = failed_message
+        journal.append(entry)
+        return self.storage.make_full_path(os.path.join(source_path, new_file_name or file_name))
+
+    def _get_jobs_journal(self, load_id: str) -> Optional[PackageJobsJournal]:
+        """Gets up to date jobs journal of package `load_id` or None if package does not have it.
+
+        Journals are cached per package so a known journal costs a single size check to refresh.
+        """
+        if journal := self._journals.get(load_id):
+            try:
+                journal.refresh()
+                return journal
+            except FileNotFoundError:
+                # package was moved or deleted
+                del self._journals[load_id]
+        if not self.has_jobs_journal(load_id):
+            return None
+        journal = PackageJobsJournal(
+            self.storage.make_full_path(self.get_jobs_journal_path(load_id))
+        )
+        self._journals[load_id] = journal
+        return journal
+
+    def _list_journaled_jobs(
+        self, load_id: str, journal: PackageJobsJournal, state: TPackageJobState
+    ) -> List[str]:
+        jobs_path = self.get_job_state_folder_path(load_id, PackageStorage.NEW_JOBS_FOLDER)
+        return [
+            os.path.join(jobs_path, file_name)
+            for file_name, job in journal.jobs.items()
+            if job.state == state
+        ]
+
+    @staticmethod
+    def _new_journal_entry(
+        state: TPackageJobState, file_name: str, file_path: str
+    ) -> TJobsJournalEntry:
+        st = os.stat(file_path)
+        return {
+            "job": file_name,
+            "state": state,
+            "ts": precise_time(),
+            "size": st.st_size,
+            "created_at": st.st_mtime,
+        }
+
     def _load_schema(self, load_id: str) -> DictStrAny:
         schema_path = os.path.join(load_id, PackageStorage.SCHEMA_FILE_NAME)
         return json.loads(self.storage.load(schema_path))  # type: ignore[no-any-return]
@@ -0,0 +1,129 @@
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import List, Optional
+
+from dlt.common import logger
+from dlt.common.libs.pyarrow import pyarrow
+
+DEFAULT_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+CACHE_FILE_EXTENSION = ".parquet"
+
+
+class RelationResultCache:
+    """On-disk cache of `dlt.Relation` results stored as parquet files.
+
+    Results are keyed by the destination type, name and configuration, the dataset name, the id
+    of the newest completed load, the result format and the SQL of the relation. A new load
+    package changes the key of every query in the dataset so stale results are never returned;
+    they are evicted, least recently used first, when the cache grows over `max_bytes`.
+
+    Args:
+        cache_dir (str): Directory where results are stored. Created if it does not exist.
+        max_bytes (int): Byte budget of the cache directory. Defaults to 1 GB.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = DEFAULT_CACHE_MAX_BYTES) -> None:
+        if max_bytes <= 0:
+            raise ValueError("`max_bytes` must be a positive integer.")
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # cache keys and file sizes in least recently used order
+        self._index: "OrderedDict[str, int]" = OrderedDict()
+        self._total_bytes = 0
+        os.makedirs(cache_dir, exist_ok=True)
+        self._load_index()
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Creates a cache key from `parts`, ie. destination, dataset name, load id and query"""
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x00")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[pyarrow.Table]:
+        """Returns the table stored under `key` or None if it is not in the cache"""
+        path = self._path(key)
+        try:
+            table = pyarrow.parquet.read_table(path)
+        except FileNotFoundError:
+            with self._lock:
+                self._total_bytes -= self._index.pop(key, 0)
+            return None
+        except pyarrow.ArrowInvalid:
+            logger.warning(f"Dropping corrupted relation result cache file {path}")
+            with self._lock:
+                self._total_bytes -= self._index.pop(key, 0)
+            self._remove_file(key)
+            return None
+        with self._lock:
+            if key in self._index:
+                self._index.move_to_end(key)
+        # keep recency on disk so it survives reloading the index
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return table
+
+    def put(self, key: str, table: pyarrow.Table) -> None:
+        """Stores `table` under `key`, evicting least recently used results over the byte budget"""
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        pyarrow.parquet.write_table(table, tmp_path)
+        size = os.path.getsize(tmp_path)
+        os.replace(tmp_path, path)
+        with self._lock:
+            self._total_bytes += size - self._index.pop(key, 0)
+            self._index[key] = size
+            evicted = self._evict()
+        for evicted_key in evicted:
+            self._remove_file(evicted_key)
+
+    def clear(self) -> None:
+        """Removes all cached results"""
+        with self._lock:
+            keys = list(self._index)
+            self._index.clear()
+            self._total_bytes = 0
+        for key in keys:
+            self._remove_file(key)
+
+    def _evict(self) -> List[str]:
+        evicted: List[str] = []
+        while self._total_bytes > self.max_bytes and len(self._index) > 1:
+            key, size = self._index.popitem(last=False)
+            self._total_bytes -= size
+            evicted.append(key)
+        return evicted
+
+    def _load_index(self) -> None:
+        entries = []
+        for file_name in os.listdir(self.cache_dir):
+            if not file_name.endswith(CACHE_FILE_EXTENSION):
+                continue
+            stat = os.stat(os.path.join(self.cache_dir, file_name))
+            entries.append((stat.st_mtime, file_name[: -len(CACHE_FILE_EXTENSION)], stat.st_size))
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+            self._total_bytes += size
+        for key in self._evict():
+            self._remove_file(key)
+
+    def _remove_file(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            # another process sharing the cache directory removed it
+            pass
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + CACHE_FILE_EXTENSION)
@@ -7,14 +7,17 @@ from sqlglot.schema import Schema as SQLGlotSchema
 import sqlglot.expressions as sge
 
 import dlt
-from dlt.common.destination.exceptions import OpenTableClientNotAvailable
+from dlt.common.destination.exceptions import (
+    DestinationUndefinedEntity,
+    OpenTableClientNotAvailable,
+)
 from dlt.common.libs.sqlglot import TSqlGlotDialect
 from dlt.common.json import json
 from dlt.common.destination.reference import AnyDestination, TDestinationReferenceArg, Destination
 from dlt.common.destination.client import JobClientBase, SupportsOpenTables, WithStateSync
 from dlt.common.schema import Schema
 from dlt.common.typing import Self
-from dlt.common.schema.typing import C_DLT_LOAD_ID
+from dlt.common.schema.typing import C_DLT_LOAD_ID, C_DLT_LOADS_TABLE_LOAD_ID
 from dlt.common.utils import simple_repr, without_none
 from dlt.destinations.sql_client import SqlClientBase, WithSqlClient
 from dlt.dataset import lineage
@@ -25,6 +28,7 @@ from dlt.common.destination.exceptions import SqlClientNotAvailable
 if TYPE_CHECKING:
     from ibis import ir
     from ibis import BaseBackend as IbisBackend
+    from dlt.dataset.cache import RelationResultCache
 
 
 class Dataset:
@@ -35,6 +39,7 @@ class Dataset:
         destination: TDestinationReferenceArg,
         dataset_name: str,
         schema: Union[dlt.Schema, str, None] = None,
+        result_cache: Optional[RelationResultCache] = None,
     ) -> None:
         self._destination_reference = destination
         self._destination: AnyDestination = Destination.from_reference(destination)
@@ -44,6 +49,8 @@ class Dataset:
         self._sql_client: SqlClientBase[Any] = None
         self._opened_sql_client: SqlClientBase[Any] = None
         self._table_client: SupportsOpenTables = None
+        self._result_cache = result_cache
+        self._destination_fingerprint: str = None
 
     def ibis(self, read_only: bool = False) -> IbisBackend:
         """Get an ibis backend for the dataset.
@@ -125,6 +132,40 @@ class Dataset:
         """Name of the dataset"""
         return self._dataset_name
 
+    @property
+    def result_cache(self) -> Optional[RelationResultCache]:
+        """Cache of relation results, if enabled. Used by `Relation.arrow()` and `Relation.df()`"""
+        return self._result_cache
+
+    def _get_result_cache_key(self, sql: str, result_format: str) -> Optional[str]:
+        """Returns result cache key for query `sql` returned as `result_format` or None if the
+        dataset has no completed loads
+        """
+        from dlt.dataset.cache import RelationResultCache
+
+        latest_load_id = self._get_latest_load_id()
+        if latest_load_id is None:
+            return None
+        if self._destination_fingerprint is None:
+            config = self.destination_client.config
+            self._destination_fingerprint = RelationResultCache.make_key(
+                config.destination_type, config.destination_name or "", str(config)
+            )
+        return RelationResultCache.make_key(
+            self._destination_fingerprint, self.dataset_name, latest_load_id, result_format, sql
+        )
+
+    def _get_latest_load_id(self) -> Optional[str]:
+        load_id_col = self.schema.naming.normalize_identifier(C_DLT_LOADS_TABLE_LOAD_ID)
+        query = sge.select(sge.Max(this=sge.column(load_id_col, quoted=True))).from_(
+            sge.table_(self.schema.loads_table_name, quoted=True)
+        )
+        try:
+            latest_load_id = self.query(query).fetchscalar()
+        except DestinationUndefinedEntity:
+            return None
+        return str(latest_load_id) if latest_load_id is not None else None
+
     # TODO why do we need `_opened_sql_client` and `_sql_client`? One seems used by
     # the `dlt.Dataset` context manager and the other by `dlt.Relation`
     @property
@@ -375,8 +416,9 @@ def dataset(
     destination: TDestinationReferenceArg,
     dataset_name: str,
     schema: Union[Schema, str, None] = None,
+    result_cache: Optional[RelationResultCache] = None,
 ) -> Dataset:
-    return Dataset(destination, dataset_name, schema)
+    return Dataset(destination, dataset_name, schema, result_cache=result_cache)
 
 
 def get_dataset_destination_client(dataset: dlt.Dataset) -> JobClientBase:
@@ -1,6 +1,16 @@
 from __future__ import annotations
 
-from typing import overload, Union, Any, Generator, Optional, Sequence, Type, TYPE_CHECKING
+from typing import (
+    overload,
+    Union,
+    Any,
+    Generator,
+    Literal,
+    Optional,
+    Sequence,
+    Type,
+    TYPE_CHECKING,
+)
 from textwrap import indent
 from contextlib import contextmanager
 from dlt.common.utils import simple_repr, without_none
@@ -106,11 +116,35 @@ class Relation(WithSqlClient):
         return _wrap
 
     def df(self, *args: Any, **kwargs: Any) -> Any:
+        if not args and not kwargs and self._dataset.result_cache is not None:
+            return self._cached_result("df")
         return self._wrap_func("df")(*args, **kwargs)
 
     def arrow(self, *args: Any, **kwargs: Any) -> Any:
+        if not args and not kwargs and self._dataset.result_cache is not None:
+            return self._cached_result("arrow")
         return self._wrap_func("arrow")(*args, **kwargs)
 
+    def _cached_result(self, result_format: Literal["arrow", "df"]) -> Any:
+        """Returns full result from the dataset result cache, executes the query on a miss.
+
+        Data frames are produced by the destination driver and stored with their pandas metadata
+        so `df()` returns the same column types on a hit and on a miss.
+        """
+        result_cache = self._dataset.result_cache
+        key = self._dataset._get_result_cache_key(self.to_sql(), result_format)
+        if key is not None and (table := result_cache.get(key)) is not None:
+            return table.to_pandas() if result_format == "df" else table
+        result = self._wrap_func(result_format)()
+        if key is not None and result is not None:
+            if result_format == "df":
+                from dlt.common.libs.pyarrow import pyarrow
+
+                result_cache.put(key, pyarrow.Table.from_pandas(result))
+            else:
+                result_cache.put(key, result)
+        return result
+
     def fetchall(self, *args: Any, **kwargs: Any) -> Any:
         return self._wrap_func("fetchall")(*args, **kwargs)
 
@@ -17,6 +17,7 @@ from typing import (
     Dict,
 )
 from fsspec import AbstractFileSystem
+from fsspec.asyn import AsyncFileSystem
 
 from dlt.common import logger, time, json, pendulum
 from dlt.common.destination.utils import resolve_merge_strategy, resolve_replace_strategy
@@ -36,6 +37,7 @@ from dlt.common.storages.exceptions import (
 from dlt.common.storages.fsspec_filesystem import glob_files
 from dlt.common.time import ensure_pendulum_datetime_utc
 from dlt.common.typing import DictStrAny
+from dlt.common.utils import chunks
 from dlt.common.schema import Schema, TSchemaTables
 from dlt.common.schema.utils import get_columns_names_with_prop
 from dlt.common.storages import FileStorage, fsspec_from_config
@@ -85,6 +87,8 @@ SUPPORTED_VERSIONS: set[int] = {1, CURRENT_VERSION}
 
 INIT_FILE_NAME = "init"
 FILENAME_SEPARATOR = "__"
+DELETE_BATCH_SIZE = 1000
+"""Max number of files removed with a single `rm` call, S3 deletes up to 1000 keys per request"""
 
 
 class FilesystemLoadJob(RunnableLoadJob):
@@ -495,18 +499,33 @@ class FilesystemClient(
         """Truncate a set of regular tables with given `table_names`"""
         table_dirs = set(self.get_table_dirs(table_names))
         table_prefixes = [self.get_table_prefix(t) for t in table_names]
+        truncated_dirs: List[str] = []
+        table_files: List[str] = []
         for table_dir in table_dirs:
             if self.fs_client.exists(table_dir):
-                for table_file in self.list_files_with_prefixes(table_dir, table_prefixes):
-                    # NOTE: deleting in chunks on s3 does not raise on access denied, file non existing and probably other errors
-                    # print(f"DEL {table_file}")
-                    try:
-                        self._delete_file(table_file)
-                    except FileNotFoundError:
-                        logger.info(
-                            f"Directory or path to truncate tables {table_names} does not exist but"
-                            " it should have been created previously!"
-                        )
+                truncated_dirs.append(table_dir)
+                table_files.extend(self.list_files_with_prefixes(table_dir, table_prefixes))
+        if not table_files:
+            return
+        if not isinstance(self.fs_client, AsyncFileSystem):
+            for table_file in table_files:
+                try:
+                    self._delete_file(table_file)
+                except FileNotFoundError:
+                    logger.info(
+                        f"Directory or path to truncate tables {table_names} does not exist but"
+                        " it should have been created previously!"
+                    )
+            return
+        # bucket filesystems (s3, gcs, az) remove many files with a single request
+        for batch in chunks(table_files, DELETE_BATCH_SIZE):
+            self.fs_client.rm(list(batch))
+        # NOTE: deleting in chunks on s3 does not raise on access denied, file non existing and
+        # probably other errors so we list the table dirs again to make sure that all files are gone
+        for table_dir in truncated_dirs:
+            self.fs_client.invalidate_cache(table_dir)
+            if remaining_files := self.list_files_with_prefixes(table_dir, table_prefixes):
+                raise FileExistsError(remaining_files[0])
 
     def _delete_file(self, file_path: str) -> None:
         try:
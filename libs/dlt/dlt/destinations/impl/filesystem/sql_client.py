@@ -1,14 +1,21 @@
-from typing import Any, TYPE_CHECKING, Tuple, List
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager, ExitStack
+from typing import Any, AnyStr, TYPE_CHECKING, Dict, Iterator, Optional, Set, Tuple, List
 from packaging.version import Version
 import duckdb
 
 from dlt.common import logger
+from dlt.common.destination.dataset import DBApiCursor
 from dlt.common.destination.exceptions import DestinationUndefinedEntity
 from dlt.common.destination.typing import PreparedTableSchema
 from dlt.common.schema.utils import is_nullable_column
 from dlt.common.storages.configuration import FileSystemCredentials
 
 from dlt.common.typing import TLoaderFileFormat
+from dlt.common.utils import digest128
+from dlt.destinations.exceptions import DatabaseException
 from dlt.destinations.sql_client import raise_database_error
 from dlt.destinations.impl.duckdb.sql_client import WithTableScanners
 from dlt.destinations.impl.duckdb.factory import DuckDbCredentials
@@ -18,6 +25,13 @@ from dlt.destinations.path_utils import get_file_format_and_compression
 
 SUPPORTED_PROTOCOLS = ["gs", "gcs", "s3", "file", "memory", "az", "abfss"]
 
+TABLE_FILES_CACHE_SIZE = 128
+"""Max number of tables for which file listings are kept in the process wide cache"""
+
+# table prefix url -> (loads fingerprint, table files), in least recently used order
+_TABLE_FILES_CACHE: "OrderedDict[str, Tuple[str, List[str]]]" = OrderedDict()
+_TABLE_FILES_CACHE_LOCK = threading.Lock()
+
 if TYPE_CHECKING:
     from dlt.destinations.impl.filesystem.filesystem import FilesystemClient
 else:
@@ -44,6 +58,12 @@ class FilesystemSqlClient(WithTableScanners):
         self.iceberg_initialized = False
         if self.is_abfss:
             self._global_config["azure_transport_option_type"] = "curl"
+        # views over table files and their table names
+        self._file_views: Dict[str, str] = {}
+        # views that must be re-created because their files were removed
+        self._stale_views: Set[str] = set()
+        # memoizes loads fingerprint while views are created
+        self._loads_fingerprint_memo: Dict[str, Optional[str]] = None
 
     def can_create_view(self, table_schema: PreparedTableSchema) -> bool:
         if table_schema.get("table_format") in ("delta", "iceberg"):
@@ -55,12 +75,107 @@ class FilesystemSqlClient(WithTableScanners):
         self, table_schema: PreparedTableSchema
     ) -> Tuple[str, List[str], bool]:
         table_name = table_schema["name"]
-        files = self.remote_client.list_table_files(table_name)
+        files = self._list_table_files(table_name)
         if len(files) == 0:
             raise DestinationUndefinedEntity(table_name)
         file_format, is_compressed = get_file_format_and_compression(files[0])
         return file_format, files, is_compressed
 
+    def get_loads_fingerprint(self) -> Optional[str]:
+        """Returns a digest of completed loads in the dataset or None if loads are not recorded (ie. when
+        used as staging). Files of data tables are added only by loads, so the digest changes when new
+        files are available. Files removed by in-flight or failed loads are detected when queried.
+        """
+        memo = self._loads_fingerprint_memo
+        if memo is not None and "fingerprint" in memo:
+            return memo["fingerprint"]
+        fingerprint: str = None
+        if not self.remote_client.config.as_staging_destination:
+            try:
+                load_files = self.remote_client.list_table_files(self.schema.loads_table_name)
+            except DestinationUndefinedEntity:
+                load_files = []
+            if load_files:
+                fingerprint = digest128("\n".join(sorted(map(os.path.basename, load_files))))
+        if memo is not None:
+            memo["fingerprint"] = fingerprint
+        return fingerprint
+
+    def create_views_for_tables(self, tables: Dict[str, str]) -> None:
+        # list completed loads at most once per call and only if needed
+        self._loads_fingerprint_memo = {}
+        try:
+            super().create_views_for_tables(tables)
+        finally:
+            self._loads_fingerprint_memo = None
+
+    @contextmanager
+    def execute_query(self, query: AnyStr, *args: Any, **kwargs: Any) -> Iterator[DBApiCursor]:
+        with ExitStack() as stack:
+            try:
+                cursor = stack.enter_context(super().execute_query(query, *args, **kwargs))
+            except DatabaseException as ex:
+                # a load replaced table files after views were created: list files again and retry
+                if not self._is_missing_file_error(ex) or not self._invalidate_file_views():
+                    raise
+                cursor = stack.enter_context(super().execute_query(query, *args, **kwargs))
+            yield cursor
+
+    @staticmethod
+    def _is_missing_file_error(ex: DatabaseException) -> bool:
+        # http errors of remote filesystems are also io errors
+        if not isinstance(ex.dbapi_exception, duckdb.IOException):
+            return False
+        message = str(ex.dbapi_exception)
+        return any(
+            pattern in message
+            for pattern in ("No such file or directory", "No files found", "404", "Not Found")
+        )
+
+    def _invalidate_file_views(self) -> bool:
+        """Drops cached file listings of all views over table files and marks the views to be
+        re-created. Returns False if there was nothing to invalidate.
+        """
+        stale_views = set(self._file_views) - self._stale_views
+        for view_name in stale_views:
+            self._invalidate_table_files(self._file_views[view_name])
+        self._stale_views.update(stale_views)
+        return len(stale_views) > 0
+
+    def _table_files_cache_key(self, table_name: str) -> str:
+        return self.remote_client.make_remote_url(self.remote_client.get_table_prefix(table_name))
+
+    def _invalidate_table_files(self, table_name: str) -> None:
+        with _TABLE_FILES_CACHE_LOCK:
+            _TABLE_FILES_CACHE.pop(self._table_files_cache_key(table_name), None)
+
+    def _list_table_files(self, table_name: str) -> List[str]:
+        """Lists files of `table_name`. Listings of data tables are cached in the process and reused
+        until a new load completes in the dataset. Views that always refresh list the files each time.
+        """
+        fingerprint = None
+        if (
+            not self.remote_client.is_dlt_table(table_name)
+            and not self.remote_client.config.always_refresh_views
+        ):
+            fingerprint = self.get_loads_fingerprint()
+        if fingerprint is None:
+            return self.remote_client.list_table_files(table_name)
+
+        cache_key = self._table_files_cache_key(table_name)
+        with _TABLE_FILES_CACHE_LOCK:
+            cached = _TABLE_FILES_CACHE.get(cache_key)
+            if cached is not None and cached[0] == fingerprint:
+                _TABLE_FILES_CACHE.move_to_end(cache_key)
+                return list(cached[1])
+        files = self.remote_client.list_table_files(table_name)
+        with _TABLE_FILES_CACHE_LOCK:
+            _TABLE_FILES_CACHE[cache_key] = (fingerprint, files)
+            _TABLE_FILES_CACHE.move_to_end(cache_key)
+            while len(_TABLE_FILES_CACHE) > TABLE_FILES_CACHE_SIZE:
+                _TABLE_FILES_CACHE.popitem(last=False)
+        return list(files)
+
     def create_secret(
         self,
         scope: str,
@@ -112,6 +227,8 @@ class FilesystemSqlClient(WithTableScanners):
         return self._conn
 
     def should_replace_view(self, view_name: str, table_schema: PreparedTableSchema) -> bool:
+        if view_name in self._stale_views:
+            return True
         if self.remote_client.config.always_refresh_views:
             table_format = table_schema.get("table_format")
             if table_format == "delta":
@@ -248,9 +365,12 @@ class FilesystemSqlClient(WithTableScanners):
                 # )
 
         # create table
-        view_name = self.make_qualified_table_name(view_name)
+        qualified_view_name = self.make_qualified_table_name(view_name)
         create_table_sql_base = (
-            f"CREATE OR REPLACE VIEW {view_name} AS SELECT {', '.join(columns)} FROM"
+            f"CREATE OR REPLACE VIEW {qualified_view_name} AS SELECT {', '.join(columns)} FROM"
             f" {from_statement}"
         )
         self._conn.execute(create_table_sql_base)
+        self._stale_views.discard(view_name)
+        if table_format not in ("delta", "iceberg") and table_name not in dlt_table_names:
+            self._file_views[view_name] = table_name
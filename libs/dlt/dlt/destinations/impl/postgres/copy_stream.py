@@ -0,0 +1,299 @@
+"""Encodes rows of jsonl job files into streams for postgres `COPY ... FROM STDIN`"""
+
+import base64
+import struct
+import threading
+from datetime import date, datetime, time, timezone  # noqa: I251
+from queue import Queue
+from typing import IO, Any, Callable, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from dlt.common.arithmetics import Decimal
+from dlt.common.json import json
+from dlt.common.time import ensure_pendulum_datetime_non_utc, ensure_pendulum_time
+from dlt.common.typing import DictStrAny
+
+TValueEncoder = Callable[[Any], bytes]
+
+PG_COPY_BINARY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack(">ii", 0, 0)
+PG_COPY_BINARY_TRAILER = struct.pack(">h", -1)
+_PG_NULL = struct.pack(">i", -1)
+_PG_EPOCH = datetime(2000, 1, 1, tzinfo=timezone.utc)
+_PG_EPOCH_NAIVE = datetime(2000, 1, 1)
+_PG_EPOCH_DATE = date(2000, 1, 1)
+_NUMERIC_POS = 0x0000
+_NUMERIC_NEG = 0x4000
+_NUMERIC_NAN = 0xC000
+# infinity is supported by postgres 14+
+_NUMERIC_PINF = 0xD000
+_NUMERIC_NINF = 0xF000
+
+
+def _parse_datetime(value: Any) -> datetime:
+    if isinstance(value, datetime):
+        return value
+    try:
+        # fromisoformat does not accept Z suffix before python 3.11
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return ensure_pendulum_datetime_non_utc(value)
+
+
+def _parse_time(value: Any) -> time:
+    if isinstance(value, time):
+        return value
+    try:
+        return time.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return ensure_pendulum_time(value)
+
+
+def _to_bytes(value: Any) -> bytes:
+    # binary values are base64 encoded in jsonl files
+    if isinstance(value, str):
+        return base64.b64decode(value)
+    return bytes(value)
+
+
+def _encode_text(value: Any) -> bytes:
+    if isinstance(value, (dict, list)):
+        return json.dumpb(value)
+    return str(value).encode("utf-8")
+
+
+def _encode_bool(value: Any) -> bytes:
+    return b"\x01" if value else b"\x00"
+
+
+def _encode_jsonb(value: Any) -> bytes:
+    # jsonb binary format is a version byte followed by json text
+    return b"\x01" + json.dumpb(value)
+
+
+def _encode_timestamp(value: Any) -> bytes:
+    dt = _parse_datetime(value)
+    if dt.tzinfo is None:
+        delta = dt - _PG_EPOCH_NAIVE
+    else:
+        delta = dt - _PG_EPOCH
+    return struct.pack(">q", (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds)
+
+
+def _encode_date(value: Any) -> bytes:
+    if isinstance(value, datetime):
+        value = value.date()
+    elif not isinstance(value, date):
+        value = date.fromisoformat(value[:10])
+    return struct.pack(">i", (value - _PG_EPOCH_DATE).days)
+
+
+def _encode_time(value: Any) -> bytes:
+    t = _parse_time(value)
+    return struct.pack(">q", ((t.hour * 60 + t.minute) * 60 + t.second) * 1000000 + t.microsecond)
+
+
+def _encode_numeric(value: Any) -> bytes:
+    """Encodes decimal as postgres numeric: base 10000 digits, weight of the first digit and scale"""
+    d = value if isinstance(value, Decimal) else Decimal(str(value))
+    if d.is_nan():
+        return struct.pack(">hhHh", 0, 0, _NUMERIC_NAN, 0)
+    if d.is_infinite():
+        return struct.pack(">hhHh", 0, 0, _NUMERIC_NINF if d.is_signed() else _NUMERIC_PINF, 0)
+    sign, digits, exponent = d.as_tuple()
+    int_digits = "".join(map(str, digits))
+    scale = max(0, -exponent)  # type: ignore[operator]
+    if exponent > 0:  # type: ignore[operator]
+        int_digits += "0" * exponent  # type: ignore[operator]
+    # make sure there's at least one integer digit ie. for 0.001
+    int_digits = int_digits.zfill(scale + 1)
+    frac_digits = int_digits[len(int_digits) - scale :] if scale else ""
+    int_digits = int_digits[: len(int_digits) - scale] if scale else int_digits
+    # align both parts to groups of 4 decimal digits around the decimal point
+    int_digits = int_digits.zfill((len(int_digits) + 3) // 4 * 4)
+    frac_digits = frac_digits.ljust((len(frac_digits) + 3) // 4 * 4, "0")
+    groups = [int(int_digits[i : i + 4]) for i in range(0, len(int_digits), 4)]
+    weight = len(groups) - 1
+    groups += [int(frac_digits[i : i + 4]) for i in range(0, len(frac_digits), 4)]
+    # strip leading and trailing zero groups
+    while groups and groups[0] == 0:
+        groups.pop(0)
+        weight -= 1
+    while groups and groups[-1] == 0:
+        groups.pop()
+    if not groups:
+        weight = 0
+    return struct.pack(
+        f">hhHh{len(groups)}h",
+        len(groups),
+        weight,
+        _NUMERIC_NEG if sign else _NUMERIC_POS,
+        scale,
+        *groups,
+    )
+
+
+# ordered by prefix of the destination type, longer prefixes first
+BINARY_ENCODERS: List[Tuple[str, TValueEncoder]] = [
+    ("smallint", lambda v: struct.pack(">h", int(v))),
+    ("integer", lambda v: struct.pack(">i", int(v))),
+    ("bigint", lambda v: struct.pack(">q", int(v))),
+    ("double precision", lambda v: struct.pack(">d", float(v))),
+    ("boolean", _encode_bool),
+    ("varchar", _encode_text),
+    ("character varying", _encode_text),
+    ("text", _encode_text),
+    ("jsonb", _encode_jsonb),
+    # json binary format is the same as text format
+    ("json", lambda v: json.dumpb(v)),
+    ("bytea", _to_bytes),
+    ("numeric", _encode_numeric),
+    ("timestamp", _encode_timestamp),
+    ("time", _encode_time),
+    ("date", _encode_date),
+]
+
+
+def get_binary_encoder(db_type: str) -> Optional[TValueEncoder]:
+    """Gets binary encoder for postgres type `db_type` generated by the type mapper or None"""
+    db_type = db_type.lower()
+    for prefix, encoder in BINARY_ENCODERS:
+        if db_type.startswith(prefix):
+            return encoder
+    return None
+
+
+def _escape_text_value(value: str) -> bytes:
+    return (
+        value.replace("\\", "\\\\")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+        .replace("\t", "\\t")
+        .encode("utf-8")
+    )
+
+
+def get_text_encoder(db_type: str) -> TValueEncoder:
+    """Gets encoder of values of postgres type `db_type` into COPY text format"""
+    db_type = db_type.lower()
+    if db_type.startswith("json"):
+        return lambda v: _escape_text_value(json.dumps(v))
+    if db_type.startswith("bytea"):
+        return lambda v: b"\\\\x" + _to_bytes(v).hex().encode("ascii")
+    if db_type.startswith("boolean"):
+        return lambda v: b"t" if v else b"f"
+    return lambda v: _escape_text_value(json.dumps(v) if isinstance(v, (dict, list)) else str(v))
+
+
+class CopyStreamEncoder:
+    """Encodes rows into postgres COPY stream. Uses binary format if all column types have
+    binary encoders, otherwise falls back to text format.
+    """
+
+    def __init__(self, columns: Sequence[str], db_types: Sequence[str]) -> None:
+        self.columns = list(columns)
+        binary_encoders = [get_binary_encoder(db_type) for db_type in db_types]
+        self.is_binary = all(binary_encoders)
+        self._encoders: List[TValueEncoder] = (
+            binary_encoders  # type: ignore[assignment]
+            if self.is_binary
+            else [get_text_encoder(db_type) for db_type in db_types]
+        )
+        self._columns_count = struct.pack(">h", len(self.columns))
+
+    @property
+    def copy_format(self) -> str:
+        return "binary" if self.is_binary else "text"
+
+    def encode_rows(self, rows: Iterable[DictStrAny]) -> bytes:
+        """Encodes `rows` into COPY tuples. Missing columns are encoded as NULL"""
+        parts: List[bytes] = []
+        columns = list(zip(self.columns, self._encoders))
+        if self.is_binary:
+            for row in rows:
+                parts.append(self._columns_count)
+                for column, encoder in columns:
+                    value = row.get(column)
+                    if value is None:
+                        parts.append(_PG_NULL)
+                    else:
+                        data = encoder(value)
+                        parts.append(struct.pack(">i", len(data)))
+                        parts.append(data)
+        else:
+            for row in rows:
+                parts.append(
+                    b"\t".join(
+                        b"\\N" if (value := row.get(column)) is None else encoder(value)
+                        for column, encoder in columns
+                    )
+                )
+                parts.append(b"\n")
+        return b"".join(parts)
+
+    def iter_chunks(self, f: IO[bytes], rows_per_chunk: int = 5000) -> Iterator[bytes]:
+        """Reads jsonl rows from `f` and yields COPY stream in chunks of `rows_per_chunk` rows"""
+        if self.is_binary:
+            yield PG_COPY_BINARY_HEADER
+        rows: List[DictStrAny] = []
+        for line in f:
+            if not line.strip():
+                continue
+            rows.append(json.loadb(line))
+            if len(rows) >= rows_per_chunk:
+                yield self.encode_rows(rows)
+                rows = []
+        if rows:
+            yield self.encode_rows(rows)
+        if self.is_binary:
+            yield PG_COPY_BINARY_TRAILER
+
+
+class PipelinedChunksReader:
+    """File-like reader of chunks produced in a background thread, to be passed to `copy_expert`.
+
+    Chunks are encoded while previous chunks are sent to the server. At most `max_pending_chunks`
+    are kept in memory. Exception raised by the producer is re-raised in `read`.
+    """
+
+    def __init__(self, chunks: Iterator[bytes], max_pending_chunks: int = 4) -> None:
+        self._queue: "Queue[Union[bytes, BaseException, None]]" = Queue(maxsize=max_pending_chunks)
+        self._buffer = memoryview(b"")
+        self._eof = False
+        self._closed = False
+        self._producer = threading.Thread(
+            target=self._produce, args=(chunks,), daemon=True, name="dlt_pg_copy_producer"
+        )
+        self._producer.start()
+
+    def read(self, size: int = -1) -> bytes:
+        while not self._buffer and not self._eof:
+            item = self._queue.get()
+            if item is None:
+                self._eof = True
+            elif isinstance(item, BaseException):
+                self._eof = True
+                raise item
+            else:
+                self._buffer = memoryview(item)
+        if size < 0 or size >= len(self._buffer):
+            data, self._buffer = self._buffer, memoryview(b"")
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data.tobytes()
+
+    def close(self) -> None:
+        """Stops the producer and drops pending chunks"""
+        self._closed = True
+        while self._producer.is_alive():
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._producer.join(timeout=0.1)
+
+    def _produce(self, chunks: Iterator[bytes]) -> None:
+        try:
+            for chunk in chunks:
+                if self._closed:
+                    return
+                self._queue.put(chunk)
+            self._queue.put(None)
+        except BaseException as ex:
+            self._queue.put(ex)
@@ -160,7 +160,13 @@ class postgres(Destination[PostgresClientConfiguration, "PostgresClient"]):
         # https://www.postgresql.org/docs/current/limits.html
         caps = DestinationCapabilitiesContext()
         caps.preferred_loader_file_format = "insert_values"
-        caps.supported_loader_file_formats = ["insert_values", "csv", "parquet", "model"]
+        caps.supported_loader_file_formats = [
+            "insert_values",
+            "csv",
+            "parquet",
+            "jsonl",
+            "model",
+        ]
         caps.loader_file_format_selector = postgres_loader_file_format_selector
         caps.preferred_staging_file_format = None
         caps.supported_staging_file_formats = []
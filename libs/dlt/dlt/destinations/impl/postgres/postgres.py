@@ -19,12 +19,14 @@ from dlt.common.schema.utils import is_nullable_column
 from dlt.common.storages.file_storage import FileStorage
 from dlt.common.storages.load_storage import ParsedLoadJobFileName
 from dlt.destinations.impl.postgres.configuration import PostgresClientConfiguration
+from dlt.destinations.impl.postgres.copy_stream import CopyStreamEncoder, PipelinedChunksReader
 from dlt.destinations.impl.postgres.sql_client import Psycopg2SqlClient
 from dlt.destinations.insert_job_client import InsertValuesJobClient
 from dlt.destinations.sql_client import SqlClientBase
 from dlt.destinations.sql_jobs import SqlStagingReplaceFollowupJob
 
 HINT_TO_POSTGRES_ATTR: Dict[TColumnHint, str] = {"unique": "UNIQUE"}
+COPY_BUFFER_SIZE = 256 * 1024
 
 
 class PostgresStagingReplaceJob(SqlStagingReplaceFollowupJob):
@@ -167,6 +169,42 @@ class PostgresCsvCopyJob(RunnableLoadJob, HasFollowupJobs):
                     cursor.copy_expert(copy_sql, f, size=8192)
 
 
+class PostgresJsonlCopyJob(RunnableLoadJob, HasFollowupJobs):
+    """Loads jsonl files with COPY in binary format, encoding rows with types of destination columns.
+    Falls back to COPY text format if any of the columns has a type without binary encoder.
+    """
+
+    def __init__(self, file_path: str) -> None:
+        super().__init__(file_path)
+        self._job_client: PostgresClient = None
+
+    def run(self) -> None:
+        sql_client = self._job_client.sql_client
+        type_mapper = self._job_client.type_mapper
+        columns = [
+            col for col in self._load_table["columns"].values() if col.get("data_type") is not None
+        ]
+        encoder = CopyStreamEncoder(
+            [col["name"] for col in columns],
+            [type_mapper.to_destination_type(col, self._load_table) for col in columns],
+        )
+        headers = ",".join(sql_client.escape_column_name(col["name"]) for col in columns)
+        qualified_table_name = sql_client.make_qualified_table_name(self.load_table_name)
+        copy_sql = (
+            f"COPY {qualified_table_name} ({headers}) FROM STDIN WITH (FORMAT"
+            f" {encoder.copy_format})"
+        )
+        with FileStorage.open_zipsafe_ro(self._file_path, "rb") as f:
+            # encode next chunks in a thread while the current one is sent to the server
+            reader = PipelinedChunksReader(encoder.iter_chunks(f))
+            try:
+                with sql_client.begin_transaction():
+                    with sql_client.native_connection.cursor() as cursor:
+                        cursor.copy_expert(copy_sql, reader, size=COPY_BUFFER_SIZE)
+            finally:
+                reader.close()
+
+
 class PostgresClient(InsertValuesJobClient):
     def __init__(
         self,
@@ -199,6 +237,8 @@ class PostgresClient(InsertValuesJobClient):
                 job = PostgresCsvCopyJob(file_path)
             elif parsed_file.file_format == "parquet":
                 job = PostgresParquetCopyJob(file_path)
+            elif parsed_file.file_format == "jsonl":
+                job = PostgresJsonlCopyJob(file_path)
         return job
 
     def _create_replace_followup_jobs(
@@ -1,18 +1,31 @@
 import asyncio
+import heapq
+import multiprocessing
+import time
+from collections import deque
 from concurrent.futures import (
+    ProcessPoolExecutor,
     ThreadPoolExecutor,
-    as_completed,
+    TimeoutError as FutureTimeoutError,
     wait as wait_for_futures,
 )
 import contextvars
-from threading import Thread
-from typing import Awaitable, Dict, Optional
+from functools import partial
+from threading import Condition, Thread
+from typing import Awaitable, Callable, Deque, Dict, List, NamedTuple, Optional, Tuple
 
 from dlt.common.exceptions import PipelineException
 from dlt.common.configuration.container import Container
-from dlt.common.runners.pool_runner import TimeoutThreadPoolExecutor
+from dlt.common.runners.pool_runner import TimeoutThreadPoolExecutor, get_default_start_method
 from dlt.common.runtime.signals import sleep
-from dlt.extract.items import DataItemWithMeta, TItemFuture, ResolvablePipeItem, FuturePipeItem
+from dlt.extract.items import (
+    DataItemWithMeta,
+    ProcessItems,
+    TItemFuture,
+    ResolvablePipeItem,
+    FuturePipeItem,
+)
+from dlt.extract.utils import ProcessCallable
 
 from dlt.extract.exceptions import (
     DltSourceException,
@@ -22,23 +35,67 @@ from dlt.extract.exceptions import (
 )
 
 
+class FuturesPoolMetrics(NamedTuple):
+    submitted_count: int
+    """Number of items submitted to the pool"""
+    in_flight: int
+    """Number of items being currently executed"""
+    done_pending: int
+    """Number of done items waiting to be consumed"""
+    max_in_flight: int
+    max_done_pending: int
+    slot_waits_count: int
+    """Number of times submit waited for a free slot"""
+    slot_wait_time: float
+    """Total time in seconds spent waiting for free slots"""
+
+
 class FuturesPool:
     """Worker pool for pipe items that can be resolved asynchronously.
 
     Items can be either asyncio coroutines or regular callables which will be executed in a thread pool.
+    `ProcessCallable` items are executed in a process pool.
+    Done futures are queued by their done callbacks so waiting for the next result or a free slot
+    does not poll the pool.
+
+    Items may be also submitted with `submit_async` from a coroutine. In that case coroutines run as
+    tasks of the running event loop and callables in the thread pool via `run_in_executor` so no
+    background event loop is started.
     """
 
     def __init__(
-        self, workers: int = 5, poll_interval: float = 0.01, max_parallel_items: int = 20
+        self,
+        workers: int = 5,
+        poll_interval: float = 0.01,
+        max_parallel_items: int = 20,
+        max_parallel_items_per_pipe: Optional[int] = None,
+        preserve_items_order: bool = False,
     ) -> None:
         self.futures: Dict[TItemFuture, FuturePipeItem] = {}
         self._thread_pool: ThreadPoolExecutor = None
+        self._process_pool: ProcessPoolExecutor = None
         self._async_pool: asyncio.AbstractEventLoop = None
         self._async_pool_thread: Thread = None
         self.workers = workers
         self.poll_interval = poll_interval
         self.max_parallel_items = max_parallel_items
+        self.max_parallel_items_per_pipe = max_parallel_items_per_pipe
+        self.preserve_items_order = preserve_items_order
         self.used_slots: int = 0
+        self.pipe_used_slots: Dict[str, int] = {}
+        # done futures ordered by submission, guarded by the condition
+        self._done_futures: List[Tuple[int, TItemFuture]] = []
+        self._done_condition = Condition()
+        # submitted and not yet consumed sequence numbers and done futures held back, per pipe
+        self._pipe_pending_seqs: Dict[str, Deque[int]] = {}
+        self._pipe_held_futures: Dict[str, List[Tuple[int, TItemFuture]]] = {}
+        # set on each done future when items are submitted from the running event loop
+        self._done_event: asyncio.Event = None
+        self._submitted_count = 0
+        self._max_in_flight = 0
+        self._max_done_pending = 0
+        self._slot_waits_count = 0
+        self._slot_wait_time = 0.0
 
     def __len__(self) -> int:
         return len(self.futures)
@@ -52,6 +109,28 @@ class FuturesPool:
     def empty(self) -> bool:
         return len(self.futures) == 0
 
+    @property
+    def metrics(self) -> FuturesPoolMetrics:
+        """Current queue depths and slot waits of the pool"""
+        with self._done_condition:
+            return FuturesPoolMetrics(
+                self._submitted_count,
+                self.used_slots,
+                len(self._done_futures),
+                self._max_in_flight,
+                self._max_done_pending,
+                self._slot_waits_count,
+                self._slot_wait_time,
+            )
+
+    def has_free_slot(self, pipe_name: str) -> bool:
+        """Checks if item of pipe `pipe_name` can be submitted without waiting"""
+        if self.free_slots <= 0:
+            return False
+        if self.max_parallel_items_per_pipe is None:
+            return True
+        return self.pipe_used_slots.get(pipe_name, 0) < self.max_parallel_items_per_pipe
+
     def _ensure_thread_pool(self) -> ThreadPoolExecutor:
         # lazily start or return thread pool
         if self._thread_pool:
@@ -64,6 +143,17 @@ class FuturesPool:
         )
         return self._thread_pool
 
+    def _ensure_process_pool(self) -> ProcessPoolExecutor:
+        # lazily start or return process pool
+        if self._process_pool:
+            return self._process_pool
+
+        start_method = get_default_start_method(multiprocessing.get_context().get_start_method())
+        self._process_pool = ProcessPoolExecutor(
+            self.workers, mp_context=multiprocessing.get_context(start_method)
+        )
+        return self._process_pool
+
     def _ensure_async_pool(self) -> asyncio.AbstractEventLoop:
         # lazily create async pool is separate thread
         if self._async_pool:
@@ -85,9 +175,47 @@ class FuturesPool:
         # start or return async pool
         return self._async_pool
 
-    def _vacate_slot(self, _: TItemFuture) -> None:
-        # Used as callback to free up slot when future is done
-        self.used_slots -= 1
+    def _on_future_done(self, seq: int, pipe_name: str, future: TItemFuture) -> None:
+        # Used as callback to free up slot and queue the future when it is done
+        with self._done_condition:
+            self.used_slots -= 1
+            self.pipe_used_slots[pipe_name] -= 1
+            heapq.heappush(self._done_futures, (seq, future))
+            self._max_done_pending = max(self._max_done_pending, len(self._done_futures))
+            self._done_condition.notify_all()
+        if self._done_event is not None:
+            # loop futures invoke callbacks in the loop thread
+            self._done_event.set()
+
+    def _take_slot(self, pipe_name: str) -> int:
+        # take the slot before the item starts, done callback may run right away
+        with self._done_condition:
+            self.used_slots += 1
+            self.pipe_used_slots[pipe_name] = self.pipe_used_slots.get(pipe_name, 0) + 1
+            self._max_in_flight = max(self._max_in_flight, self.used_slots)
+            seq = self._submitted_count
+            self._submitted_count += 1
+            if self.preserve_items_order:
+                self._pipe_pending_seqs.setdefault(pipe_name, deque()).append(seq)
+        return seq
+
+    def _release_slot(self, pipe_name: str) -> None:
+        with self._done_condition:
+            self.used_slots -= 1
+            self.pipe_used_slots[pipe_name] -= 1
+            if self.preserve_items_order:
+                self._pipe_pending_seqs[pipe_name].pop()
+
+    def _add_future(
+        self, future: TItemFuture, pipe_item: ResolvablePipeItem, seq: int
+    ) -> TItemFuture:
+        self.futures[future] = FuturePipeItem(
+            future, pipe_item.step, pipe_item.pipe, pipe_item.meta
+        )
+        # Future is not removed from self.futures until it's been consumed by the
+        # pipe iterator. But we always want to vacate a slot so new jobs can be submitted
+        future.add_done_callback(partial(self._on_future_done, seq, pipe_item.pipe.name))
+        return future
 
     def submit(self, pipe_item: ResolvablePipeItem) -> TItemFuture:
         """Submit an item to the pool.
@@ -102,11 +230,15 @@ class FuturesPool:
         # Sanity check, negative free slots means there's a bug somewhere
         assert self.free_slots >= 0, "Worker pool has negative free slots, this should never happen"
 
-        if self.free_slots == 0:
-            # Wait until some future is completed to ensure there's a free slot
-            # Note: This is probably not thread safe. If ever multiple threads will be submitting
-            # jobs to the pool, we ned to change this whole method to be inside a `threading.Lock`
-            self._wait_for_free_slot()
+        pipe_name = pipe_item.pipe.name
+        if not self.has_free_slot(pipe_name):
+            # Pipe iterator holds source items until there's a free slot, this happens ie. when
+            # a transform step returns a callable. Wait until some future is completed
+            # Note: If ever multiple threads will be submitting jobs to the pool, checking and
+            # taking a slot below must happen under a single lock
+            self._wait_for_free_slot(pipe_name)
+
+        seq = self._take_slot(pipe_name)
 
         future: Optional[TItemFuture] = None
 
@@ -114,22 +246,72 @@ class FuturesPool:
         item = pipe_item.item
         if isinstance(item, Awaitable):
             future = asyncio.run_coroutine_threadsafe(item, self._ensure_async_pool())
+        elif isinstance(item, ProcessCallable):
+            future = self._ensure_process_pool().submit(item)
         elif callable(item):
             # pass pipe context to thread pool, happens automatically for coroutines
             ctx = contextvars.copy_context()
             future = self._ensure_thread_pool().submit(ctx.run, item)
         else:
+            self._release_slot(pipe_name)
             raise ValueError(f"Unsupported item type: `{type(item)}`")
 
-        # Future is not removed from self.futures until it's been consumed by the
-        # pipe iterator. But we always want to vacate a slot so new jobs can be submitted
-        future.add_done_callback(self._vacate_slot)
-        self.used_slots += 1
+        return self._add_future(future, pipe_item, seq)
 
-        self.futures[future] = FuturePipeItem(
-            future, pipe_item.step, pipe_item.pipe, pipe_item.meta
-        )
-        return future
+    async def submit_async(self, pipe_item: ResolvablePipeItem) -> TItemFuture:
+        """Submit an item to the pool from a coroutine running in the event loop.
+
+        Awaitables become tasks of the running loop and callables are run in the thread pool. Waits
+        for a free slot without blocking the loop.
+
+        Args:
+            pipe_item: The pipe item to submit. `pipe_item.item` must be either an asyncio coroutine or a callable.
+
+        Returns:
+            The resulting asyncio future
+        """
+        assert self.free_slots >= 0, "Worker pool has negative free slots, this should never happen"
+
+        loop = asyncio.get_running_loop()
+        if self._done_event is None:
+            self._done_event = asyncio.Event()
+
+        pipe_name = pipe_item.pipe.name
+        if not self.has_free_slot(pipe_name):
+            started_at = time.perf_counter()
+            await self._wait_done_event(lambda: self.has_free_slot(pipe_name))
+            with self._done_condition:
+                self._slot_waits_count += 1
+                self._slot_wait_time += time.perf_counter() - started_at
+
+        seq = self._take_slot(pipe_name)
+
+        future: Optional[TItemFuture] = None
+        item = pipe_item.item
+        if isinstance(item, Awaitable):
+            # task copies current context so pipe context is preserved
+            future = asyncio.ensure_future(item, loop=loop)  # type: ignore[assignment]
+        elif isinstance(item, ProcessCallable):
+            future = loop.run_in_executor(self._ensure_process_pool(), item)  # type: ignore[assignment]
+        elif callable(item):
+            ctx = contextvars.copy_context()
+            future = loop.run_in_executor(self._ensure_thread_pool(), ctx.run, item)  # type: ignore[assignment]
+        else:
+            self._release_slot(pipe_name)
+            raise ValueError(f"Unsupported item type: `{type(item)}`")
+
+        return self._add_future(future, pipe_item, seq)
+
+    async def _wait_done_event(self, predicate: Callable[[], bool], timeout: float = None) -> bool:
+        """Waits in the event loop until `predicate` is true, re-checked on each done future"""
+        while not predicate():
+            # callbacks run in this thread so nothing gets done between the check and clear
+            self._done_event.clear()
+            try:
+                await asyncio.wait_for(self._done_event.wait(), timeout)
+            except asyncio.TimeoutError:
+                return predicate()
+        return True
 
     def sleep(self) -> None:
         sleep(self.poll_interval)
@@ -151,6 +333,9 @@ class FuturesPool:
 
         if item is None:
             return None
+        elif isinstance(item, ProcessItems):
+            # items yielded in a worker process are evaluated as a new source
+            return ResolvablePipeItem(iter(item), step, pipe, meta)
         elif isinstance(item, DataItemWithMeta):
             return ResolvablePipeItem(item.data, step, pipe, item.meta)
         else:
@@ -158,7 +343,53 @@ class FuturesPool:
 
     def _next_done_future(self) -> Optional[TItemFuture]:
         """Get the done future in the pool (if any). This does not block."""
-        return next((fut for fut in self.futures if fut.done() and not fut.cancelled()), None)
+        with self._done_condition:
+            while self._done_futures:
+                # futures done at the same time are returned in submission order
+                seq, future = heapq.heappop(self._done_futures)
+                if future not in self.futures:
+                    continue
+                if future.cancelled():
+                    # cancelled future is never consumed, do not hold back items after it
+                    pipe_name = self.futures.pop(future).pipe.name
+                    if self.preserve_items_order:
+                        self._discard_pending_seq(pipe_name, seq)
+                    continue
+                if self.preserve_items_order and not self._release_in_order(seq, future):
+                    continue
+                return future
+        return None
+
+    def _release_in_order(self, seq: int, future: TItemFuture) -> bool:
+        """Holds back `future` if an earlier item of the same pipe is still pending.
+
+        When `future` is released, the held back future that is next in order is queued again.
+        Must be called under the done condition.
+        """
+        pipe_name = self.futures[future].pipe.name
+        pending = self._pipe_pending_seqs[pipe_name]
+        held = self._pipe_held_futures.setdefault(pipe_name, [])
+        if pending[0] != seq:
+            heapq.heappush(held, (seq, future))
+            return False
+        pending.popleft()
+        self._requeue_held_future(pipe_name)
+        return True
+
+    def _discard_pending_seq(self, pipe_name: str, seq: int) -> None:
+        """Removes `seq` of a future that will not be consumed. Must be called under the done condition."""
+        pending = self._pipe_pending_seqs.get(pipe_name)
+        if pending is None or seq not in pending:
+            return
+        pending.remove(seq)
+        self._requeue_held_future(pipe_name)
+
+    def _requeue_held_future(self, pipe_name: str) -> None:
+        # queue the held back future again if it is next in order
+        pending = self._pipe_pending_seqs[pipe_name]
+        held = self._pipe_held_futures.get(pipe_name)
+        if held and pending and held[0][0] == pending[0]:
+            heapq.heappush(self._done_futures, heapq.heappop(held))
 
     def resolve_next_future(
         self, use_configured_timeout: bool = False
@@ -175,18 +406,15 @@ class FuturesPool:
         if not self.futures:
             return None
 
-        if (future := self._next_done_future()) is not None:
-            # When there are multiple already done futures from the same pipe we return results in insertion order
-            return self._resolve_future(future)
-        for future in as_completed(
-            self.futures, timeout=self.poll_interval if use_configured_timeout else None
-        ):
-            if future.cancelled():
-                # Get the next not-cancelled future
-                continue
+        with self._done_condition:
+            if not self._done_condition.wait_for(
+                lambda: len(self._done_futures) > 0,
+                timeout=self.poll_interval if use_configured_timeout else None,
+            ):
+                raise FutureTimeoutError()
 
+        if (future := self._next_done_future()) is not None:
             return self._resolve_future(future)
-
         return None
 
     def resolve_next_future_no_wait(self) -> Optional[ResolvablePipeItem]:
@@ -200,19 +428,29 @@ class FuturesPool:
 
         return self._resolve_future(future)
 
-    def _wait_for_free_slot(self) -> None:
-        """Wait until any future in the pool is completed to ensure there's a free slot."""
-        if self.free_slots >= 1:
-            return
+    async def resolve_next_future_async(self) -> Optional[ResolvablePipeItem]:
+        """Awaits the next done future for at most `self.poll_interval` and returns the result.
 
-        for future in as_completed(self.futures):
-            if future.cancelled():
-                # Get the next not-cancelled future
-                continue
-            if self.free_slots == 0:
-                # Future was already completed so slot was not freed
-                continue
-            return  # Return when first future completes
+        Returns None if no future is done within that time or the pool is empty. Requires the
+        futures to be submitted with `submit_async`.
+        """
+        if not self.futures:
+            return None
+        if not await self._wait_done_event(
+            lambda: len(self._done_futures) > 0, timeout=self.poll_interval
+        ):
+            return None
+        if (future := self._next_done_future()) is not None:
+            return self._resolve_future(future)
+        return None
+
+    def _wait_for_free_slot(self, pipe_name: str) -> None:
+        """Wait until futures in the pool complete so there's a free slot for `pipe_name`."""
+        started_at = time.perf_counter()
+        with self._done_condition:
+            self._done_condition.wait_for(lambda: self.has_free_slot(pipe_name))
+            self._slot_waits_count += 1
+            self._slot_wait_time += time.perf_counter() - started_at
 
     def close(self) -> None:
         # Cancel all futures
@@ -240,4 +478,13 @@ class FuturesPool:
             self._thread_pool.shutdown(wait=True)
             self._thread_pool = None
 
+        if self._process_pool:
+            self._process_pool.shutdown(wait=True, cancel_futures=True)
+            self._process_pool = None
+
         self.futures.clear()
+        with self._done_condition:
+            self._done_futures.clear()
+            self._pipe_pending_seqs.clear()
+            self._pipe_held_futures.clear()
+        self._done_event = None
@@ -72,7 +72,7 @@ from dlt.extract.exceptions import (
     SourceNotAFunction,
     CurrentSourceSchemaNotAvailable,
 )
-from dlt.extract.items import TTableHintTemplate
+from dlt.extract.items import TParallelizedMode, TTableHintTemplate
 from dlt.extract.source import (
     DltSource,
     SourceSchemaInjectableContext,
@@ -456,7 +456,7 @@ def resource(
     nested_hints: Optional[TTableHintTemplate[Dict[TTableNames, TResourceNestedHints]]] = None,
     selected: bool = True,
     spec: Type[BaseConfiguration] = None,
-    parallelized: bool = False,
+    parallelized: TParallelizedMode = False,
     incremental: Optional[TIncrementalConfig] = None,
     _impl_cls: Type[TDltResourceImpl] = DltResource,  # type: ignore[assignment]
     section: Optional[TTableHintTemplate[str]] = None,
@@ -483,7 +483,7 @@ def resource(
     nested_hints: Optional[TTableHintTemplate[Dict[TTableNames, TResourceNestedHints]]] = None,
     selected: bool = True,
     spec: Type[BaseConfiguration] = None,
-    parallelized: bool = False,
+    parallelized: TParallelizedMode = False,
     incremental: Optional[TIncrementalConfig] = None,
     _impl_cls: Type[TDltResourceImpl] = DltResource,  # type: ignore[assignment]
     section: Optional[TTableHintTemplate[str]] = None,
@@ -512,7 +512,7 @@ def resource(
     nested_hints: Optional[TTableHintTemplate[Dict[TTableNames, TResourceNestedHints]]] = None,
     selected: bool = True,
     spec: Type[BaseConfiguration] = None,
-    parallelized: bool = False,
+    parallelized: TParallelizedMode = False,
     incremental: Optional[TIncrementalConfig] = None,
     _impl_cls: Type[TDltResourceImpl] = DltResource,  # type: ignore[assignment]
     section: Optional[str] = None,
@@ -538,7 +538,7 @@ def resource(
     nested_hints: Optional[TTableHintTemplate[Dict[TTableNames, TResourceNestedHints]]] = None,
     selected: bool = True,
     spec: Type[BaseConfiguration] = None,
-    parallelized: bool = False,
+    parallelized: TParallelizedMode = False,
     incremental: Optional[TIncrementalConfig] = None,
     _impl_cls: Type[TDltResourceImpl] = DltResource,  # type: ignore[assignment]
     section: Optional[TTableHintTemplate[str]] = None,
@@ -612,8 +612,9 @@ def resource(
 
         spec (Type[BaseConfiguration], optional): A specification of configuration and secret values required by the source.
 
-        parallelized (bool, optional): If `True`, the resource generator will be extracted in parallel with other resources.
-            Transformers that return items are also parallelized. Defaults to `False`.
+        parallelized (TParallelizedMode, optional): If `True`, the resource generator will be extracted in parallel with other resources.
+            Transformers that return items are also parallelized. If `process`, each transformer call is evaluated in a
+            process pool, data items must be picklable. Defaults to `False`.
 
         incremental (Optional[TIncrementalConfig], optional): An incremental configuration for the resource.
 
@@ -670,7 +671,7 @@ def resource(
         if max_table_nesting is not None:
             resource.max_table_nesting = max_table_nesting
         if parallelized:
-            return resource.parallelize()
+            return resource.parallelize("process" if parallelized == "process" else "thread")
         return resource
 
     def decorator(
@@ -790,7 +791,7 @@ def transformer(
     nested_hints: Optional[TTableHintTemplate[Dict[TTableNames, TResourceNestedHints]]] = None,
     selected: bool = True,
     spec: Type[BaseConfiguration] = None,
-    parallelized: bool = False,
+    parallelized: TParallelizedMode = False,
     section: Optional[TTableHintTemplate[str]] = None,
     standalone: bool = None,
 ) -> Callable[
@@ -818,7 +819,7 @@ def transformer(
     nested_hints: Optional[TTableHintTemplate[Dict[TTableNames, TResourceNestedHints]]] = None,
     selected: bool = True,
     spec: Type[BaseConfiguration] = None,
-    parallelized: bool = False,
+    parallelized: TParallelizedMode = False,
     section: Optional[TTableHintTemplate[str]] = None,
     standalone: bool = None,
 ) -> ResourceFactory[TResourceFunParams, DltResource]: ...
@@ -842,7 +843,7 @@ def transformer(
     nested_hints: Optional[TTableHintTemplate[Dict[TTableNames, TResourceNestedHints]]] = None,
     selected: bool = True,
     spec: Type[BaseConfiguration] = None,
-    parallelized: bool = False,
+    parallelized: TParallelizedMode = False,
     section: Optional[TTableHintTemplate[str]] = None,
     standalone: bool = None,
     _impl_cls: Type[TDltResourceImpl] = DltResource,  # type: ignore[assignment]
@@ -915,7 +916,8 @@ def transformer(
 
         spec (Type[BaseConfiguration], optional): A specification of configuration and secret values required by the source.
 
-        parallelized (bool, optional): When `True` the resource will be loaded in parallel.
+        parallelized (TParallelizedMode, optional): When `True` the resource will be loaded in parallel. When `process`,
+            each call is evaluated in a process pool, data items must be picklable.
 
         section (Optional[TTableHintTemplate[str]], optional): Configuration section that comes right after 'sources` in default layout. If not present, the current python module name will be used.
             Default layout is `sources.<section>.<name>.<key_name>`. Note that resource section is used only when a single resource is passed to the pipeline.
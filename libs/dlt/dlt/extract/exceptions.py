@@ -154,6 +154,30 @@ class InvalidParallelResourceDataType(InvalidResourceDataType):
         )
 
 
+class InvalidProcessParallelResource(InvalidResourceDataType):
+    def __init__(self, resource_name: str, item: Any, _typ: Type[Any]) -> None:
+        super().__init__(
+            resource_name,
+            item,
+            _typ,
+            "Only transformers defined with regular or generator functions can be evaluated in a"
+            f" process pool. Resource `{resource_name}` received data type `{_typ.__name__}`",
+        )
+
+
+class ProcessParallelFunctionNotImportable(DltResourceException):
+    def __init__(self, resource_name: str, f_module: str, f_qualname: str, reason: str) -> None:
+        self.f_module = f_module
+        self.f_qualname = f_qualname
+        super().__init__(
+            resource_name,
+            f"Resource `{resource_name}` cannot be evaluated in a process pool: function"
+            f" `{f_qualname}` from module `{f_module}` {reason}. Worker processes import the"
+            " transformer function by its name so it must be defined at the module level and"
+            " its name must not be reused.",
+        )
+
+
 class InvalidResourceDataTypeBasic(InvalidResourceDataType):
     def __init__(self, resource_name: str, item: Any, _typ: Type[Any]) -> None:
         super().__init__(
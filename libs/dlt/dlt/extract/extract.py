@@ -1,8 +1,9 @@
+import asyncio
 import contextlib
 from collections.abc import Sequence as C_Sequence
 from copy import copy
 import itertools
-from typing import Iterator, List, Dict, Any, Optional
+from typing import Callable, Iterator, List, Dict, Any, Optional
 import yaml
 
 from dlt.common import logger
@@ -50,6 +51,7 @@ from dlt.extract.exceptions import UnknownSourceReference
 from dlt.extract.incremental import IncrementalResourceWrapper
 from dlt.extract.items_transform import ItemTransform
 from dlt.common.metrics import DataWriterAndCustomMetrics
+from dlt.extract.items import PipeItem
 from dlt.extract.pipe_iterator import PipeIterator
 from dlt.extract.source import DltSource
 from dlt.extract.reference import SourceReference
@@ -57,7 +59,11 @@ from dlt.extract.resource import DltResource
 from dlt.extract.storage import ExtractStorage
 from dlt.extract.extractors import ObjectExtractor, ArrowExtractor, Extractor, ModelExtractor
 from dlt.extract.state import reset_resource_state
-from dlt.extract.utils import get_data_item_format, make_schema_with_default_name
+from dlt.extract.utils import (
+    get_data_item_format,
+    is_event_loop_running,
+    make_schema_with_default_name,
+)
 
 
 def select_schema(pipeline: SupportsPipeline) -> Schema:
@@ -394,7 +400,9 @@ class Extract(WithStepInfo[ExtractMetrics, ExtractInfo]):
                 ) as pipes:
                     left_gens = total_gens = len(pipes._sources)
                     collector.update("Resources", 0, total_gens)
-                    for pipe_item in pipes:
+
+                    def _write_pipe_item(pipe_item: PipeItem) -> None:
+                        nonlocal left_gens
                         curr_gens = len(pipes._sources)
                         if left_gens > curr_gens:
                             delta = left_gens - curr_gens
@@ -410,11 +418,33 @@ class Extract(WithStepInfo[ExtractMetrics, ExtractInfo]):
                             resource, pipe_item.item, pipe_item.meta
                         )
 
+                    if pipes.asyncio_native and not is_event_loop_running():
+                        asyncio.run(self._consume_pipes_async(pipes, _write_pipe_item))
+                    else:
+                        if pipes.asyncio_native:
+                            logger.warning(
+                                "Event loop is already running in the extract thread, async"
+                                " resources will be evaluated in a background loop."
+                            )
+                        for pipe_item in pipes:
+                            _write_pipe_item(pipe_item)
+
                     self._write_empty_files(source, extractors)
                     if left_gens > 0:
                         # go to 100%
                         collector.update("Resources", left_gens)
 
+    @staticmethod
+    async def _consume_pipes_async(
+        pipes: PipeIterator, write_f: Callable[[PipeItem], None]
+    ) -> None:
+        try:
+            async for pipe_item in pipes:
+                write_f(pipe_item)
+        finally:
+            # cancel pending tasks while the loop is still running
+            pipes.close()
+
     @contextlib.contextmanager
     def manage_writers(self, load_id: str, source: DltSource) -> Iterator[ExtractStorage]:
         self._step_info_start_load_id(load_id)
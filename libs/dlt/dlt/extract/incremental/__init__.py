@@ -10,6 +10,7 @@ from typing import (
     Union,
     Literal,
     Tuple,
+    Set,
 )
 
 import inspect
@@ -52,6 +53,7 @@ from dlt.common.incremental.typing import (
     OnCursorValueMissing,
     IncrementalArgs,
     TIncrementalRange,
+    TUniqueHashesFormat,
 )
 from dlt.extract.items import SupportsPipe, TTableHintTemplate
 from dlt.extract.items_transform import BaseItemTransform, ItemTransform
@@ -62,6 +64,13 @@ from dlt.extract.incremental.transform import (
     IncrementalTransform,
 )
 from dlt.extract.incremental.lag import apply_lag
+from dlt.extract.incremental.unique_hashes import (
+    TUniqueHash,
+    compact_hashes_count,
+    migrate_digest_hashes,
+    pack_compact_hashes,
+    unpack_compact_hashes,
+)
 
 try:
     from dlt.common.libs.pyarrow import is_arrow_item
@@ -130,6 +139,9 @@ class Incremental(
             The `open` range disables deduplication logic so it can serve as an optimization when you know cursors don't overlap between pipeline runs.
         range_end: Decide whether the incremental filtering range is `open` or `closed` on the end value side. Default is `open` (exact `end_value` is excluded).
             Setting this to `closed` means that items with the exact same cursor value as the `end_value` are included in the result.
+        unique_hashes_format: How hashes of rows with the last cursor value, used to deduplicate the start of the next run, are kept in state. Default is `digest`
+            which keeps a list of base64 encoded 120 bit hashes. `compact` keeps a sorted array of 64 bit hashes in a single binary value, several times smaller
+            and faster to load when thousands of rows share the same cursor value. Hashes already in state are converted when switching from `digest` to `compact`.
     """
 
     # this is config/dataclass so declare members
@@ -144,6 +156,7 @@ class Incremental(
     duplicate_cursor_warning_threshold: ClassVar[int] = 200
     range_start: TIncrementalRange = "closed"
     range_end: TIncrementalRange = "open"
+    unique_hashes_format: TUniqueHashesFormat = "digest"
 
     # incremental acting as empty
     EMPTY: ClassVar["Incremental[Any]"] = None
@@ -162,6 +175,7 @@ class Incremental(
         lag: Optional[float] = None,
         range_start: TIncrementalRange = "closed",
         range_end: TIncrementalRange = "open",
+        unique_hashes_format: TUniqueHashesFormat = "digest",
     ) -> None:
         # make sure that path is valid
         if cursor_path:
@@ -207,10 +221,21 @@ class Incremental(
         """Becomes true on the first item that is out of range of `start_value`. I.e. when using `max` this is a value that is lower than `start_value`"""
 
         self._transformers: Dict[Type[IncrementalTransform], IncrementalTransform] = {}
+        self._written_unique_hashes: Tuple[IncrementalColumnState, Set[TUniqueHash], int] = (
+            None,
+            None,
+            0,
+        )
+        """State, unique hashes set and its size last written to that state"""
         self._bound_pipe: SupportsPipe = None
         """Bound pipe"""
         self.range_start = range_start
         self.range_end = range_end
+        if unique_hashes_format not in ["digest", "compact"]:
+            raise ValueErrorWithKnownValues(
+                "unique_hashes_format", unique_hashes_format, ["digest", "compact"]
+            )
+        self.unique_hashes_format = unique_hashes_format
         self._custom_metrics: IncrementalCustomMetrics = {
             "unfiltered_items_count": 0,
             "unfiltered_batches_count": 0,
@@ -344,6 +369,7 @@ class Incremental(
             self.allow_external_schedulers = merged.allow_external_schedulers
             self.row_order = merged.row_order
             self.lag = merged.lag
+            self.unique_hashes_format = merged.unique_hashes_format
             # also copy the orig class to preserve cursor type
             if constructor := getattr(self, "__orig_class__", None):
                 pass
@@ -568,14 +594,55 @@ class Incremental(
             self.end_value,
             self.last_value_func,
             self._primary_key,
-            set(self._cached_state["unique_hashes"]),
+            self._get_unique_hashes(),
             self.on_cursor_value_missing,
             self.lag,
             self.range_start,
             self.range_end,
+            self.unique_hashes_format,
         )
         return transformer
 
+    def _get_unique_hashes(self) -> Set[TUniqueHash]:
+        """Reads boundary deduplication hashes from state in the format set on this instance"""
+        state = self._cached_state
+        if self.unique_hashes_format == "compact":
+            hashes: Set[TUniqueHash] = unpack_compact_hashes(state.get("unique_hashes_compact"))
+            # convert hashes written before compact format was enabled
+            hashes.update(migrate_digest_hashes(state["unique_hashes"]))
+            return hashes
+        if state.get("unique_hashes_compact") and not state["unique_hashes"]:
+            logger.warning(
+                f"Incremental on resource '{self.resource_name}' with cursor path"
+                f" '{self.cursor_path}' finds boundary deduplication hashes in `compact` format in"
+                " state but uses `digest` format. Those hashes cannot be converted so rows with"
+                " the last cursor value from the previous run may be loaded again."
+            )
+        return set(state["unique_hashes"])
+
+    def _get_unique_hashes_count(self) -> int:
+        state = self._cached_state
+        return len(state.get("unique_hashes") or ()) + compact_hashes_count(
+            state.get("unique_hashes_compact")
+        )
+
+    def _write_unique_hashes(self, hashes: Set[TUniqueHash]) -> None:
+        """Writes boundary deduplication hashes to state if they changed since last write"""
+        state, written_hashes, written_count = self._written_unique_hashes
+        if (
+            state is self._cached_state
+            and hashes is written_hashes
+            and len(hashes) == written_count
+        ):
+            return
+        if self.unique_hashes_format == "compact":
+            self._cached_state["unique_hashes"] = []
+            self._cached_state["unique_hashes_compact"] = pack_compact_hashes(hashes)  # type: ignore[arg-type]
+        else:
+            self._cached_state["unique_hashes"] = list(hashes)  # type: ignore[arg-type]
+            self._cached_state.pop("unique_hashes_compact", None)
+        self._written_unique_hashes = (self._cached_state, hashes, len(hashes))
+
     def _get_transform(self, items: TDataItems) -> IncrementalTransform:
         """Gets transform implementation that handles particular data item type"""
         # Assume list is all of the same type
@@ -599,11 +666,17 @@ class Incremental(
 
         transformer = self._get_transform(rows)
         if isinstance(rows, list):
-            rows = [
-                item
-                for item in (self._transform_item(transformer, row) for row in rows)
-                if item is not None
-            ]
+            if isinstance(transformer, JsonIncremental):
+                # filter list of objects in a single batch
+                rows, self.start_out_of_range, self.end_out_of_range = transformer.filter_rows(rows)
+                if self.can_close() and not self._bound_pipe.has_parent:
+                    self._bound_pipe.close()
+            else:
+                rows = [
+                    item
+                    for item in (self._transform_item(transformer, row) for row in rows)
+                    if item is not None
+                ]
             # return None if fully consumed like FilterItem (Incremental is just a very complicated FilterItem)
             if len(rows) == 0:
                 rows = None
@@ -622,23 +695,27 @@ class Incremental(
             # compute hashes for new last rows
             # NOTE: object transform uses last_rows to pass rows to dedup, arrow computes
             #  hashes directly
-            unique_hashes = set(
-                transformer.compute_unique_value(row, self.primary_key)
-                for row in transformer.last_rows
-            )
-            initial_hash_list = self._cached_state.get("unique_hashes")
-            initial_hash_count = len(initial_hash_list) if initial_hash_list else 0
+            if transformer.last_rows and isinstance(transformer, JsonIncremental):
+                # hash each boundary row once, rows sharing the last value across many
+                # batches are not hashed again
+                transformer.unique_hashes.update(
+                    transformer.compute_unique_values_batch(
+                        transformer.last_rows, self.primary_key
+                    )
+                )
+                transformer.last_rows = []
+            initial_hash_count = self._get_unique_hashes_count()
             self.custom_metrics["initial_unique_hashes_count"] = initial_hash_count
 
-            # add directly computed hashes
-            unique_hashes.update(transformer.unique_hashes)
-            self._cached_state["unique_hashes"] = list(unique_hashes)
-            final_hash_count = len(self._cached_state["unique_hashes"])
+            self._write_unique_hashes(transformer.unique_hashes)
+            final_hash_count = len(transformer.unique_hashes)
             self.custom_metrics["final_unique_hashes_count"] = final_hash_count
 
             self._check_duplicate_cursor_threshold(initial_hash_count, final_hash_count)
         else:
             self._cached_state["unique_hashes"] = []
+            self._cached_state.pop("unique_hashes_compact", None)
+            self._written_unique_hashes = (None, None, 0)
         return rows
 
     def _check_duplicate_cursor_threshold(
@@ -1,11 +1,11 @@
+import operator
 from datetime import datetime  # noqa: I251
-from typing import Any, Optional, Set, Tuple, List, Type
+from typing import Any, Optional, Sequence, Set, Tuple, List, Type
 from pendulum.tz import UTC
 from pendulum import DateTime  # noqa: I251
 
 from dlt.common import logger
 from dlt.common.exceptions import MissingDependencyException
-from dlt.common.utils import digest128
 from dlt.common.json import json
 from dlt.common.pendulum import create_dt, pendulum
 from dlt.common.typing import TDataItem, TColumnNames
@@ -21,7 +21,9 @@ from dlt.common.incremental.typing import (
     LastValueFunc,
     OnCursorValueMissing,
     TIncrementalRange,
+    TUniqueHashesFormat,
 )
+from dlt.extract.incremental.unique_hashes import TUniqueHash, get_unique_hash_func
 from dlt.extract.utils import resolve_column_value
 from dlt.extract.items import TTableHintTemplate
 
@@ -65,11 +67,12 @@ class IncrementalTransform:
         end_value: Optional[TCursorValue],
         last_value_func: LastValueFunc[TCursorValue],
         primary_key: Optional[TTableHintTemplate[TColumnNames]],
-        unique_hashes: Set[str],
+        unique_hashes: Set[TUniqueHash],
         on_cursor_value_missing: OnCursorValueMissing = "raise",
         lag: Optional[float] = None,
         range_start: TIncrementalRange = "closed",
         range_end: TIncrementalRange = "open",
+        unique_hashes_format: TUniqueHashesFormat = "digest",
     ) -> None:
         self.resource_name = resource_name
         self.cursor_path = cursor_path
@@ -89,6 +92,8 @@ class IncrementalTransform:
         self.lag = lag
         self.range_start = range_start
         self.range_end = range_end
+        self.unique_hashes_format = unique_hashes_format
+        self._hash_func = get_unique_hash_func(unique_hashes_format)
         # NOTE: self.primary_key is a property
         self.primary_key = primary_key
         # tells if incremental instance has processed any data
@@ -105,12 +110,14 @@ class IncrementalTransform:
         self,
         row: TDataItem,
         primary_key: Optional[TTableHintTemplate[TColumnNames]],
-    ) -> str:
+    ) -> TUniqueHash:
         try:
             if primary_key:
-                return digest128(json.dumps(resolve_column_value(primary_key, row), sort_keys=True))
+                return self._hash_func(
+                    json.dumps(resolve_column_value(primary_key, row), sort_keys=True)
+                )
             elif primary_key is None:
-                return digest128(json.dumps(row, sort_keys=True))
+                return self._hash_func(json.dumps(row, sort_keys=True))
             else:
                 return None
         except KeyError as k_err:
@@ -363,6 +370,151 @@ class JsonIncremental(IncrementalTransform):
 
         return row, False, False
 
+    def filter_rows(self, rows: List[TDataItem]) -> Tuple[List[TDataItem], bool, bool]:
+        """Filters a batch of rows. Cursor values are taken from all rows in one pass and the new
+        last value and boundary rows are computed for the whole batch. Equivalent to calling the
+        transform on each row. Custom `last_value_func` is evaluated row by row.
+
+        Returns:
+            Tuple (rows, start_out_of_range, end_out_of_range) where out of range flags are set if
+            any of the rows was filtered out for being out of range
+        """
+        last_value_func = self.last_value_func
+        if last_value_func is max:
+            is_better = operator.gt
+        elif last_value_func is min:
+            is_better = operator.lt
+        else:
+            return self._filter_rows_one_by_one(rows)
+
+        # None items are dropped, same as row by row transform
+        rows = [row for row in rows if row is not None]
+        values = self.find_cursor_values(rows)
+        first_value = next((value for value in values if value is not None), None)
+        if first_value is None:
+            # no cursor values: all rows were excluded or included without updating state
+            if self.on_cursor_value_missing == "exclude":
+                return [], False, False
+            return rows, False, False
+
+        # correct tz-awareness of start and end values once, same as row by row transform
+        if not self.seen_data and isinstance(first_value, datetime):
+            if self.start_value_is_datetime:
+                assert self.last_value == self.start_value
+                self.last_value = self.start_value = self._adapt_timezone(
+                    first_value, self.last_value, "last_value", self.resource_name
+                )
+            if self.end_value is not None and self.end_value_is_datetime:
+                self.end_value = self._adapt_timezone(
+                    first_value, self.end_value, "end_value", self.resource_name
+                )
+
+        start_value = self.start_value
+        end_value = self.end_value
+        include_end = self.range_end == "closed"
+        include_start = self.range_start == "closed"
+        include_missing = self.on_cursor_value_missing == "include"
+        start_out_of_range = end_out_of_range = seen_data = False
+        filtered: List[TDataItem] = []
+        accepted: List[Tuple[TDataItem, Any]] = []
+        try:
+            for row, value in zip(rows, values):
+                if value is None:
+                    if include_missing:
+                        filtered.append(row)
+                    continue
+                if end_value is not None and not (
+                    is_better(end_value, value) or (include_end and value == end_value)
+                ):
+                    end_out_of_range = True
+                    continue
+                seen_data = True
+                if start_value is not None and not is_better(value, start_value):
+                    if value != start_value:
+                        start_out_of_range = True
+                        continue
+                    if not include_start:
+                        continue
+                    if (
+                        self.boundary_deduplication
+                        and self.compute_unique_value(row, self._primary_key)
+                        in self.start_unique_hashes
+                    ):
+                        start_out_of_range = True
+                        continue
+                filtered.append(row)
+                accepted.append((row, value))
+            batch_value = last_value_func(value for _, value in accepted) if accepted else None
+        except TypeError:
+            # cursor values cannot be compared, row by row transform raises a proper exception
+            return self._filter_rows_one_by_one(rows)
+
+        self.seen_data = self.seen_data or seen_data
+        if batch_value is not None:
+            last_value = self.last_value
+            if last_value is None or is_better(batch_value, last_value):
+                self.last_value = batch_value
+                if self.boundary_deduplication:
+                    self.last_rows = [row for row, value in accepted if value == batch_value]
+                    self.unique_hashes = set()
+            elif self.boundary_deduplication:
+                self.last_rows.extend(row for row, value in accepted if value == last_value)
+        return filtered, start_out_of_range, end_out_of_range
+
+    def compute_unique_values_batch(
+        self,
+        rows: Sequence[TDataItem],
+        primary_key: Optional[TTableHintTemplate[TColumnNames]],
+    ) -> List[TUniqueHash]:
+        """Computes unique values of all `rows`, same as `compute_unique_value` on each row"""
+        hash_func = self._hash_func
+        if primary_key is None:
+            return [hash_func(json.dumps(row, sort_keys=True)) for row in rows]
+        if not primary_key:
+            return [None] * len(rows)
+        try:
+            return [
+                hash_func(json.dumps(resolve_column_value(primary_key, row), sort_keys=True))
+                for row in rows
+            ]
+        except KeyError:
+            # find the offending row
+            for row in rows:
+                self.compute_unique_value(row, primary_key)
+            raise
+
+    def find_cursor_values(self, rows: List[TDataItem]) -> List[Any]:
+        """Finds cursor values in all `rows`. Missing values are returned as None or raise
+        depending on `on_cursor_value_missing`
+        """
+        if self._compiled_cursor_path is None:
+            cursor_path = self.cursor_path
+            try:
+                values = [row.get(cursor_path) for row in rows]
+            except AttributeError:
+                # not all rows are dicts
+                values = [self.find_cursor_value(row) for row in rows]
+        else:
+            compiled_path = self._compiled_cursor_path
+            values = [next(iter(find_values(compiled_path, row)), None) for row in rows]
+        if self.on_cursor_value_missing == "raise":
+            for row, value in zip(rows, values):
+                if value is None:
+                    # raises exception for missing path or None value
+                    self.find_cursor_value(row)
+        return values
+
+    def _filter_rows_one_by_one(self, rows: List[TDataItem]) -> Tuple[List[TDataItem], bool, bool]:
+        filtered: List[TDataItem] = []
+        start_out_of_range = end_out_of_range = False
+        for row in rows:
+            row, row_start_out_of_range, row_end_out_of_range = self(row)
+            start_out_of_range = start_out_of_range or row_start_out_of_range
+            end_out_of_range = end_out_of_range or row_end_out_of_range
+            if row is not None:
+                filtered.append(row)
+        return filtered, start_out_of_range, end_out_of_range
+
 
 class ArrowIncremental(IncrementalTransform):
     _dlt_index = "_dlt_index"
@@ -392,7 +544,9 @@ class ArrowIncremental(IncrementalTransform):
                 "Only `min` or `max` of `last_value_func` is supported for arrow tables"
             )
 
-    def compute_unique_values(self, item: "TAnyArrowItem", unique_columns: List[str]) -> List[str]:
+    def compute_unique_values(
+        self, item: "TAnyArrowItem", unique_columns: List[str]
+    ) -> List[TUniqueHash]:
         if not unique_columns:
             return []
         rows = item.select(unique_columns).to_pylist()
@@ -400,7 +554,7 @@ class ArrowIncremental(IncrementalTransform):
 
     def compute_unique_values_with_index(
         self, item: "TAnyArrowItem", unique_columns: List[str]
-    ) -> List[Tuple[Any, str]]:
+    ) -> List[Tuple[Any, TUniqueHash]]:
         if not unique_columns:
             return []
         indices = item[self._dlt_index].to_pylist()
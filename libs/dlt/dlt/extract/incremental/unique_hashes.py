@@ -0,0 +1,71 @@
+"""Compact representation of boundary deduplication hashes kept in incremental state.
+
+Compact hashes are the first 8 bytes of the same shake128 digest that `digest128` encodes, stored as
+unsigned 64 bit integers. State keeps them as a sorted array of little endian integers so a large
+set of hashes takes 8 bytes per row instead of a list of base64 strings.
+"""
+
+import base64
+import hashlib
+import sys
+from array import array
+from typing import Callable, Iterable, Sequence, Set, Union
+
+from dlt.common.incremental.typing import TUniqueHashesFormat
+from dlt.common.utils import digest128
+
+TUniqueHash = Union[str, int]
+"""A `digest128` string or a compact 64 bit integer hash"""
+TUniqueHashFunc = Callable[[str], TUniqueHash]
+
+COMPACT_HASH_BYTES = 8
+
+
+def digest64(v: str) -> int:
+    """Returns a 64 bit integer hash of str `v`, a prefix of the `digest128` of the same value"""
+    return int.from_bytes(hashlib.shake_128(v.encode("utf-8")).digest(COMPACT_HASH_BYTES), "little")
+
+
+def digest_to_compact(digest: str) -> int:
+    """Converts a `digest128` string into compact hash without access to the original value"""
+    digest_bytes = base64.b64decode(digest + "=" * (-len(digest) % 4))
+    return int.from_bytes(digest_bytes[:COMPACT_HASH_BYTES], "little")
+
+
+def get_unique_hash_func(unique_hashes_format: TUniqueHashesFormat) -> TUniqueHashFunc:
+    if unique_hashes_format == "compact":
+        return digest64
+    return digest128
+
+
+def pack_compact_hashes(hashes: Iterable[int]) -> bytes:
+    """Packs compact hashes into a sorted array of little endian unsigned 64 bit integers"""
+    packed = array("Q", sorted(hashes))
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def unpack_compact_hashes(data: bytes) -> Set[int]:
+    """Unpacks hashes packed with `pack_compact_hashes` into a set for fast membership tests"""
+    if not data:
+        return set()
+    if len(data) % COMPACT_HASH_BYTES:
+        raise ValueError(
+            f"Compact unique hashes have {len(data)} bytes which is not a multiple of"
+            f" {COMPACT_HASH_BYTES}"
+        )
+    unpacked = array("Q")
+    unpacked.frombytes(data)
+    if sys.byteorder == "big":
+        unpacked.byteswap()
+    return set(unpacked)
+
+
+def compact_hashes_count(data: bytes) -> int:
+    return len(data) // COMPACT_HASH_BYTES if data else 0
+
+
+def migrate_digest_hashes(digests: Sequence[str]) -> Set[int]:
+    """Converts `digest128` hashes from state created before compact format was enabled"""
+    return {digest_to_compact(digest) for digest in digests}
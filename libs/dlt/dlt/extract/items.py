@@ -24,6 +24,9 @@ from dlt.common.typing import (
 )
 
 TDecompositionStrategy = Literal["none", "scc"]
+TParallelPoolType = Literal["thread", "process"]
+TParallelizedMode = Union[bool, Literal["process"]]
+"""`True` evaluates items in a thread pool, `process` evaluates transformer calls in a process pool"""
 TDeferredDataItems = Callable[[], TDataItems]
 TAwaitableDataItems = Awaitable[TDataItems]
 TPipedDataItems = Union[TDataItems, TDeferredDataItems, TAwaitableDataItems]
@@ -35,6 +38,12 @@ else:
     TItemFuture = Future
 
 
+class ProcessItems(list):  # type: ignore[type-arg]
+    """Items yielded by a generator evaluated in a process pool, passed back to the pipe as a new source"""
+
+    pass
+
+
 class PipeItem(NamedTuple):
     item: TDataItems
     step: int
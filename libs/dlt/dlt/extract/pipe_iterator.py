@@ -1,3 +1,4 @@
+import asyncio
 import inspect
 import types
 from typing import (
@@ -8,10 +9,12 @@ from typing import (
     Union,
     Iterator,
     List,
+    Any,
     Awaitable,
     Tuple,
     Type,
     Literal,
+    Optional,
 )
 from concurrent.futures import TimeoutError as FutureTimeoutError
 
@@ -39,7 +42,7 @@ from dlt.extract.pipe import Pipe
 from dlt.extract.items import DataItemWithMeta, PipeItem, ResolvablePipeItem, SourcePipeItem
 from dlt.extract.state import pipe_context
 from dlt.extract.utils import wrap_async_iterator
-from dlt.extract.concurrency import FuturesPool
+from dlt.extract.concurrency import FuturesPool, FuturesPoolMetrics
 
 TPipeNextItemMode = Literal["fifo", "round_robin"]
 
@@ -50,8 +53,15 @@ class PipeIterator(Iterator[PipeItem]):
         max_parallel_items: int = 20
         workers: int = 5
         futures_poll_interval: float = 0.01
+        max_parallel_items_per_resource: Optional[int] = None
+        """Maximum number of items of a single resource evaluated in parallel, no limit if not set"""
+        preserve_items_order: bool = False
+        """Return items of a resource evaluated in parallel in the order they were submitted"""
         copy_on_fork: bool = False
         next_item_mode: str = "round_robin"
+        asyncio_native: bool = False
+        """Consume pipes as a coroutine in an event loop of the extracting thread instead of evaluating
+        async generators and awaitables in a background loop"""
         __section__: ClassVar[str] = known_sections.EXTRACT
 
     def __init__(
@@ -61,15 +71,23 @@ class PipeIterator(Iterator[PipeItem]):
         futures_poll_interval: float,
         sources: List[SourcePipeItem],
         next_item_mode: TPipeNextItemMode,
+        max_parallel_items_per_resource: Optional[int] = None,
+        asyncio_native: bool = False,
+        preserve_items_order: bool = False,
     ) -> None:
         self._sources = sources
+        self.asyncio_native = asyncio_native
         self._next_item_mode: TPipeNextItemMode = next_item_mode
         self._initial_sources_count = len(sources)
         self._current_source_index: int = 0
+        # items taken from sources that wait for a free slot in the futures pool
+        self._held_source_items: Dict[Iterator[Any], Any] = {}
         self._futures_pool = FuturesPool(
             workers=workers,
             poll_interval=futures_poll_interval,
             max_parallel_items=max_parallel_items,
+            max_parallel_items_per_pipe=max_parallel_items_per_resource,
+            preserve_items_order=preserve_items_order,
         )
 
     @classmethod
@@ -82,6 +100,9 @@ class PipeIterator(Iterator[PipeItem]):
         workers: int = 5,
         futures_poll_interval: float = 0.01,
         next_item_mode: TPipeNextItemMode = "round_robin",
+        max_parallel_items_per_resource: Optional[int] = None,
+        asyncio_native: bool = False,
+        preserve_items_order: bool = False,
     ) -> "PipeIterator":
         # join all dependent pipes
         if pipe.parent:
@@ -95,7 +116,16 @@ class PipeIterator(Iterator[PipeItem]):
 
         # create extractor
         sources = [SourcePipeItem(pipe.gen, 0, pipe, None)]
-        return cls(max_parallel_items, workers, futures_poll_interval, sources, next_item_mode)
+        return cls(
+            max_parallel_items,
+            workers,
+            futures_poll_interval,
+            sources,
+            next_item_mode,
+            max_parallel_items_per_resource,
+            asyncio_native,
+            preserve_items_order,
+        )
 
     @classmethod
     @with_config(spec=PipeIteratorConfiguration)
@@ -109,6 +139,9 @@ class PipeIterator(Iterator[PipeItem]):
         futures_poll_interval: float = 0.01,
         copy_on_fork: bool = False,
         next_item_mode: TPipeNextItemMode = "round_robin",
+        max_parallel_items_per_resource: Optional[int] = None,
+        asyncio_native: bool = False,
+        preserve_items_order: bool = False,
     ) -> "PipeIterator":
         # print(f"max_parallel_items: {max_parallel_items} workers: {workers}")
         sources: List[SourcePipeItem] = []
@@ -141,7 +174,21 @@ class PipeIterator(Iterator[PipeItem]):
             _fork_pipeline(pipe)
 
         # create extractor
-        return cls(max_parallel_items, workers, futures_poll_interval, sources, next_item_mode)
+        return cls(
+            max_parallel_items,
+            workers,
+            futures_poll_interval,
+            sources,
+            next_item_mode,
+            max_parallel_items_per_resource,
+            asyncio_native,
+            preserve_items_order,
+        )
+
+    @property
+    def futures_pool_metrics(self) -> FuturesPoolMetrics:
+        """Queue depths of items evaluated in parallel"""
+        return self._futures_pool.metrics
 
     def __next__(self) -> PipeItem:
         pipe_item: Union[ResolvablePipeItem, SourcePipeItem] = None
@@ -177,25 +224,11 @@ class PipeIterator(Iterator[PipeItem]):
                     else:
                         continue
 
-            item = pipe_item.item
-            # if item is iterator, then add it as a new source
-            if isinstance(item, Iterator):
-                self._sources.append(
-                    SourcePipeItem(item, pipe_item.step, pipe_item.pipe, pipe_item.meta)
-                )
-                pipe_item = None
-                continue
-
-            # handle async iterator items as new source
-            if isinstance(item, AsyncIterator):
-                self._sources.append(
-                    SourcePipeItem(
-                        wrap_async_iterator(item), pipe_item.step, pipe_item.pipe, pipe_item.meta
-                    ),
-                )
+            if self._add_source(pipe_item):
                 pipe_item = None
                 continue
 
+            item = pipe_item.item
             with pipe_context(pipe_item.pipe):
                 if isinstance(item, Awaitable) or callable(item):
                     # Callables are submitted to the pool to be executed in the background
@@ -206,48 +239,121 @@ class PipeIterator(Iterator[PipeItem]):
 
                 # if we are at the end of the pipe then yield element
                 if pipe_item.step == len(pipe_item.pipe) - 1:
-                    # must be resolved
-                    if isinstance(item, (Iterator, Awaitable, AsyncIterator)) or callable(item):
-                        raise PipeItemProcessingError(
-                            pipe_item.pipe.name,
-                            f"Pipe item of type `{type(pipe_item.item).__name__}` was not fully"
-                            f" evaluated at step `{pipe_item.step}`. This is an internal error or"
-                            " you're yielding unexpected object from resources (e.g., fucntions,"
-                            " awaitables).",
-                        )
-                    # mypy not able to figure out that item was resolved
-                    return pipe_item  # type: ignore
-
-                # advance to next step
-                step = pipe_item.pipe[pipe_item.step + 1]
-                try:
-                    next_meta = pipe_item.meta
-                    next_item = step(item, meta=pipe_item.meta)  # type: ignore
-                    if isinstance(next_item, DataItemWithMeta):
-                        next_meta = next_item.meta
-                        next_item = next_item.data
-                except TypeError as ty_ex:
-                    assert callable(step)
-                    raise InvalidStepFunctionArguments(
-                        pipe_item.pipe.name,
-                        get_callable_name(step),
-                        inspect.signature(step),
-                        str(ty_ex),
-                    )
-                except (PipelineException, ExtractorException, DltSourceException, PipeException):
-                    raise
-                except Exception as ex:
-                    raise ResourceExtractionError(
-                        pipe_item.pipe.name, step, str(ex), "transform"
-                    ) from ex
-
-            # create next pipe item if a value was returned. A None means that item was consumed/filtered out and should not be further processed
-            if next_item is not None:
-                pipe_item = ResolvablePipeItem(
-                    next_item, pipe_item.step + 1, pipe_item.pipe, next_meta
-                )
-            else:
+                    return self._ensure_resolved(pipe_item)
+
+                pipe_item = self._transform_item(pipe_item)
+
+    def __aiter__(self) -> "PipeIterator":
+        return self
+
+    async def __anext__(self) -> PipeItem:
+        """Returns next item evaluated in the running event loop.
+
+        Awaitables, including async generators and transformers, run as tasks of the running loop
+        and callables in the thread pool. Sync generators and transform steps are evaluated inline.
+        """
+        pipe_item: Union[ResolvablePipeItem, SourcePipeItem] = None
+        while True:
+            if pipe_item is None:
+                pipe_item = self._futures_pool.resolve_next_future_no_wait()
+
+                if pipe_item is None:
+                    pipe_item = self._get_source_item()
+
+                if pipe_item is None:
+                    if self._futures_pool.empty:
+                        if len(self._sources) == 0:
+                            raise StopAsyncIteration()
+                        # sources are not ready and nothing in flight
+                        await asyncio.sleep(self._futures_pool.poll_interval)
+                    else:
+                        # let the loop run the tasks until some item is done
+                        pipe_item = await self._futures_pool.resolve_next_future_async()
+
+                if pipe_item is None:
+                    continue
+
+            if self._add_source(pipe_item):
                 pipe_item = None
+                continue
+
+            item = pipe_item.item
+            if isinstance(item, Awaitable) or callable(item):
+                # task created in the pipe context inherits it
+                with pipe_context(pipe_item.pipe):
+                    await self._futures_pool.submit_async(pipe_item)  # type: ignore[arg-type]
+                pipe_item = None
+                continue
+
+            with pipe_context(pipe_item.pipe):
+                if pipe_item.step == len(pipe_item.pipe) - 1:
+                    return self._ensure_resolved(pipe_item)
+                pipe_item = self._transform_item(pipe_item)
+
+    def _add_source(self, pipe_item: Union[ResolvablePipeItem, SourcePipeItem]) -> bool:
+        """Adds iterator or async iterator item as a new source, returns True if added"""
+        item = pipe_item.item
+        # if item is iterator, then add it as a new source
+        if isinstance(item, Iterator):
+            self._sources.append(
+                SourcePipeItem(item, pipe_item.step, pipe_item.pipe, pipe_item.meta)
+            )
+            return True
+
+        # handle async iterator items as new source
+        if isinstance(item, AsyncIterator):
+            self._sources.append(
+                SourcePipeItem(
+                    wrap_async_iterator(item), pipe_item.step, pipe_item.pipe, pipe_item.meta
+                ),
+            )
+            return True
+        return False
+
+    @staticmethod
+    def _ensure_resolved(pipe_item: Union[ResolvablePipeItem, SourcePipeItem]) -> PipeItem:
+        item = pipe_item.item
+        # must be resolved
+        if isinstance(item, (Iterator, Awaitable, AsyncIterator)) or callable(item):
+            raise PipeItemProcessingError(
+                pipe_item.pipe.name,
+                f"Pipe item of type `{type(pipe_item.item).__name__}` was not fully"
+                f" evaluated at step `{pipe_item.step}`. This is an internal error or"
+                " you're yielding unexpected object from resources (e.g., fucntions,"
+                " awaitables).",
+            )
+        # mypy not able to figure out that item was resolved
+        return pipe_item  # type: ignore
+
+    @staticmethod
+    def _transform_item(
+        pipe_item: Union[ResolvablePipeItem, SourcePipeItem]
+    ) -> Optional[ResolvablePipeItem]:
+        """Evaluates next step of the pipe on the item. Must be called in pipe context."""
+        step = pipe_item.pipe[pipe_item.step + 1]
+        try:
+            next_meta = pipe_item.meta
+            next_item = step(pipe_item.item, meta=pipe_item.meta)  # type: ignore
+            if isinstance(next_item, DataItemWithMeta):
+                next_meta = next_item.meta
+                next_item = next_item.data
+        except TypeError as ty_ex:
+            assert callable(step)
+            raise InvalidStepFunctionArguments(
+                pipe_item.pipe.name,
+                get_callable_name(step),
+                inspect.signature(step),
+                str(ty_ex),
+            )
+        except (PipelineException, ExtractorException, DltSourceException, PipeException):
+            raise
+        except Exception as ex:
+            raise ResourceExtractionError(pipe_item.pipe.name, step, str(ex), "transform") from ex
+
+        # create next pipe item if a value was returned. A None means that item was consumed/filtered out and should not be further processed
+        if next_item is not None:
+            return ResolvablePipeItem(next_item, pipe_item.step + 1, pipe_item.pipe, next_meta)
+        return None
 
     def _get_source_item(self) -> ResolvablePipeItem:
         sources_count = len(self._sources)
@@ -270,8 +376,14 @@ class PipeIterator(Iterator[PipeItem]):
                     return None
                 # get next item from the current source
                 gen, step, pipe, meta = self._sources[self._current_source_index]
-                with pipe_context(pipe):
-                    pipe_item = next(gen)
+                pipe_item = self._held_source_items.pop(gen, None)
+                if pipe_item is None:
+                    with pipe_context(pipe):
+                        pipe_item = next(gen)
+                if pipe_item is not None and not self._can_submit(pipe_item, pipe):
+                    # hold items that would wait for a slot on submit so other pipes are not blocked
+                    self._held_source_items[gen] = pipe_item
+                    pipe_item = None
                 if pipe_item is not None:
                     # full pipe item may be returned, this is used by ForkPipe step
                     # to redirect execution of an item to another pipe
@@ -303,11 +415,37 @@ class PipeIterator(Iterator[PipeItem]):
         except Exception as ex:
             raise ResourceExtractionError(pipe.name, gen, str(ex), "generator") from ex
 
+    def _can_submit(self, pipe_item: Any, pipe: Pipe) -> bool:
+        """Tells if `pipe_item` taken from a source of `pipe` is data or can be submitted to the
+        futures pool without waiting for a free slot
+        """
+        pipe_name = pipe.name
+        if isinstance(pipe_item, ResolvablePipeItem):
+            # forked items are submitted by the pipe they are sent to
+            item, pipe_name = pipe_item.item, pipe_item.pipe.name
+        elif isinstance(pipe_item, DataItemWithMeta):
+            item = pipe_item.data
+        else:
+            item = pipe_item
+        if not (isinstance(item, Awaitable) or callable(item)):
+            return True
+        return self._futures_pool.has_free_slot(pipe_name)
+
     def close(self) -> None:
         # Close the futures pool and cancel all tasks
         # It's important to do this before closing generators as we can't close a running generator
         self._futures_pool.close()
 
+        # drop held items, coroutines are closed so they do not warn that they were never awaited
+        for held_item in self._held_source_items.values():
+            if isinstance(held_item, ResolvablePipeItem):
+                held_item = held_item.item
+            elif isinstance(held_item, DataItemWithMeta):
+                held_item = held_item.data
+            if inspect.iscoroutine(held_item):
+                held_item.close()
+        self._held_source_items.clear()
+
         # close all generators
         for gen, _, _, _ in self._sources:
             if inspect.isgenerator(gen):
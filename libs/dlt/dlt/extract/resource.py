@@ -20,7 +20,11 @@ from dlt.common.configuration.inject import get_fun_spec, with_config
 from dlt.common.configuration.resolve import inject_section
 from dlt.common.configuration.specs import BaseConfiguration, known_sections
 from dlt.common.configuration.specs.config_section_context import ConfigSectionContext
-from dlt.common.reflection.inspect import isgeneratorfunction
+from dlt.common.reflection.inspect import (
+    isasyncgenfunction,
+    iscoroutinefunction,
+    isgeneratorfunction,
+)
 from dlt.common.schema.utils import normalize_schema_name
 from dlt.common.typing import (
     AnyFun,
@@ -51,11 +55,13 @@ from dlt.common.schema.typing import TTableSchema
 from dlt.extract.utils import (
     make_schema_with_default_name,
     wrap_parallel_iterator,
+    wrap_process_transformer,
     dynstr,
 )
 from dlt.extract.items import (
     DataItemWithMeta,
     TableNameMeta,
+    TParallelPoolType,
 )
 from dlt.extract.items_transform import (
     FilterItem,
@@ -83,6 +89,7 @@ from dlt.extract.exceptions import (
     InvalidResourceDataTypeBasic,
     InvalidResourceDataTypeMultiplePipes,
     InvalidParallelResourceDataType,
+    InvalidProcessParallelResource,
     ParametrizedResourceUnbound,
     ResourceNameMissing,
     ResourceNotATransformer,
@@ -444,11 +451,29 @@ class DltResource(Iterable[TDataItem], DltResourceHints):
 
         return self
 
-    def parallelize(self) -> Self:
+    def parallelize(self, pool_type: TParallelPoolType = "thread") -> Self:
         """Wraps the resource to execute each item in a threadpool to allow multiple resources to extract in parallel.
 
-        The resource must be a generator or generator function or a transformer function.
+        The resource must be a generator or generator function or a transformer function. With `pool_type`
+        set to `process`, each transformer call is evaluated in a process pool. Data items and transformer
+        arguments must be picklable and the transformer must be defined at module level.
         """
+        if pool_type == "process":
+            gen = self._pipe.gen
+            if (
+                not self.is_transformer
+                or not callable(gen)
+                or iscoroutinefunction(gen)
+                or isasyncgenfunction(gen)
+            ):
+                raise InvalidProcessParallelResource(self.name, gen, type(gen))
+            # wrap the original function so config is injected before item is sent to the pool
+            ejected = self._eject_config()
+            self._pipe.replace_gen(wrap_process_transformer(self._pipe.gen, self.name))
+            if ejected:
+                self._inject_config()
+            return self
+
         if (
             not inspect.isgenerator(self._pipe.gen)
             and not (callable(self._pipe.gen) and isgeneratorfunction(self._pipe.gen))
@@ -1,3 +1,5 @@
+import asyncio
+import importlib
 import inspect
 from typing import (
     Callable,
@@ -31,14 +33,16 @@ from dlt.common.typing import (
     TColumnNames,
     NoneType,
 )
-from dlt.common.utils import get_callable_name
+from dlt.common.utils import get_callable_name, is_inner_callable
 
 from dlt.extract.exceptions import (
     InvalidResourceDataTypeIsNone,
     InvalidResourceReturnsResource,
     InvalidStepFunctionArguments,
+    ProcessParallelFunctionNotImportable,
 )
 from dlt.extract.items import (
+    ProcessItems,
     TTableHintTemplate,
     TFunHintTemplate,
     SupportsPipe,
@@ -196,6 +200,15 @@ def wrap_iterator(gen: Iterator[TDataItems]) -> Iterator[TDataItems]:
     return wrapped_gen()
 
 
+def is_event_loop_running() -> bool:
+    """Checks if asyncio event loop is running in the current thread"""
+    try:
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        return False
+
+
 def wrap_async_iterator(
     gen: AsyncIterator[TDataItems],
 ) -> Generator[Awaitable[TDataItems], None, None]:
@@ -284,6 +297,94 @@ def wrap_parallel_iterator(f: TAnyFunOrGenerator) -> TAnyFunOrGenerator:
     return _gen_wrapper()  # type: ignore[return-value]
 
 
+def _resolve_process_function(module_name: str, qualname: str) -> Any:
+    """Imports `qualname` from `module_name` and returns the function evaluated in the process pool.
+
+    Module level transformers are bound to their names as resources so the function is taken from
+    the resource pipe, skipping config injection and process pool wrappers.
+    """
+    from dlt.extract.resource import DltResource
+
+    obj: Any = importlib.import_module(module_name)
+    for attr in qualname.split("."):
+        obj = getattr(obj, attr, None)
+    if isinstance(obj, DltResource):
+        obj = obj._pipe.gen
+    if not hasattr(obj, "__PROCESS_F__"):
+        obj = getattr(obj, "__GEN__", obj)
+    return getattr(obj, "__PROCESS_F__", obj)
+
+
+class ProcessCallable:
+    """Picklable call of a function wrapped with `wrap_process_transformer`.
+
+    Arguments, including the data item, are pickled and the function is imported by name in the
+    worker process. Items yielded by generator functions are returned together as `ProcessItems`.
+    """
+
+    __slots__ = ("resource_name", "f_module", "f_qualname", "args", "kwargs", "is_generator")
+
+    def __init__(
+        self,
+        resource_name: str,
+        f_module: str,
+        f_qualname: str,
+        args: Tuple[Any, ...],
+        kwargs: DictStrAny,
+        is_generator: bool,
+    ) -> None:
+        self.resource_name = resource_name
+        self.f_module = f_module
+        self.f_qualname = f_qualname
+        self.args = args
+        self.kwargs = kwargs
+        self.is_generator = is_generator
+
+    def __call__(self) -> Any:
+        f = _resolve_process_function(self.f_module, self.f_qualname)
+        if not callable(f):
+            raise ProcessParallelFunctionNotImportable(
+                self.resource_name,
+                self.f_module,
+                self.f_qualname,
+                "was not found in the worker process",
+            )
+        if self.is_generator:
+            return ProcessItems(f(*self.args, **self.kwargs))
+        return f(*self.args, **self.kwargs)
+
+
+def wrap_process_transformer(f: AnyFun, resource_name: str) -> AnyFun:
+    """Wraps a transformer function so each call is evaluated in a process pool.
+
+    The wrapped function returns `ProcessCallable` that is submitted to the pool by the pipe iterator.
+    Generator functions are exhausted in the worker process. Functions defined inside other
+    functions cannot be imported by the worker and raise `ProcessParallelFunctionNotImportable`.
+    """
+    f_module, f_qualname = f.__module__, f.__qualname__
+    if is_inner_callable(f):
+        raise ProcessParallelFunctionNotImportable(
+            resource_name, f_module, f_qualname, "is defined inside another function"
+        )
+    is_generator = isgeneratorfunction(f)
+    checked = False
+
+    def _fun_wrapper(*args: Any, **kwargs: Any) -> ProcessCallable:
+        nonlocal checked
+        if not checked:
+            # module is fully imported on first call, make sure the worker will find `f` by name
+            if _resolve_process_function(f_module, f_qualname) is not f:
+                raise ProcessParallelFunctionNotImportable(
+                    resource_name, f_module, f_qualname, "is not bound to its name in the module"
+                )
+            checked = True
+        return ProcessCallable(resource_name, f_module, f_qualname, args, kwargs, is_generator)
+
+    wrapper = wraps(f)(_fun_wrapper)
+    setattr(wrapper, "__PROCESS_F__", f)  # noqa: B010
+    return wrapper
+
+
 def _transformer_compat(item: TDataItems, meta: Any = None) -> Any:
     pass
 
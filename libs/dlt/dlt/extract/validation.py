@@ -1,5 +1,6 @@
 from typing import Optional, Tuple, TypeVar, Generic, Type, Union, Any, List
 from dlt.common.schema.schema import Schema
+from dlt.common.time import precise_time
 
 try:
     from pydantic import BaseModel as PydanticBaseModel
@@ -24,33 +25,52 @@ class PydanticValidator(ValidateItem, Generic[_TPydanticModel]):
         column_mode: TSchemaEvolutionMode,
         data_mode: TSchemaEvolutionMode,
     ) -> None:
-        from dlt.common.libs.pydantic import apply_schema_contract_to_model, create_list_model
+        from dlt.common.libs.pydantic import apply_schema_contract_to_model, create_list_validator
 
         BaseItemTransform.__init__(self)
         self.column_mode: TSchemaEvolutionMode = column_mode
         self.data_mode: TSchemaEvolutionMode = data_mode
         self.model = apply_schema_contract_to_model(model, column_mode, data_mode)
-        self.list_model = create_list_model(self.model, data_mode)
+        self.list_validator = create_list_validator(self.model)
+        # validation cost, reported in the extract trace as resource custom metrics
+        self._custom_metrics = {
+            "validated_items_count": 0,
+            "discarded_items_count": 0,
+            "validation_time": 0.0,
+        }
 
     def __call__(self, item: TDataItems, meta: Any = None) -> TDataItems:
         """Validate a data item against the pydantic model"""
         if item is None:
             return None
 
-        from dlt.common.libs.pydantic import validate_and_filter_item, validate_and_filter_items
-
-        if isinstance(item, list):
-            return [
-                model.dict(by_alias=True)
-                for model in validate_and_filter_items(
-                    self.table_name, self.list_model, item, self.column_mode, self.data_mode
+        from dlt.common.libs.pydantic import validate_and_filter_item, validate_and_dump_items
+
+        started_at = precise_time()
+        try:
+            if isinstance(item, list):
+                items_count = len(item)
+                item = validate_and_dump_items(
+                    self.table_name,
+                    self.model,
+                    self.list_validator,
+                    item,
+                    self.column_mode,
+                    self.data_mode,
                 )
-            ]
-        item = validate_and_filter_item(
-            self.table_name, self.model, item, self.column_mode, self.data_mode
-        )
-        if item is not None:
-            item = item.dict(by_alias=True)
+                discarded_count = items_count - len(item)
+            else:
+                items_count = 1
+                item = validate_and_filter_item(
+                    self.table_name, self.model, item, self.column_mode, self.data_mode
+                )
+                if item is not None:
+                    item = item.dict(by_alias=True)
+                discarded_count = 0 if item is not None else 1
+        finally:
+            self._custom_metrics["validation_time"] += precise_time() - started_at
+        self._custom_metrics["validated_items_count"] += items_count
+        self._custom_metrics["discarded_items_count"] += discarded_count
         return item
 
     def __str__(self, *args: Any, **kwargs: Any) -> str:
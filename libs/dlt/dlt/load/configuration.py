@@ -1,6 +1,6 @@
-from typing import Optional
+from typing import Dict, Optional
 
-from dlt.common.configuration import configspec
+from dlt.common.configuration import configspec, ConfigurationValueError
 from dlt.common.destination.capabilities import TLoaderParallelismStrategy
 from dlt.common.storages import LoadStorageConfiguration
 from dlt.common.runners.configuration import PoolRunnerConfiguration, TPoolType
@@ -12,6 +12,10 @@ class LoaderConfiguration(PoolRunnerConfiguration):
     """how many parallel loads can be executed"""
     parallelism_strategy: Optional[TLoaderParallelismStrategy] = None
     """Which parallelism strategy to use at load time"""
+    max_parallel_jobs_per_table: Optional[int] = None
+    """Max number of jobs loading into a single table that run in parallel. Not limited if not set"""
+    max_parallel_jobs_per_file_format: Optional[Dict[str, int]] = None
+    """Max number of jobs per job file format that run in parallel ie. `{"sql": 1}` runs merge and other sql followup jobs one by one"""
     pool_type: TPoolType = "thread"  # mostly i/o (upload) so may be thread pool
     raise_on_failed_jobs: bool = True
     """when True, raises on terminally failed jobs immediately"""
@@ -24,6 +28,17 @@ class LoaderConfiguration(PoolRunnerConfiguration):
     """If set to False: will attempt to drain load pool on signal, if True: will continue loading new job"""
 
     def on_resolved(self) -> None:
+        if self.max_parallel_jobs_per_table is not None and self.max_parallel_jobs_per_table < 1:
+            raise ConfigurationValueError(
+                "`max_parallel_jobs_per_table` must be at least 1, got"
+                f" {self.max_parallel_jobs_per_table}"
+            )
+        for file_format, max_jobs in (self.max_parallel_jobs_per_file_format or {}).items():
+            if max_jobs < 1:
+                raise ConfigurationValueError(
+                    f"`max_parallel_jobs_per_file_format` for `{file_format}` must be at least 1,"
+                    f" got {max_jobs}"
+                )
         self.pool_type = (
             "none" if (self.workers == 1 or self.parallelism_strategy == "sequential") else "thread"
         )
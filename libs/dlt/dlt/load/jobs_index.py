@@ -0,0 +1,150 @@
+import os
+import heapq
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from dlt.common.storages.load_package import PackageStorage, TPackageJobState
+from dlt.common.storages.load_storage import ParsedLoadJobFileName
+
+TJobsHeapKey = Tuple[str, str]
+"""Table name and file format of new jobs kept on a single heap"""
+
+
+class PackageJobsIndex:
+    """In-memory index of job states in a single load package.
+
+    The index is built once from the package folders and then updated by the loader as it moves
+    jobs between states, so scheduling does not list the package folders on each loop iteration.
+    New jobs are kept on heaps per table and file format, with the largest files on top.
+    """
+
+    def __init__(self, storage: PackageStorage, load_id: str) -> None:
+        self.storage = storage
+        self.load_id = load_id
+        self._states: Dict[str, TPackageJobState] = {}
+        self._parsed: Dict[str, ParsedLoadJobFileName] = {}
+        self._sizes: Dict[str, int] = {}
+        self._new_jobs: Dict[TJobsHeapKey, List[Tuple[int, str]]] = {}
+        self._new_jobs_count = 0
+        for state, jobs in storage.get_load_package_jobs(load_id).items():
+            for job in jobs:
+                self._add(job, state)
+
+    @property
+    def new_jobs_count(self) -> int:
+        return self._new_jobs_count
+
+    def list_new_jobs(self) -> List[str]:
+        """Lists paths of new jobs relative to the storage root, largest first"""
+        return [
+            self._new_job_path(file_name)
+            for _, file_name in sorted(
+                (-self._sizes[file_name], file_name)
+                for file_name, state in self._states.items()
+                if state == "new_jobs"
+            )
+        ]
+
+    def list_all_jobs_with_states(
+        self,
+    ) -> Sequence[Tuple[TPackageJobState, ParsedLoadJobFileName]]:
+        """Same as `PackageStorage.list_all_jobs_with_states` but without reaching to storage"""
+        return [(state, self._parsed[file_name]) for file_name, state in self._states.items()]
+
+    def import_job(self, file_name: str, state: TPackageJobState = "new_jobs") -> None:
+        """Adds a job that was imported into the package ie. a followup job"""
+        self._add(ParsedLoadJobFileName.parse(file_name), state)
+
+    def move_job(
+        self, file_name: str, state: TPackageJobState, new_file_name: Optional[str] = None
+    ) -> None:
+        """Moves job `file_name` to `state`, optionally renaming it ie. when retry count increases"""
+        size = self._sizes.get(file_name)
+        self._remove(file_name)
+        new_file_name = new_file_name or file_name
+        self._add(ParsedLoadJobFileName.parse(new_file_name), state, size)
+
+    def pick_new_jobs(
+        self,
+        available_slots: int,
+        running_jobs: Sequence[ParsedLoadJobFileName],
+        max_jobs_per_table: Optional[int] = None,
+        max_jobs_per_file_format: Optional[Dict[str, int]] = None,
+    ) -> List[str]:
+        """Picks up to `available_slots` new jobs, largest files first, so the number of running jobs
+        per table does not exceed `max_jobs_per_table` and the number of running jobs per file format
+        does not exceed the limits in `max_jobs_per_file_format`.
+
+        Returns paths of picked jobs relative to the storage root. Picked jobs are removed from the
+        new jobs heaps and are expected to be started right away.
+        """
+        max_jobs_per_file_format = max_jobs_per_file_format or {}
+        running_tables = Counter(job.table_name for job in running_jobs)
+        running_formats = Counter(job.file_format for job in running_jobs)
+
+        def _is_blocked(key: TJobsHeapKey) -> bool:
+            table_name, file_format = key
+            if max_jobs_per_table is not None and running_tables[table_name] >= max_jobs_per_table:
+                return True
+            max_format = max_jobs_per_file_format.get(file_format)
+            return max_format is not None and running_formats[file_format] >= max_format
+
+        # heap with the largest job of each table and file format that is not blocked
+        heads: List[Tuple[int, str, TJobsHeapKey]] = []
+        for key in list(self._new_jobs):
+            if not _is_blocked(key) and (head := self._peek(key)):
+                heads.append(head + (key,))
+        heapq.heapify(heads)
+
+        picked: List[str] = []
+        while heads and len(picked) < available_slots:
+            _, file_name, key = heapq.heappop(heads)
+            # counters change as jobs are picked
+            if _is_blocked(key):
+                continue
+            heapq.heappop(self._new_jobs[key])
+            picked.append(self._new_job_path(file_name))
+            running_tables[key[0]] += 1
+            running_formats[key[1]] += 1
+            if head := self._peek(key):
+                heapq.heappush(heads, head + (key,))
+        return picked
+
+    def _new_job_path(self, file_name: str) -> str:
+        return self.storage.get_job_file_path(self.load_id, "new_jobs", file_name)
+
+    def _peek(self, key: TJobsHeapKey) -> Optional[Tuple[int, str]]:
+        """Returns the largest job on the heap under `key`, dropping jobs that are no longer new"""
+        heap = self._new_jobs[key]
+        while heap and self._states.get(heap[0][1]) != "new_jobs":
+            heapq.heappop(heap)
+        if not heap:
+            del self._new_jobs[key]
+            return None
+        return heap[0]
+
+    def _add(
+        self, job: ParsedLoadJobFileName, state: TPackageJobState, size: Optional[int] = None
+    ) -> None:
+        file_name = job.file_name()
+        self._states[file_name] = state
+        self._parsed[file_name] = job
+        if state == "new_jobs" and size is None:
+            size = os.path.getsize(
+                self.storage.storage.make_full_path(self._new_job_path(file_name))
+            )
+        if size is not None:
+            self._sizes[file_name] = size
+        if state == "new_jobs":
+            heapq.heappush(
+                self._new_jobs.setdefault((job.table_name, job.file_format), []),
+                (-size, file_name),
+            )
+            self._new_jobs_count += 1
+
+    def _remove(self, file_name: str) -> None:
+        # jobs left on new jobs heaps are dropped when peeked
+        if self._states.pop(file_name, None) == "new_jobs":
+            self._new_jobs_count -= 1
+        self._parsed.pop(file_name, None)
+        self._sizes.pop(file_name, None)
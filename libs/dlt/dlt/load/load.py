@@ -1,3 +1,4 @@
+import os
 import contextlib
 from functools import reduce
 from threading import BoundedSemaphore
@@ -18,6 +19,7 @@ from dlt.common.storages.load_storage import (
 )
 from dlt.common.storages.load_package import (
     LoadPackageStateInjectableContext,
+    TPackageJobState,
     load_package_state as current_load_package,
 )
 from dlt.common.runners import TRunMetrics, Runnable, workermethod, NullExecutor
@@ -26,6 +28,7 @@ from dlt.common.logger import pretty_format_exception
 from dlt.common.configuration.container import Container
 from dlt.common.schema import Schema
 from dlt.common.storages import LoadStorage
+from dlt.common.storages.exceptions import JobFileFormatUnsupported
 from dlt.common.destination import DestinationReference, AnyDestination, Destination
 from dlt.common.destination.client import (
     DestinationClientDwhConfiguration,
@@ -47,6 +50,7 @@ from dlt.common.runtime import signals
 from dlt.destinations.job_impl import FinalizedLoadJobWithFollowupJobs
 
 from dlt.load.configuration import LoaderConfiguration
+from dlt.load.jobs_index import PackageJobsIndex
 from dlt.load.exceptions import (
     LoadClientJobFailed,
     LoadClientJobRetry,
@@ -60,7 +64,7 @@ from dlt.load.utils import (
     _extend_tables_with_table_chain,
     get_completed_table_chain,
     init_client,
-    filter_new_jobs,
+    pick_new_jobs,
     get_available_worker_slots,
 )
 
@@ -89,6 +93,8 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
         self.load_storage: LoadStorage = self.create_storage(is_storage_owner)
         self._loaded_packages: List[LoadPackageInfo] = []
         self._job_metrics: Dict[str, LoadJobMetrics] = {}
+        # in-memory index of job states of the package being loaded
+        self._jobs_index: Optional[PackageJobsIndex] = None
         # job completed signalling event (start blocking)
         self._done_event = BoundedSemaphore()
         self._done_event.acquire()
@@ -215,6 +221,7 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
             job._file_path = self.load_storage.normalized_packages.start_job(
                 load_id, job.file_name()
             )
+            self._update_jobs_index(load_id, job.file_name(), "started_jobs")
 
         # only start a thread if this job is runnable
         if isinstance(job, RunnableLoadJob):
@@ -265,8 +272,8 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
             return []
 
         # get a list of jobs eligible to be started
-        load_files = filter_new_jobs(
-            self.load_storage.list_new_jobs(load_id),
+        load_files = pick_new_jobs(
+            self.get_jobs_index(load_id),
             caps,
             self.config,
             running_jobs,
@@ -303,9 +310,32 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
     def get_new_jobs_info(self, load_id: str) -> List[ParsedLoadJobFileName]:
         return [
             ParsedLoadJobFileName.parse(job_file)
-            for job_file in self.load_storage.list_new_jobs(load_id)
+            for job_file in self.get_jobs_index(load_id).list_new_jobs()
         ]
 
+    def get_jobs_index(self, load_id: str) -> PackageJobsIndex:
+        """Gets in-memory index of job states for package `load_id`, builds it from storage on first use"""
+        if self._jobs_index is None or self._jobs_index.load_id != load_id:
+            jobs_index = PackageJobsIndex(self.load_storage.normalized_packages, load_id)
+            # make sure all jobs have supported writers
+            supported_formats = self.load_storage.supported_job_file_formats
+            for job_path in jobs_index.list_new_jobs():
+                if ParsedLoadJobFileName.parse(job_path).file_format not in supported_formats:
+                    raise JobFileFormatUnsupported(load_id, supported_formats, job_path)
+            self._jobs_index = jobs_index
+        return self._jobs_index
+
+    def _update_jobs_index(
+        self,
+        load_id: str,
+        file_name: str,
+        state: TPackageJobState,
+        new_file_name: Optional[str] = None,
+    ) -> None:
+        # index is updated only if it was built, otherwise it will be built from storage
+        if self._jobs_index is not None and self._jobs_index.load_id == load_id:
+            self._jobs_index.move_job(file_name, state, new_file_name)
+
     def create_followup_jobs(
         self, load_id: str, state: TLoadJobState, starting_job: LoadJob, schema: Schema
     ) -> None:
@@ -325,9 +355,7 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
                     schema.tables, starting_job.job_file_info().table_name
                 )
                 # if all tables of chain completed, create follow up jobs
-                all_jobs_states = self.load_storage.normalized_packages.list_all_jobs_with_states(
-                    load_id
-                )
+                all_jobs_states = self.get_jobs_index(load_id).list_all_jobs_with_states()
                 if table_chain := get_completed_table_chain(
                     schema, all_jobs_states, root_job_table, starting_job.job_file_info().job_id()
                 ):
@@ -363,11 +391,13 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
                 raise FollowupJobCreationFailedException(job_id=starting_job.job_id()) from e
 
         # import all followup jobs to the new jobs folder
+        jobs_index = self.get_jobs_index(load_id) if jobs else None
         for followup_job in jobs:
             # save all created jobs
             self.load_storage.normalized_packages.import_job(
                 load_id, followup_job.new_file_path(), job_state="new_jobs"
             )
+            jobs_index.import_job(os.path.basename(followup_job.new_file_path()))
             logger.info(
                 f"Job {starting_job.job_id()} CREATED a new FOLLOWUP JOB"
                 f" {followup_job.new_file_path()} placed in new_jobs"
@@ -431,6 +461,7 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
                 self.load_storage.normalized_packages.fail_job(
                     load_id, job.file_name(), failed_message
                 )
+                self._update_jobs_index(load_id, job.file_name(), "failed_jobs")
                 logger.error(
                     f"Job for {job.job_id()} failed terminally in load {load_id} with message"
                     f" {failed_message}"
@@ -447,7 +478,12 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
                 # try to get exception message from job
                 retry_message = job.exception()
                 # move back to new folder to try again
-                self.load_storage.normalized_packages.retry_job(load_id, job.file_name())
+                retry_path = self.load_storage.normalized_packages.retry_job(
+                    load_id, job.file_name()
+                )
+                self._update_jobs_index(
+                    load_id, job.file_name(), "new_jobs", os.path.basename(retry_path)
+                )
                 logger.warning(
                     f"Job for {job.job_id()} retried in load {load_id} with message {retry_message}"
                 )
@@ -468,6 +504,7 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
                 # move to completed folder after followup jobs are created
                 # in case of exception when creating followup job, the loader will retry operation and try to complete again
                 self.load_storage.normalized_packages.complete_job(load_id, job.file_name())
+                self._update_jobs_index(load_id, job.file_name(), "completed_jobs")
                 logger.info(f"Job for {job.job_id()} completed in load {load_id}")
                 finalized_jobs.append(job)
             else:
@@ -580,6 +617,11 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
             )
 
     def load_single_package(self, load_id: str, schema: Schema) -> None:
+        if self.load_storage.config.jobs_journal:
+            # job files stay in place, state transitions go to the journal
+            self.load_storage.normalized_packages.create_jobs_journal(load_id)
+        # build jobs index from storage once, it is kept up to date when jobs move
+        self._jobs_index = None
         new_jobs = self.get_new_jobs_info(load_id)
         self.init_jobs_counter(load_id)
         running_jobs = self.initialize_package(load_id, schema, new_jobs)
@@ -624,7 +666,7 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
             else:
                 break
 
-        remaining_jobs = self.load_storage.list_new_jobs(load_id)
+        remaining_jobs = self.get_jobs_index(load_id).list_new_jobs()
         # if a pending exception was discovered during completion of jobs
         # we can raise it now
         if pending_exception:
@@ -14,6 +14,7 @@ from dlt.common.schema import Schema, TSchemaTables
 from dlt.common.schema.typing import TTableSchema
 from dlt.common.destination.client import JobClientBase, WithStagingDataset, LoadJob
 from dlt.load.configuration import LoaderConfiguration
+from dlt.load.jobs_index import PackageJobsIndex
 from dlt.common.destination import DestinationCapabilitiesContext
 
 
@@ -248,45 +249,28 @@ def get_available_worker_slots(
     return max(0, max_workers - len(running_jobs))
 
 
-def filter_new_jobs(
-    file_names: Sequence[str],
+def pick_new_jobs(
+    jobs_index: PackageJobsIndex,
     capabilities: DestinationCapabilitiesContext,
     config: LoaderConfiguration,
     running_jobs: Sequence[LoadJob],
     available_slots: int,
 ) -> Sequence[str]:
-    """Filters the list of new jobs to adhere to max_workers and parallellism strategy"""
-    """NOTE: in the current setup we only filter based on settings for the final destination"""
-    """Support for differentiating staging destination jobs might come in the future if we need it"""
-
-    # nothing to do
-    if not file_names:
-        return file_names
+    """Picks new jobs from `jobs_index`, largest files first, to adhere to max_workers, parallelism strategy
+    and per table and per file format limits. Picked jobs must be started.
+    """
+    if available_slots <= 0:
+        return []
 
-    # config can overwrite destination settings, if nothing is set, code below defaults to parallel
     parallelism_strategy = config.parallelism_strategy or capabilities.loader_parallelism_strategy
-
-    # regular sequential works on all jobs
-    eligible_jobs = file_names
-
+    max_jobs_per_table = config.max_parallel_jobs_per_table
     # we must ensure there only is one job per table
     if parallelism_strategy == "table-sequential":
-        # TODO later: this whole code block is a bit inefficient for long lists of jobs
-        # better would be to keep a list of loadjobinfos in the loader which we can iterate
+        max_jobs_per_table = 1
 
-        # find table names of all currently running jobs
-        running_tables = {j._parsed_file_name.table_name for j in running_jobs}
-        new_jobs: List[str] = []
-
-        for job in eligible_jobs:
-            if (table_name := ParsedLoadJobFileName.parse(job).table_name) not in running_tables:
-                running_tables.add(table_name)
-                new_jobs.append(job)
-            # exit loop if we have enough
-            if len(new_jobs) >= available_slots:
-                break
-
-        return new_jobs
-
-    else:
-        return eligible_jobs[:available_slots]
+    return jobs_index.pick_new_jobs(
+        available_slots,
+        [job.job_file_info() for job in running_jobs],
+        max_jobs_per_table=max_jobs_per_table,
+        max_jobs_per_file_format=config.max_parallel_jobs_per_file_format,
+    )
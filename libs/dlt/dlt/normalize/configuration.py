@@ -19,15 +19,24 @@ class ItemsNormalizerConfiguration(BaseConfiguration):
     """When true, items to be normalized will have `_dlt_load_id` column added with the current load ID."""
 
 
+@configspec
+class JsonNormalizerConfiguration(ItemsNormalizerConfiguration):
+    columnar: bool = False
+    """When true, json items written to parquet are normalized in arrow record batches. Only chunks
+    that fit the existing schema are normalized this way, other chunks fall back to row-wise normalization."""
+
+
 @configspec
 class NormalizeConfiguration(PoolRunnerConfiguration):
     pool_type: TPoolType = "process"
+    work_units_per_worker: int = 4
+    """Number of work units per worker that files are split into by size. Idle workers pick up the next unit."""
     destination_capabilities: DestinationCapabilitiesContext = None  # injectable
     _schema_storage_config: SchemaStorageConfiguration = None
     _normalize_storage_config: NormalizeStorageConfiguration = None
     _load_storage_config: LoadStorageConfiguration = None
 
-    json_normalizer: ItemsNormalizerConfiguration = ItemsNormalizerConfiguration(
+    json_normalizer: JsonNormalizerConfiguration = JsonNormalizerConfiguration(
         add_dlt_id=True, add_dlt_load_id=True
     )
 
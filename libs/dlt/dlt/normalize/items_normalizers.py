@@ -1,5 +1,6 @@
-from copy import copy
-from typing import List, Dict, Sequence, Set, Any, Optional, Tuple
+import itertools
+from copy import copy, deepcopy
+from typing import List, Dict, MutableMapping, Sequence, Set, Any, Optional, Tuple
 from abc import abstractmethod
 from functools import lru_cache
 
@@ -15,7 +16,11 @@ from dlt.common.data_writers.writers import ArrowToObjectAdapter
 from dlt.common.json import custom_pua_decode, may_have_pua
 from dlt.common.metrics import DataWriterMetrics
 from dlt.common.normalizers.json.relational import DataItemNormalizer as RelationalNormalizer
-from dlt.common.normalizers.json.helpers import get_root_row_id_type
+from dlt.common.normalizers.json.helpers import (
+    get_nested_row_hash,
+    get_propagation_mapping,
+    get_root_row_id_type,
+)
 from dlt.common.runtime import signals
 from dlt.common.schema import utils
 from dlt.common.schema.typing import (
@@ -58,6 +63,15 @@ except MissingDependencyException:
 
 DLT_SUBQUERY_NAME = "_dlt_subquery"
 
+TCoercionPlan = List[Tuple[str, TDataType, bool, Optional[bool]]]
+"""Column name, data type, nullable and timezone (only for timestamps) for each of the row fields"""
+_PASSTHROUGH_TYPES: Dict[type, TDataType] = {
+    str: "text",
+    int: "bigint",
+    float: "double",
+    bool: "bool",
+}
+
 
 class ItemsNormalizer:
     def __init__(
@@ -67,6 +81,7 @@ class ItemsNormalizer:
         schema: Schema,
         load_id: str,
         config: NormalizeConfiguration,
+        shared_column_types: MutableMapping[Tuple[str, str], TDataType] = None,
     ) -> None:
         self.item_storage = item_storage
         self.normalize_storage = normalize_storage
@@ -74,6 +89,8 @@ class ItemsNormalizer:
         self.load_id = load_id
         self.config = config
         self.naming = self.schema.naming
+        self.shared_column_types = shared_column_types
+        """Data types of new columns agreed between workers normalizing the same package"""
 
     @abstractmethod
     def __call__(self, extracted_items_file: str, root_table_name: str) -> List[TSchemaUpdate]: ...
@@ -374,6 +391,11 @@ class ModelItemsNormalizer(ItemsNormalizer):
 
 
 class JsonLItemsNormalizer(ItemsNormalizer):
+    READ_CHUNK_SIZE = 1024 * 1024
+    """Approximate number of bytes of extracted lines that are decoded and normalized together"""
+    MAX_COERCION_PLANS = 1024
+    """Maximum number of compiled coercion plans (distinct sets of row fields) kept per table"""
+
     def __init__(
         self,
         item_storage: DataItemStorage,
@@ -381,8 +403,11 @@ class JsonLItemsNormalizer(ItemsNormalizer):
         schema: Schema,
         load_id: str,
         config: NormalizeConfiguration,
+        shared_column_types: MutableMapping[Tuple[str, str], TDataType] = None,
     ) -> None:
-        super().__init__(item_storage, normalize_storage, schema, load_id, config)
+        super().__init__(
+            item_storage, normalize_storage, schema, load_id, config, shared_column_types
+        )
         self._table_contracts: Dict[str, TSchemaContractDict] = {}
         self._filtered_tables: Set[str] = set()
         self._filtered_tables_columns: Dict[str, Dict[str, TSchemaEvolutionMode]] = {}
@@ -392,6 +417,8 @@ class JsonLItemsNormalizer(ItemsNormalizer):
         self._shorten_fragments = lru_cache(maxsize=None)(self.schema.naming.shorten_fragments)
         self._check_table_exists = lru_cache(maxsize=None)(self._check_if_table_exists_impl)
         self._check_flattened_to_cols = lru_cache(maxsize=None)(self._check_if_flattened_impl)
+        # compiled coercion plans per table and row field names
+        self._coercion_plans: Dict[str, Dict[Tuple[str, ...], Optional[TCoercionPlan]]] = {}
 
     def _filter_columns(
         self, filtered_columns: Dict[str, TSchemaEvolutionMode], row: DictStrAny
@@ -489,6 +516,8 @@ class JsonLItemsNormalizer(ItemsNormalizer):
                         # theres a new table or new columns in existing table
                         # update schema and save the change
                         schema.update_table(partial_table, normalize_identifiers=False)
+                        # columns changed so compiled plans are stale
+                        self._coercion_plans.pop(table_name, None)
                         table_updates = schema_update.setdefault(table_name, [])
                         table_updates.append(partial_table)
 
@@ -535,6 +564,11 @@ class JsonLItemsNormalizer(ItemsNormalizer):
 
         Returns tuple with row with coerced values and a partial table containing just the newly added columns or None if no changes were detected
         """
+        # fast path: all fields are complete columns, use plan compiled for those fields
+        if plan := self._get_coercion_plan(table_name, row):
+            new_row = self._coerce_row_with_plan(plan, row)
+            if new_row is not None:
+                return new_row, None
         # get existing or create a new table
         updated_table_partial: TPartialTableSchema = None
         table = self.schema._schema_tables.get(table_name)
@@ -564,6 +598,67 @@ class JsonLItemsNormalizer(ItemsNormalizer):
 
         return new_row, updated_table_partial
 
+    def _get_coercion_plan(self, table_name: str, row: StrAny) -> Optional[TCoercionPlan]:
+        table_plans = self._coercion_plans.get(table_name)
+        if table_plans is None:
+            table_plans = self._coercion_plans[table_name] = {}
+        field_names = tuple(row)
+        try:
+            return table_plans[field_names]
+        except KeyError:
+            # do not let sparse data grow the cache without limits
+            if len(table_plans) >= self.MAX_COERCION_PLANS:
+                table_plans.clear()
+            plan = table_plans[field_names] = self._compile_coercion_plan(table_name, field_names)
+            return plan
+
+    def _compile_coercion_plan(
+        self, table_name: str, field_names: Tuple[str, ...]
+    ) -> Optional[TCoercionPlan]:
+        """Compiles a list of (column name, data type, nullable, timezone) for `field_names`. Returns
+        None if any of the fields is not a complete column in `table_name` and needs inference.
+        """
+        table = self.schema._schema_tables.get(table_name)
+        if not table:
+            return None
+        table_columns = table["columns"]
+        plan: TCoercionPlan = []
+        for col_name in field_names:
+            column = table_columns.get(col_name)
+            if not column or not utils.is_complete_column(column):
+                return None
+            data_type = column["data_type"]
+            timezone = column.get("timezone", True) if data_type == "timestamp" else None
+            plan.append((col_name, data_type, utils.is_nullable_column(column), timezone))
+        return plan
+
+    @staticmethod
+    def _coerce_row_with_plan(plan: TCoercionPlan, row: StrAny) -> Optional[DictStrAny]:
+        """Coerces `row` with compiled `plan`. Returns None if any of the values needs a new
+        column, a variant or raises so the row must be coerced on the slow path.
+        """
+        new_row: DictStrAny = {}
+        for (col_name, col_type, nullable, timezone), v in zip(plan, row.values()):
+            if v is None:
+                if not nullable:
+                    return None
+                continue
+            tv = type(v)
+            # skip coercion for basic python types that match the column
+            if _PASSTHROUGH_TYPES.get(tv) == col_type:
+                new_row[col_name] = v
+                continue
+            try:
+                coerced_v = coerce_value(col_type, py_type_to_sc_type(tv), v)
+            except (ValueError, SyntaxError, TypeError):
+                return None
+            if callable(coerced_v):
+                return None
+            if timezone is not None:
+                coerced_v = normalize_timezone(coerced_v, timezone)
+            new_row[col_name] = coerced_v
+        return new_row
+
     def _infer_column(
         self,
         k: str,
@@ -692,11 +787,14 @@ class JsonLItemsNormalizer(ItemsNormalizer):
             existing_column = None
 
         # infer type or get it from existing table
-        col_type = (
-            existing_column["data_type"]
-            if existing_column
-            else self._infer_column_type(v, col_name, skip_preferred=is_variant)
-        )
+        if existing_column:
+            col_type = existing_column["data_type"]
+        else:
+            col_type = self._infer_column_type(v, col_name, skip_preferred=is_variant)
+            if self.shared_column_types is not None:
+                # first worker that sees a new column decides its data type, other workers
+                # coerce into it or create variants so their schema updates do not conflict
+                col_type = self.shared_column_types.setdefault((table_name, col_name), col_type)
         # get data type of value
         py_type = py_type_to_sc_type(type(v))
         # and coerce type if inference changed the python type
@@ -828,28 +926,33 @@ class JsonLItemsNormalizer(ItemsNormalizer):
         extracted_items_file: str,
         root_table_name: str,
     ) -> List[TSchemaUpdate]:
-        schema_updates: List[TSchemaUpdate] = []
+        # partial tables from all chunks are collected in a single update
+        schema_update: TSchemaUpdate = {}
         with self.normalize_storage.extracted_packages.storage.open_file(
             extracted_items_file, "rb"
         ) as f:
-            # enumerate jsonl file line by line
-            line: bytes = None
-            for line_no, line in enumerate(f):
-                items: List[TDataItem] = json.loadb(line)
+            lines_count = 0
+            # read many lines at once, up to the chunk size
+            while lines := f.readlines(self.READ_CHUNK_SIZE):
+                lines_count += len(lines)
+                # each line is a list of items, decode all lines in a single call
+                chunk = b"[" + b",".join(line for line in lines if line.strip()) + b"]"
+                items: List[TDataItem] = list(itertools.chain.from_iterable(json.loadb(chunk)))
+                # scan for typed values once per chunk
                 partial_update = self._normalize_chunk(
-                    root_table_name, items, may_have_pua(line), skip_write=False
+                    root_table_name, items, may_have_pua(chunk), skip_write=False
                 )
-                schema_updates.append(partial_update)
-                logger.debug(f"Processed {line_no+1} lines from file {extracted_items_file}")
+                self._merge_schema_update(schema_update, partial_update)
+                logger.debug(f"Processed {lines_count} lines from file {extracted_items_file}")
             # empty json files are when replace write disposition is used in order to truncate table(s)
-            if line is None and root_table_name in self.schema.tables:
+            if lines_count == 0 and root_table_name in self.schema.tables:
                 root_table = self.schema.tables[root_table_name]
                 if not has_table_seen_data(root_table):
                     # if this is a new table, add normalizer columns
                     partial_update = self._normalize_chunk(
                         root_table_name, [{}], False, skip_write=True
                     )
-                    schema_updates.append(partial_update)
+                    self._merge_schema_update(schema_update, partial_update)
                 self.item_storage.write_empty_items_file(
                     self.load_id,
                     self.schema.name,
@@ -860,7 +963,254 @@ class JsonLItemsNormalizer(ItemsNormalizer):
                     f"No lines in file {extracted_items_file}, written empty load job file"
                 )
 
-        return schema_updates
+        return [schema_update]
+
+    def _merge_schema_update(self, schema_update: TSchemaUpdate, partial_update: TSchemaUpdate) -> None:
+        """Merges `partial_update` into `schema_update` keeping a single partial table per table name"""
+        for table_name, partial_tables in partial_update.items():
+            for partial_table in partial_tables:
+                if table_name in schema_update:
+                    utils.merge_table(self.schema.name, schema_update[table_name][0], partial_table)
+                else:
+                    # partial table may be stored in the schema, do not modify it in place
+                    schema_update[table_name] = [deepcopy(partial_table)]
+
+
+class _ColumnarFallback(Exception):
+    """Raised when a chunk cannot be normalized column-wise"""
+
+
+class ColumnarJsonLItemsNormalizer(JsonLItemsNormalizer):
+    """Normalizes chunks of json items as arrow record batches and writes them to parquet.
+
+    Flattening, unnesting into nested tables, row id generation and type checks are done on
+    whole columns. A chunk is normalized this way only if it fits the existing schema: all tables
+    and columns exist, data types match and no filters, contracts or typed (pua) values are
+    involved. Any other chunk is normalized row by row by `JsonLItemsNormalizer`, so the
+    results are identical.
+    """
+
+    def _normalize_chunk(
+        self, root_table_name: str, items: List[TDataItem], may_have_pua: bool, skip_write: bool
+    ) -> TSchemaUpdate:
+        if not skip_write and not may_have_pua:
+            try:
+                tables = self._normalize_chunk_columnar(root_table_name, items)
+            except _ColumnarFallback as fallback:
+                logger.debug(
+                    f"Chunk of {len(items)} items in {root_table_name} will be normalized row by"
+                    f" row: {fallback}"
+                )
+            else:
+                for table_name, columns in tables.items():
+                    self.item_storage.write_data_item(
+                        self.load_id,
+                        self.schema.name,
+                        table_name,
+                        pa.Table.from_pydict(columns),
+                        self._get_column_schemas(table_name),
+                    )
+                signals.raise_if_signalled()
+                return {}
+        return super()._normalize_chunk(root_table_name, items, may_have_pua, skip_write)
+
+    def _get_column_schemas(self, table_name: str) -> TTableSchemaColumns:
+        columns = self._column_schemas.get(table_name)
+        if not columns:
+            columns = self.schema.get_table_columns(table_name)
+            self._column_schemas[table_name] = columns
+        return columns
+
+    def _normalize_chunk_columnar(
+        self, root_table_name: str, items: List[TDataItem]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Normalizes `items` into arrow columns of all tables. Raises `_ColumnarFallback`
+        if any of the rows would change the schema or needs row-wise processing."""
+        schema = self.schema
+        normalizer = schema.data_item_normalizer
+        if type(normalizer) is not RelationalNormalizer:
+            raise _ColumnarFallback("custom json normalizer")
+        if schema._compiled_excludes or self._filtered_tables or self._filtered_tables_columns:
+            raise _ColumnarFallback("row filters")
+        if normalizer._get_root_row_id_type(root_table_name) != "random":
+            raise _ColumnarFallback("deterministic row ids")
+        if not items or not all(isinstance(item, dict) for item in items):
+            raise _ColumnarFallback("non dict items")
+        try:
+            struct = pa.array(items)
+        except (pa.ArrowException, OverflowError, TypeError, ValueError) as ex:
+            raise _ColumnarFallback(f"arrow type inference failed: {ex}")
+
+        normalizer._load_id = self.load_id
+        tables: Dict[str, Dict[str, Any]] = {}
+        self._normalize_table_columnar(
+            tables,
+            (),
+            (root_table_name,),
+            struct,
+            normalizer._get_table_nesting_level(root_table_name, normalizer.max_nesting),
+            None,
+            {},
+        )
+        return tables
+
+    def _normalize_table_columnar(
+        self,
+        tables: Dict[str, Dict[str, Any]],
+        parent_path: Tuple[str, ...],
+        ident_path: Tuple[str, ...],
+        values: Any,
+        r_lvl: int,
+        link: Optional[Tuple[List[str], List[int]]],
+        extend: Dict[str, Any],
+    ) -> None:
+        """Column-wise equivalent of `DataItemNormalizer._normalize_row`. `values` is a struct
+        array of rows or a plain array of values to be wrapped. `link` holds parent row id and
+        list position of each row in nested tables."""
+        normalizer: RelationalNormalizer = self.schema.data_item_normalizer  # type: ignore[assignment]
+        table_name = normalizer._shorten_fragments(*parent_path, *ident_path)
+        is_root = link is None
+        if not is_root and not normalizer._should_be_nested(table_name):
+            raise _ColumnarFallback(f"{table_name} is not a nested table")
+        if table_name in tables:
+            raise _ColumnarFallback(f"{table_name} reached via several paths")
+        if table_name not in self._full_ident_path_tracker:
+            self._full_ident_path_tracker[table_name] = parent_path + ident_path
+
+        columns: Dict[str, Any] = {}
+        lists: Dict[Tuple[str, ...], Any] = {}
+        if pa.types.is_struct(values.type):
+            self._flatten_columnar(table_name, values, r_lvl, (), columns, lists)
+        else:
+            columns[normalizer.c_value] = values
+        columns.update(extend)
+
+        num_rows = len(values)
+        if normalizer.c_dlt_id in columns:
+            raise _ColumnarFallback("row ids present in data")
+        if is_root:
+            columns[normalizer.c_dlt_load_id] = pa.array([self.load_id] * num_rows, pa.string())
+            row_ids = generate_dlt_ids(num_rows)
+        else:
+            parent_row_ids, list_idx = link
+            row_ids = [
+                get_nested_row_hash(parent_row_id, table_name, idx)
+                for parent_row_id, idx in zip(parent_row_ids, list_idx)
+            ]
+            columns[normalizer.c_dlt_parent_id] = pa.array(parent_row_ids, pa.string())
+            columns[normalizer.c_dlt_list_idx] = pa.array(list_idx, pa.int64())
+        columns[normalizer.c_dlt_id] = pa.array(row_ids, pa.string())
+
+        # only propagation from the root table is supported
+        nested_extend = dict(extend)
+        if normalizer.propagation_config:
+            mappings = get_propagation_mapping(normalizer.propagation_config, table_name, is_root)
+            if mappings and not is_root:
+                raise _ColumnarFallback(f"{table_name} propagates values")
+            for prop_from, prop_as in mappings.items():
+                if prop_from in columns:
+                    nested_extend[prop_as] = columns[prop_from]
+
+        self._check_columns_columnar(table_name, columns)
+        tables[table_name] = columns
+
+        for list_path, list_values in lists.items():
+            child_values = list_values.flatten()
+            if len(child_values) == 0:
+                continue
+            if pa.types.is_list(child_values.type):
+                raise _ColumnarFallback("list of lists")
+            if pa.types.is_struct(child_values.type) and child_values.null_count:
+                raise _ColumnarFallback("list of dicts with null elements")
+            parent_indices = pa.compute.list_parent_indices(list_values)
+            child_list_idx = [
+                idx
+                for length in pa.compute.list_value_length(list_values).to_pylist()
+                if length
+                for idx in range(length)
+            ]
+            self._normalize_table_columnar(
+                tables,
+                parent_path + ident_path,
+                list_path,
+                child_values,
+                r_lvl - 1,
+                ([row_ids[i] for i in parent_indices.to_pylist()], child_list_idx),
+                {k: v.take(parent_indices) for k, v in nested_extend.items()},
+            )
+
+    def _flatten_columnar(
+        self,
+        table_name: str,
+        struct: Any,
+        r_lvl: int,
+        path: Tuple[str, ...],
+        columns: Dict[str, Any],
+        lists: Dict[Tuple[str, ...], Any],
+    ) -> None:
+        """Column-wise equivalent of `DataItemNormalizer._flatten`"""
+        normalizer: RelationalNormalizer = self.schema.data_item_normalizer  # type: ignore[assignment]
+        # flatten() propagates nulls of the parent struct into the fields
+        for field, field_values in zip(struct.type, struct.flatten()):
+            k = field.name
+            if k.strip():
+                norm_k = normalizer._normalize_identifier(k)
+            else:
+                norm_k = normalizer.EMPTY_KEY_IDENTIFIER
+            nested_name = norm_k if path == () else normalizer._shorten_fragments(*path, norm_k)
+            if pa.types.is_struct(field_values.type) or pa.types.is_list(field_values.type):
+                if normalizer._is_nested_type(table_name, nested_name, r_lvl):
+                    raise _ColumnarFallback(f"{nested_name} is a json column")
+                if pa.types.is_struct(field_values.type):
+                    self._flatten_columnar(
+                        table_name, field_values, r_lvl - 1, path + (norm_k,), columns, lists
+                    )
+                else:
+                    list_path = path + (normalizer._normalize_table_identifier(k),)
+                    if list_path in lists:
+                        raise _ColumnarFallback(f"duplicate nested table {list_path}")
+                    lists[list_path] = field_values
+                continue
+            if nested_name in columns:
+                raise _ColumnarFallback(f"duplicate column {nested_name}")
+            columns[nested_name] = field_values
+
+    def _check_columns_columnar(self, table_name: str, columns: Dict[str, Any]) -> None:
+        """Makes sure that `columns` fit the existing table schema without coercion"""
+        table = self.schema._schema_tables.get(table_name)
+        if not table:
+            raise _ColumnarFallback(f"new table {table_name}")
+        table_columns = table["columns"]
+        for col_name in list(columns):
+            values = columns[col_name]
+            column = table_columns.get(col_name)
+            if not column or not utils.is_complete_column(column):
+                if values.null_count != len(values):
+                    raise _ColumnarFallback(f"new column {col_name} in {table_name}")
+                # null only column is dropped only if row-wise coercion would not change schema
+                try:
+                    if self._coerce_null_value(table_columns, table_name, col_name):
+                        raise _ColumnarFallback(f"new column {col_name} in {table_name}")
+                except CannotCoerceNullException:
+                    raise _ColumnarFallback(f"null in not null column {col_name}")
+                columns.pop(col_name)
+                continue
+            if values.null_count and not utils.is_nullable_column(column):
+                raise _ColumnarFallback(f"null in not null column {col_name}")
+            if pa.types.is_null(values.type):
+                continue
+            data_type = pyarrow.get_column_type_from_py_arrow(values.type)["data_type"]
+            if data_type != column["data_type"] and not (
+                data_type == "bigint" and column["data_type"] == "double"
+            ):
+                raise _ColumnarFallback(f"{col_name} needs coercion to {column['data_type']}")
+        for col_name, column in table_columns.items():
+            if (
+                col_name not in columns
+                and utils.is_complete_column(column)
+                and not utils.is_nullable_column(column)
+            ):
+                raise _ColumnarFallback(f"not null column {col_name} missing")
 
 
 class ArrowItemsNormalizer(ItemsNormalizer):
@@ -1,18 +1,31 @@
 import os
+import time
 import itertools
-from typing import List, Dict, Sequence, Optional, Callable
-from concurrent.futures import Future, Executor
+import multiprocessing
+from contextlib import contextmanager
+from typing import (
+    Any,
+    List,
+    Dict,
+    Iterator,
+    MutableMapping,
+    Sequence,
+    Optional,
+    Callable,
+    Tuple,
+)
+from concurrent.futures import FIRST_COMPLETED, Future, Executor, ProcessPoolExecutor, wait
 
 from dlt.common import logger
-from dlt.common.metrics import DataWriterMetrics
-from dlt.common.runtime.signals import sleep
+from dlt.common.metrics import DataWriterMetrics, NormalizeWorkerMetrics
 from dlt.common.configuration import with_config, known_sections
 from dlt.common.configuration.accessors import config
+from dlt.common.data_types.typing import TDataType
 from dlt.common.data_writers.writers import EMPTY_DATA_WRITER_METRICS
 from dlt.common.runners import TRunMetrics, Runnable, NullExecutor
 from dlt.common.runtime import signals
 from dlt.common.runtime.collector import Collector, NULL_COLLECTOR
-from dlt.common.schema.typing import TStoredSchema, TTableSchema
+from dlt.common.schema.typing import TTableSchema
 from dlt.common.schema.utils import merge_schema_updates
 from dlt.common.storages import (
     NormalizeStorage,
@@ -33,7 +46,14 @@ from dlt.common.storages.load_package import LoadPackageInfo
 
 from dlt.normalize.configuration import NormalizeConfiguration
 from dlt.normalize.exceptions import NormalizeJobFailed
-from dlt.normalize.worker import w_normalize_files, group_worker_files, TWorkerRV
+from dlt.normalize.worker import (
+    w_normalize_files,
+    group_worker_files_by_size,
+    publish_schema_snapshot,
+    remove_schema_snapshots,
+    SchemaSnapshot,
+    TWorkerRV,
+)
 from dlt.normalize.validate import validate_and_update_schema, verify_normalized_table
 
 
@@ -82,67 +102,118 @@ class Normalize(Runnable[Executor], WithStepInfo[NormalizeMetrics, NormalizeInfo
 
     def map_parallel(self, schema: Schema, load_id: str, files: Sequence[str]) -> TWorkerRV:
         workers: int = getattr(self.pool, "_max_workers", 1)
-        chunk_files = group_worker_files(files, workers)
-        schema_dict: TStoredSchema = schema.to_dict()
-        param_chunk = [
-            (
-                self.config,
-                self.normalize_storage.config,
-                self.load_storage.config,
-                schema_dict,
-                load_id,
-                files,
-            )
-            for files in chunk_files
-        ]
+        extracted_packages = self.normalize_storage.extracted_packages
+        chunk_files = group_worker_files_by_size(
+            [
+                (file, os.path.getsize(extracted_packages.storage.make_full_path(file)))
+                for file in files
+            ],
+            workers,
+            self.config.work_units_per_worker,
+        )
+        with self._shared_column_types() as shared_column_types:
+            try:
+                schema_snapshot = self._publish_schema_snapshot(schema, load_id)
+                param_chunk = [
+                    (
+                        self.config,
+                        self.normalize_storage.config,
+                        self.load_storage.config,
+                        schema_snapshot,
+                        load_id,
+                        files,
+                        shared_column_types,
+                    )
+                    for files in chunk_files
+                ]
+                return self._run_worker_tasks(schema, load_id, param_chunk)
+            finally:
+                remove_schema_snapshots(
+                    extracted_packages.storage, extracted_packages.get_package_path(load_id)
+                )
+
+    def _run_worker_tasks(
+        self, schema: Schema, load_id: str, param_chunk: Sequence[Tuple[Any, ...]]
+    ) -> TWorkerRV:
         # return stats
-        summary = TWorkerRV([], [])
-        # push all tasks to queue
-        tasks = [(self.pool.submit(w_normalize_files, *params), params) for params in param_chunk]
+        summary = TWorkerRV([], [], [])
+        # push all work units to the pool queue, idle workers pick up the next one
+        tasks: Dict["Future[TWorkerRV]", Tuple[Any, ...]] = {
+            self.pool.submit(w_normalize_files, *params): params for params in param_chunk
+        }
 
         while len(tasks) > 0:
-            sleep(0.3)
-            # operate on copy of the list
-            for task in list(tasks):
-                pending, params = task
-                if pending.done():
-                    # collect metrics from the exception (if any)
-                    if isinstance(pending.exception(), NormalizeJobFailed):
-                        summary.file_metrics.extend(pending.exception().writer_metrics)  # type: ignore[attr-defined]
-                    # Exception in task (if any) is raised here
-                    result: TWorkerRV = pending.result()
-                    try:
-                        # gather schema from all manifests, validate consistency and combine
-                        validate_and_update_schema(schema, result[0])
-                        summary.schema_updates.extend(result.schema_updates)
-                        summary.file_metrics.extend(result.file_metrics)
-                        # update metrics
-                        self.collector.update("Files", len(result.file_metrics))
-                        self.collector.update(
-                            "Items", sum(result.file_metrics, EMPTY_DATA_WRITER_METRICS).items_count
-                        )
-                    except CannotCoerceColumnException as exc:
-                        # schema conflicts resulting from parallel executing
-                        logger.warning(
-                            f"Parallel schema update conflict, retrying task ({str(exc)}"
-                        )
-                        # delete all files produced by the task
-                        for metrics in result.file_metrics:
-                            os.remove(metrics.file_path)
-                        # schedule the task again
-                        schema_dict = schema.to_dict()
-                        # TODO: it's time for a named tuple
-                        params = params[:3] + (schema_dict,) + params[4:]
-                        retry_pending: Future[TWorkerRV] = self.pool.submit(
-                            w_normalize_files, *params
+            # wake up as soon as any task completes, time out only to check signals
+            done, _ = wait(tasks, timeout=1.0, return_when=FIRST_COMPLETED)
+            signals.raise_if_signalled()
+            for pending in done:
+                params = tasks.pop(pending)
+                # collect metrics from the exception (if any)
+                if isinstance(pending.exception(), NormalizeJobFailed):
+                    summary.file_metrics.extend(pending.exception().writer_metrics)  # type: ignore[attr-defined]
+                # Exception in task (if any) is raised here
+                result: TWorkerRV = pending.result()
+                try:
+                    # gather schema from all manifests, validate consistency and combine
+                    validate_and_update_schema(schema, result[0])
+                    summary.schema_updates.extend(result.schema_updates)
+                    summary.file_metrics.extend(result.file_metrics)
+                    summary.worker_metrics.extend(result.worker_metrics)
+                    # update metrics
+                    self.collector.update("Files", len(result.file_metrics))
+                    self.collector.update(
+                        "Items", sum(result.file_metrics, EMPTY_DATA_WRITER_METRICS).items_count
+                    )
+                except CannotCoerceColumnException as exc:
+                    # schema conflicts resulting from parallel executing
+                    logger.warning(f"Parallel schema update conflict, retrying task ({str(exc)}")
+                    # delete all files produced by the task
+                    for metrics in result.file_metrics:
+                        os.remove(metrics.file_path)
+                    # count thrown away work
+                    discarded_items_count = sum(
+                        result.file_metrics, EMPTY_DATA_WRITER_METRICS
+                    ).items_count
+                    summary.worker_metrics.extend(
+                        task_metrics._replace(
+                            discarded_tasks_count=task_metrics.tasks_count,
+                            discarded_items_count=discarded_items_count,
                         )
-                        tasks.append((retry_pending, params))
-                    # remove finished tasks
-                    tasks.remove(task)
-                logger.debug(f"{len(tasks)} tasks still remaining for {load_id}...")
+                        for task_metrics in result.worker_metrics
+                    )
+                    # schedule the task again
+                    schema_snapshot = self._publish_schema_snapshot(schema, load_id)
+                    # TODO: it's time for a named tuple
+                    params = params[:3] + (schema_snapshot,) + params[4:]
+                    retry_pending: Future[TWorkerRV] = self.pool.submit(w_normalize_files, *params)
+                    tasks[retry_pending] = params
+            logger.debug(f"{len(tasks)} tasks still remaining for {load_id}...")
 
         return summary
 
+    def _publish_schema_snapshot(self, schema: Schema, load_id: str) -> SchemaSnapshot:
+        """Publishes current `schema` in the extracted package so workers do not receive it with each task"""
+        extracted_packages = self.normalize_storage.extracted_packages
+        return publish_schema_snapshot(
+            extracted_packages.storage,
+            extracted_packages.get_package_path(load_id),
+            schema.to_dict(),
+        )
+
+    @contextmanager
+    def _shared_column_types(self) -> Iterator[MutableMapping[Tuple[str, str], TDataType]]:
+        """Provides a mapping where workers record data types of new columns so the first worker
+        that sees a column decides its type for all the others
+        """
+        if isinstance(self.pool, ProcessPoolExecutor):
+            # use the same start method as the pool
+            mp_context = getattr(self.pool, "_mp_context", None) or multiprocessing.get_context()
+            with mp_context.Manager() as manager:
+                yield manager.dict()
+        else:
+            # threads share the mapping directly, setdefault is atomic
+            yield {}
+
     def map_single(self, schema: Schema, load_id: str, files: Sequence[str]) -> TWorkerRV:
         result = w_normalize_files(
             self.config,
@@ -183,7 +254,9 @@ class Normalize(Runnable[Executor], WithStepInfo[NormalizeMetrics, NormalizeInfo
         self, load_id: str, schema: Schema, map_f: TMapFuncType, files: Sequence[str]
     ) -> None:
         # process files in parallel or in single thread, depending on map_f
-        schema_updates, writer_metrics = map_f(schema, load_id, files)
+        started_at = time.time()
+        schema_updates, writer_metrics, tasks_metrics = map_f(schema, load_id, files)
+        elapsed = max(time.time() - started_at, 1e-9)
         # compute metrics
         job_metrics = {ParsedLoadJobFileName.parse(m.file_path): m for m in writer_metrics}
         table_metrics: Dict[str, DataWriterMetrics] = {
@@ -231,10 +304,26 @@ class Normalize(Runnable[Executor], WithStepInfo[NormalizeMetrics, NormalizeInfo
                 "finished_at": None,
                 "job_metrics": {job.job_id(): metrics for job, metrics in job_metrics.items()},
                 "table_metrics": table_metrics,
+                "worker_metrics": self._aggregate_worker_metrics(tasks_metrics, elapsed),
             },
         )
         self._step_info_complete_load_id(load_id)
 
+    @staticmethod
+    def _aggregate_worker_metrics(
+        tasks_metrics: Sequence[NormalizeWorkerMetrics], elapsed: float
+    ) -> Dict[str, NormalizeWorkerMetrics]:
+        """Sums up metrics of all tasks executed by the same worker and computes its utilization"""
+        worker_metrics: Dict[str, NormalizeWorkerMetrics] = {}
+        for task_metrics in tasks_metrics:
+            if existing := worker_metrics.get(task_metrics.worker_id):
+                task_metrics = existing + task_metrics  # type: ignore[assignment]
+            worker_metrics[task_metrics.worker_id] = task_metrics
+        return {
+            worker_id: metrics._replace(utilization=min(metrics.busy_time / elapsed, 1.0))
+            for worker_id, metrics in worker_metrics.items()
+        }
+
     def spool_schema_files(self, load_id: str, schema: Schema, files: Sequence[str]) -> str:
         # delete existing folder for the case that this is a retry
         self.load_storage.new_packages.delete_package(load_id, not_exists_ok=True)
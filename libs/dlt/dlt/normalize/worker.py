@@ -1,4 +1,22 @@
-from typing import Callable, List, Dict, NamedTuple, Sequence, Set, Optional, Type
+import os
+import re
+import time
+import pickle
+import threading
+from functools import lru_cache
+from typing import (
+    Callable,
+    List,
+    Dict,
+    MutableMapping,
+    NamedTuple,
+    Sequence,
+    Set,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 from dlt.common import logger
 from dlt.common.configuration.container import Container
@@ -10,12 +28,13 @@ from dlt.common.data_writers import (
     is_native_writer,
 )
 from dlt.common.destination.utils import prepare_load_table
-from dlt.common.metrics import DataWriterMetrics
+from dlt.common.metrics import DataWriterMetrics, NormalizeWorkerMetrics
 from dlt.common.schema.utils import new_table
+from dlt.common.data_types.typing import TDataType
 from dlt.common.typing import TLoaderFileFormat
-from dlt.common.utils import chunks
 from dlt.common.schema.typing import TStoredSchema, TTableSchema
 from dlt.common.storages import (
+    FileStorage,
     NormalizeStorage,
     LoadStorage,
     LoadStorageConfiguration,
@@ -29,6 +48,7 @@ from dlt.normalize.configuration import NormalizeConfiguration
 from dlt.normalize.exceptions import NormalizeJobFailed
 from dlt.normalize.items_normalizers import (
     ArrowItemsNormalizer,
+    ColumnarJsonLItemsNormalizer,
     FileImportNormalizer,
     JsonLItemsNormalizer,
     ItemsNormalizer,
@@ -39,34 +59,98 @@ from dlt.normalize.items_normalizers import (
 class TWorkerRV(NamedTuple):
     schema_updates: List[TSchemaUpdate]
     file_metrics: List[DataWriterMetrics]
+    worker_metrics: List[NormalizeWorkerMetrics]
+
+
+_SCHEMA_SNAPSHOT_RE = re.compile(r"^schema\.[\w-]+\.pickle$")
+
+
+class SchemaSnapshot(NamedTuple):
+    """Stored schema published once per load package and schema version. Workers receive just
+    the reference, load the snapshot file once per process and build a private schema for each task.
+    """
+
+    version_hash: str
+    file_path: str
+
+
+def publish_schema_snapshot(
+    storage: FileStorage, package_path: str, stored_schema: TStoredSchema
+) -> SchemaSnapshot:
+    """Saves `stored_schema` in `package_path` of `storage` under its version hash"""
+    version_hash = stored_schema["version_hash"]
+    # version hash is base64 encoded, make it safe for file names
+    file_hash = version_hash.translate(str.maketrans("+/", "-_")).rstrip("=")
+    file_path = FileStorage.save_atomic(
+        storage.make_full_path(package_path),
+        f"schema.{file_hash}.pickle",
+        pickle.dumps(stored_schema, protocol=pickle.HIGHEST_PROTOCOL),
+        file_type="b",
+    )
+    return SchemaSnapshot(version_hash, file_path)
+
+
+def remove_schema_snapshots(storage: FileStorage, package_path: str) -> None:
+    """Removes all schema snapshots published in `package_path` of `storage`"""
+    for file in storage.list_folder_files(package_path):
+        if _SCHEMA_SNAPSHOT_RE.match(os.path.basename(file)):
+            storage.delete(file)
+
 
+@lru_cache(maxsize=2)
+def _read_schema_snapshot(snapshot: SchemaSnapshot) -> bytes:
+    with open(snapshot.file_path, "rb") as f:
+        return f.read()
 
-def group_worker_files(files: Sequence[str], no_groups: int) -> List[Sequence[str]]:
-    # sort files so the same tables are in the same worker
-    files = list(sorted(files))
 
-    chunk_size = max(len(files) // no_groups, 1)
-    chunk_files = list(chunks(files, chunk_size))
-    # distribute the remainder files to existing groups starting from the end
-    remainder_l = len(chunk_files) - no_groups
-    l_idx = 0
-    while remainder_l > 0:
-        idx = 0
-        for idx, file in enumerate(reversed(chunk_files.pop())):
-            chunk_files[-l_idx - idx - remainder_l].append(file)  # type: ignore
-        remainder_l -= 1
-        l_idx = idx + 1
-    return chunk_files
+def load_schema_snapshot(schema_or_snapshot: Union[TStoredSchema, SchemaSnapshot]) -> TStoredSchema:
+    """Returns a private copy of the stored schema if `schema_or_snapshot` is a snapshot"""
+    if isinstance(schema_or_snapshot, SchemaSnapshot):
+        stored_schema: TStoredSchema = pickle.loads(_read_schema_snapshot(schema_or_snapshot))
+        return stored_schema
+    return schema_or_snapshot
+
+
+def group_worker_files_by_size(
+    files_sizes: Sequence[Tuple[str, int]], no_groups: int, units_per_group: int = 4
+) -> List[List[str]]:
+    """Splits files into work units of similar total size in bytes. Aims at `units_per_group`
+    units per each of `no_groups` workers so idle workers can pick up remaining units. Files larger
+    than the unit size form a unit of their own. Units are returned from the largest one so long
+    running units start first.
+    """
+    # sort files so the same tables are in the same unit
+    files_sizes = sorted(files_sizes)
+    total_size = sum(size for _, size in files_sizes)
+    unit_size = max(total_size // max(no_groups * units_per_group, 1), 1)
+
+    units: List[Tuple[int, List[str]]] = []
+    unit: List[str] = []
+    current_size = 0
+    for file, size in files_sizes:
+        unit.append(file)
+        current_size += size
+        if current_size >= unit_size:
+            units.append((current_size, unit))
+            unit, current_size = [], 0
+    if unit:
+        units.append((current_size, unit))
+    # stable sort keeps name order for units of the same size
+    units.sort(key=lambda u: u[0], reverse=True)
+    return [unit for _, unit in units]
 
 
 def w_normalize_files(
     config: NormalizeConfiguration,
     normalize_storage_config: NormalizeStorageConfiguration,
     loader_storage_config: LoadStorageConfiguration,
-    stored_schema: TStoredSchema,
+    schema_or_snapshot: Union[TStoredSchema, SchemaSnapshot],
     load_id: str,
     extracted_items_files: Sequence[str],
+    shared_column_types: MutableMapping[Tuple[str, str], TDataType] = None,
 ) -> TWorkerRV:
+    started_at = time.time()
+    stored_schema = load_schema_snapshot(schema_or_snapshot)
     destination_caps = config.destination_capabilities
     schema_updates: List[TSchemaUpdate] = []
     # normalizers are cached per {table_name}.{item_format}
@@ -173,7 +257,13 @@ def w_normalize_files(
             if item_format == "arrow":
                 cls = ArrowItemsNormalizer
             elif item_format == "object":
-                cls = JsonLItemsNormalizer
+                if (
+                    config.json_normalizer.columnar
+                    and item_storage.writer_spec.file_format == "parquet"
+                ):
+                    cls = ColumnarJsonLItemsNormalizer
+                else:
+                    cls = JsonLItemsNormalizer
             elif item_format == "model":
                 cls = ModelItemsNormalizer
             else:
@@ -190,6 +280,7 @@ def w_normalize_files(
                 schema,
                 load_id,
                 config,
+                shared_column_types,
             )
             return norm
 
@@ -261,4 +352,17 @@ def w_normalize_files(
             writer_metrics = _gather_metrics_and_close(parsed_file_name, in_exception=False)
 
         logger.info(f"Processed all items in {len(extracted_items_files)} files")
-        return TWorkerRV(schema_updates, writer_metrics)
+        extracted_storage = normalize_storage.extracted_packages.storage
+        worker_metrics = NormalizeWorkerMetrics(
+            # pid alone is shared by all workers of a thread pool
+            f"{os.getpid()}-{threading.get_ident()}",
+            1,
+            len(extracted_items_files),
+            sum(
+                os.path.getsize(extracted_storage.make_full_path(file))
+                for file in extracted_items_files
+            ),
+            time.time() - started_at,
+            0.0,
+        )
+        return TWorkerRV(schema_updates, writer_metrics, [worker_metrics])
@@ -146,6 +146,9 @@ from dlt.pipeline.state_sync import (
 from dlt.common.storages.load_package import TLoadPackageState
 from dlt.pipeline.helpers import prepare_refresh_source
 
+if TYPE_CHECKING:
+    from dlt.dataset.cache import RelationResultCache
+
 
 TWithLocalFiles = TypeVar("TWithLocalFiles", bound=WithLocalFiles)
 
@@ -1821,11 +1824,16 @@ class Pipeline(SupportsPipeline):
     # NOTE: I expect that we'll merge all relations into one. and then we'll be able to get rid
     #  of overload and dataset_type
 
-    def dataset(self, schema: Union[Schema, str, None] = None) -> dlt.Dataset:
+    def dataset(
+        self,
+        schema: Union[Schema, str, None] = None,
+        result_cache: Optional["RelationResultCache"] = None,
+    ) -> dlt.Dataset:
         """Returns a dataset object for querying the destination data.
 
         Args:
             schema (Union[Schema, str, None]): Schema name or Schema object to use. If None, uses the default schema if set.
+            result_cache (Optional[RelationResultCache]): On-disk cache for results of `arrow()` and `df()` calls on relations of the dataset.
         Returns:
             dlt.Dataset: A dataset object that supports querying the destination data.
         """
@@ -1866,6 +1874,7 @@ class Pipeline(SupportsPipeline):
                 self._destination,
                 self.dataset_name,
                 schema=schema,
+                result_cache=result_cache,
             )
             success = True
             return dataset
@@ -166,6 +166,7 @@ class Client:
         request_max_retry_delay: Maximum delay when using exponential backoff
         respect_retry_after_header: Whether to use the `Retry-After` response header (when available) to determine the retry delay
         session_attrs: Extra attributes that will be set on the session instance, e.g. `{headers: {'Authorization': 'api-key'}}` (see `requests.sessions.Session` for possible attributes)
+        max_pool_hosts: Number of hosts for which the HTTPAdapter keeps a connection pool. Raise it when a single client talks to many hosts so pools are not discarded and reopened
     """
 
     _session_attrs: Dict[str, Any]
@@ -185,8 +186,9 @@ class Client:
         request_max_retry_delay: TimedeltaSeconds = RuntimeConfiguration.request_max_retry_delay,
         respect_retry_after_header: bool = True,
         session_attrs: Optional[Dict[str, Any]] = None,
+        max_pool_hosts: int = 10,
     ) -> None:
-        self._adapter = HTTPAdapter(pool_maxsize=max_connections)
+        self._adapter = HTTPAdapter(pool_connections=max_pool_hosts, pool_maxsize=max_connections)
         self._local = local()
         self._session_kwargs = dict(timeout=request_timeout, raise_for_status=raise_for_status)
         self._retry_kwargs: Dict[str, Any] = dict(
@@ -0,0 +1,246 @@
+import os
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Literal, Optional, Tuple, cast
+
+from requests import PreparedRequest, Response
+from requests import Session as BaseSession  # noqa: I251
+from requests.hooks import default_hooks, dispatch_hook
+from requests.structures import CaseInsensitiveDict
+
+from dlt.common import json, logger
+from dlt.common.time import to_seconds
+from dlt.common.typing import TimedeltaSeconds
+
+TCacheStatus = Literal["hit", "revalidated", "miss"]
+
+DEFAULT_CACHE_MAX_BYTES = 512 * 1024 * 1024
+CACHE_FILE_EXTENSION = ".response"
+# headers that describe the raw transfer, cached bodies are stored decoded
+_TRANSFER_HEADERS = ("content-encoding", "transfer-encoding", "content-length")
+_CACHE_STATUS_ATTR = "_dlt_cache_status"
+
+
+def get_cache_status(response: Response) -> Optional[TCacheStatus]:
+    """Returns how `response` was obtained by `ResponseCache`, None if it was not cached"""
+    return getattr(response, _CACHE_STATUS_ATTR, None)  # type: ignore[no-any-return]
+
+
+class ResponseCache:
+    """On-disk cache of successful GET responses used by `RESTClient`.
+
+    Each response is stored in a single file in `cache_dir`. A cached response is returned
+    without a request when it is younger than `ttl` or when the caller marks the request as
+    immutable. Otherwise it is revalidated with a conditional request if the server sent an
+    `ETag` or `Last-Modified` header; a `304 Not Modified` answer is served from the cache.
+    Least recently used files are evicted when the cache grows over `max_bytes`.
+
+    Responses are keyed by the method, the full url (including query string) and the body of the
+    request. Request headers are not part of the key, so do not share a cache directory between
+    credentials that see different data.
+
+    Args:
+        cache_dir (str): Directory where responses are stored. Created if it does not exist.
+        max_bytes (int): Byte budget of the cache directory. Defaults to 512 MB.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = DEFAULT_CACHE_MAX_BYTES) -> None:
+        if max_bytes <= 0:
+            raise ValueError("`max_bytes` must be a positive integer.")
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # cache keys and file sizes in least recently used order
+        self._index: "OrderedDict[str, int]" = OrderedDict()
+        self._total_bytes = 0
+        os.makedirs(cache_dir, exist_ok=True)
+        self._load_index()
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def send(
+        self,
+        session: BaseSession,
+        request: PreparedRequest,
+        ttl: Optional[TimedeltaSeconds] = None,
+        immutable: bool = False,
+        **send_kwargs: Any,
+    ) -> Response:
+        """Sends `request` with `session` unless a fresh response is in the cache. Response hooks
+        of `request` are dispatched on the returned response whether it comes from the cache or
+        from the server.
+        """
+        if request.method != "GET" or send_kwargs.get("stream"):
+            return session.send(request, **send_kwargs)
+
+        key = self._make_key(request)
+        entry = self._read(key)
+        hooks = request.hooks
+        if entry is not None:
+            meta, body = entry
+            ttl_seconds = to_seconds(ttl)
+            if immutable or (
+                ttl_seconds is not None and time.time() - meta["stored_at"] < ttl_seconds
+            ):
+                response = self._make_response(request, meta, body, "hit")
+                return self._dispatch_response_hooks(hooks, response, **send_kwargs)
+            if meta.get("etag"):
+                request.headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                request.headers["If-Modified-Since"] = meta["last_modified"]
+
+        # hooks are dispatched on the final response, not on the 304 answer
+        request.hooks = default_hooks()
+        try:
+            response = session.send(request, **send_kwargs)
+        finally:
+            request.hooks = hooks
+            request.headers.pop("If-None-Match", None)
+            request.headers.pop("If-Modified-Since", None)
+
+        if entry is not None and response.status_code == 304:
+            meta, body = entry
+            response.close()
+            meta["stored_at"] = time.time()
+            self._write(key, meta, body)
+            response = self._make_response(request, meta, body, "revalidated")
+        else:
+            setattr(response, _CACHE_STATUS_ATTR, "miss")
+            if response.status_code == 200 and (
+                immutable or ttl is not None or self._is_validatable(response)
+            ):
+                self._store(key, response)
+        return self._dispatch_response_hooks(hooks, response, **send_kwargs)
+
+    def clear(self) -> None:
+        """Removes all cached responses"""
+        with self._lock:
+            keys = list(self._index)
+            self._index.clear()
+            self._total_bytes = 0
+        for key in keys:
+            self._remove_file(key)
+
+    def _store(self, key: str, response: Response) -> None:
+        headers = {
+            k: v for k, v in response.headers.items() if k.lower() not in _TRANSFER_HEADERS
+        }
+        meta = {
+            "status_code": response.status_code,
+            "reason": response.reason,
+            "headers": headers,
+            "encoding": response.encoding,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "stored_at": time.time(),
+        }
+        self._write(key, meta, response.content)
+
+    def _write(self, key: str, meta: Dict[str, Any], body: bytes) -> None:
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(json.dumpb(meta))
+            f.write(b"\n")
+            f.write(body)
+            size = f.tell()
+        os.replace(tmp_path, path)
+        with self._lock:
+            self._total_bytes += size - self._index.pop(key, 0)
+            self._index[key] = size
+            evicted = self._evict()
+        for evicted_key in evicted:
+            self._remove_file(evicted_key)
+
+    def _read(self, key: str) -> Optional[Tuple[Dict[str, Any], bytes]]:
+        try:
+            with open(self._path(key), "rb") as f:
+                meta = json.loadb(f.readline())
+                body = f.read()
+        except FileNotFoundError:
+            with self._lock:
+                self._total_bytes -= self._index.pop(key, 0)
+            return None
+        except ValueError:
+            logger.warning(f"Dropping corrupted response cache file {self._path(key)}")
+            with self._lock:
+                self._total_bytes -= self._index.pop(key, 0)
+            self._remove_file(key)
+            return None
+        with self._lock:
+            if key in self._index:
+                self._index.move_to_end(key)
+        # keep recency on disk so it survives reloading the index
+        try:
+            os.utime(self._path(key))
+        except FileNotFoundError:
+            pass
+        return meta, body
+
+    def _evict(self) -> List[str]:
+        evicted: List[str] = []
+        while self._total_bytes > self.max_bytes and len(self._index) > 1:
+            key, size = self._index.popitem(last=False)
+            self._total_bytes -= size
+            evicted.append(key)
+        return evicted
+
+    def _load_index(self) -> None:
+        entries = []
+        for file_name in os.listdir(self.cache_dir):
+            if not file_name.endswith(CACHE_FILE_EXTENSION):
+                continue
+            stat = os.stat(os.path.join(self.cache_dir, file_name))
+            entries.append((stat.st_mtime, file_name[: -len(CACHE_FILE_EXTENSION)], stat.st_size))
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+            self._total_bytes += size
+        for key in self._evict():
+            self._remove_file(key)
+
+    def _remove_file(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            # another process sharing the cache directory removed it
+            pass
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + CACHE_FILE_EXTENSION)
+
+    @staticmethod
+    def _make_key(request: PreparedRequest) -> str:
+        digest = hashlib.sha256(f"{request.method} {request.url}".encode("utf-8"))
+        body = request.body
+        if body:
+            digest.update(body if isinstance(body, bytes) else str(body).encode("utf-8"))
+        return digest.hexdigest()
+
+    @staticmethod
+    def _dispatch_response_hooks(
+        hooks: Dict[str, Any], response: Response, **send_kwargs: Any
+    ) -> Response:
+        return cast(Response, dispatch_hook("response", hooks, response, **send_kwargs))
+
+    @staticmethod
+    def _is_validatable(response: Response) -> bool:
+        return "ETag" in response.headers or "Last-Modified" in response.headers
+
+    @staticmethod
+    def _make_response(
+        request: PreparedRequest, meta: Dict[str, Any], body: bytes, status: TCacheStatus
+    ) -> Response:
+        response = Response()
+        response.status_code = meta["status_code"]
+        response.reason = meta["reason"]
+        response.headers = CaseInsensitiveDict(meta["headers"])
+        response.encoding = meta["encoding"]
+        response.url = request.url
+        response.request = request
+        response._content = body
+        setattr(response, _CACHE_STATUS_ATTR, status)
+        return response
@@ -1,4 +1,5 @@
 import logging
+import re
 from typing import (
     Iterator,
     Optional,
@@ -9,27 +10,39 @@ from typing import (
     Iterable,
     cast,
     Callable,
+    Deque,
+    Tuple,
 )
 import copy
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from urllib.parse import urlparse
 from requests import Session as BaseSession  # noqa: I251
 from requests import Response, Request, HTTPError
 from requests.auth import AuthBase
 
+from dlt import version
 from dlt.common import jsonpath, logger
+from dlt.common.exceptions import MissingDependencyException
+from dlt.common.typing import TimedeltaSeconds
+from dlt.common.utils import chunks
 from dlt.common.configuration import resolve_configuration
 from dlt.common.configuration.specs.runtime_configuration import RuntimeConfiguration
 
 from .typing import HTTPMethodBasic, HTTPMethod, Hooks
-from .paginators import BasePaginator
+from .paginators import BasePaginator, RangePaginator
 from .detector import PaginatorFactory, find_response_page_data
 from .exceptions import IgnoreResponseException, PaginatorNotFound
+from .cache import ResponseCache
 from .redaction import sanitize_url
 from .utils import join_url
 
 
 _T = TypeVar("_T")
 
+# dotted paths to an array that may be streamed with ijson, ie. `$`, `data`, `$.data.items[*]`
+_STREAMABLE_PATH = re.compile(r"^\$?\.?((?:[A-Za-z_]\w*)(?:\.[A-Za-z_]\w*)*)?(?:\[\*\])?$")
+
 
 class PageData(List[_T]):
     """A list of elements in a single page of results with attached request context.
@@ -68,6 +81,14 @@ class RESTClient:
             used for detecting paginators.
         config (Optional[RuntimeConfiguration]): Runtime configuration for HTTP error handling.
             If not provided, will resolve from the global configuration.
+        stream_batch_size (Optional[int]): When set, `paginate` parses JSON responses
+            incrementally and yields pages of at most this many items while the response body
+            is still downloading. Applies only when `data_selector` is a simple dotted path to
+            an array and the paginator does not read the response body. Requires `ijson`.
+        response_cache (Optional[ResponseCache]): On-disk cache for GET responses. Cached
+            responses are revalidated with `ETag`/`Last-Modified` conditional requests.
+        cache_ttl (Optional[TimedeltaSeconds]): Age under which cached responses are returned
+            without contacting the server. Only used with `response_cache`.
     """
 
     def __init__(
@@ -80,6 +101,9 @@ class RESTClient:
         session: BaseSession = None,
         paginator_factory: Optional[PaginatorFactory] = None,
         config: Optional[RuntimeConfiguration] = None,
+        stream_batch_size: Optional[int] = None,
+        response_cache: Optional[ResponseCache] = None,
+        cache_ttl: Optional[TimedeltaSeconds] = None,
     ) -> None:
         self.base_url = base_url
         self.headers = headers
@@ -103,6 +127,21 @@ class RESTClient:
 
         self.data_selector = data_selector
 
+        if stream_batch_size is not None:
+            if stream_batch_size < 1:
+                raise ValueError("`stream_batch_size` must be a positive integer.")
+            try:
+                import ijson  # noqa: F401
+            except ModuleNotFoundError:
+                raise MissingDependencyException(
+                    "dlt RESTClient response streaming",
+                    [f"{version.DLT_PKG_NAME}[ijson]"],
+                    "Install ijson to parse JSON responses incrementally with `stream_batch_size`.",
+                )
+        self.stream_batch_size = stream_batch_size
+        self.response_cache = response_cache
+        self.cache_ttl = cache_ttl
+
     def _create_request(
         self,
         path_or_url: str,
@@ -139,6 +178,7 @@ class RESTClient:
         )
 
     def _send_request(self, request: Request, **kwargs: Any) -> Response:
+        cache_immutable = kwargs.pop("cache_immutable", False)
         prepared_request = self.session.prepare_request(request)
 
         self._log_request(request, prepared_request.url)
@@ -152,6 +192,14 @@ class RESTClient:
         )
 
         send_kwargs.update(**kwargs)  #  type: ignore[call-arg]
+        if self.response_cache is not None:
+            return self.response_cache.send(
+                self.session,
+                prepared_request,
+                ttl=self.cache_ttl,
+                immutable=cache_immutable,
+                **send_kwargs,
+            )
         return self.session.send(prepared_request, **send_kwargs)
 
     def _log_request(self, request: Request, prepared_url: str) -> None:
@@ -204,6 +252,7 @@ class RESTClient:
         headers: Optional[Dict[str, Any]] = None,
         *,
         data: Optional[Any] = None,
+        cache_immutable: bool = False,
         **kwargs: Any,
     ) -> Iterator[PageData[Any]]:
         """Iterates over paginated API responses, yielding pages of data.
@@ -227,6 +276,8 @@ class RESTClient:
             hooks (Optional[Hooks]): Hooks to modify request/response objects. Note that
                 when hooks are not provided, the default behavior is to raise an exception
                 on error status codes.
+            cache_immutable (bool): Tells `response_cache` that the requested pages never
+                change so cached pages are returned without revalidation.
             **kwargs (Any): Optional arguments to that the Request library accepts, such as
                 `stream`, `verify`, `proxies`, `cert`, `timeout`, and `allow_redirects`.
 
@@ -268,12 +319,27 @@ class RESTClient:
         if paginator:
             paginator.init_request(request)
 
+        if cache_immutable:
+            kwargs["cache_immutable"] = True
+
+        stream_prefix = self._get_stream_prefix(paginator, data_selector)
+        if stream_prefix is not None:
+            kwargs["stream"] = True
+
         while True:
             try:
                 response = self._send_request(request, **kwargs)
             except IgnoreResponseException:
                 break
 
+            if stream_prefix is not None and not self._is_body_read(response):
+                paginator = cast(BasePaginator, paginator)
+                yield from self._stream_response(response, stream_prefix, request, paginator, auth)
+                if not paginator.has_next_page:
+                    logger.info(f"Paginator {str(paginator)} does not have more pages")
+                    break
+                continue
+
             if not data_selector:
                 data_selector = self.detect_data_selector(response)
             data = self.extract_response(response, data_selector)
@@ -290,6 +356,129 @@ class RESTClient:
                 logger.info(f"Paginator {str(paginator)} does not have more pages")
                 break
 
+            if (
+                isinstance(paginator, RangePaginator)
+                and paginator.prefetch_pages > 1
+                and paginator.get_end_value() is not None
+            ):
+                yield from self._paginate_prefetch(
+                    request, paginator, data_selector, auth, **kwargs
+                )
+                break
+
+    def _paginate_prefetch(
+        self,
+        request: Request,
+        paginator: RangePaginator,
+        data_selector: jsonpath.TJsonPath,
+        auth: AuthBase,
+        **kwargs: Any,
+    ) -> Iterator[PageData[Any]]:
+        """Fetches remaining pages of a range paginator with up to `prefetch_pages` requests in
+        flight and yields them in order. Requests that are still pending when pagination ends
+        are cancelled and their responses are dropped.
+        """
+        pending: Deque[Tuple[Request, "Future[Response]"]] = deque()
+        next_value = paginator.current_value
+        executor = ThreadPoolExecutor(
+            max_workers=paginator.prefetch_pages, thread_name_prefix="dlt_rest_prefetch"
+        )
+        try:
+            while True:
+                # end value may change with the total in each response
+                end_value = paginator.get_end_value()
+                while len(pending) < paginator.prefetch_pages and (
+                    end_value is None or next_value < end_value
+                ):
+                    page_request = paginator.make_page_request(request, next_value)
+                    pending.append(
+                        (
+                            page_request,
+                            executor.submit(self._send_request, page_request, **kwargs),
+                        )
+                    )
+                    next_value += paginator.value_step
+                if not pending:
+                    break
+                _, future = pending.popleft()
+                try:
+                    response = future.result()
+                except IgnoreResponseException:
+                    break
+
+                data = self.extract_response(response, data_selector)
+                paginator.update_state(response, data)
+                paginator.update_request(request)
+
+                yield PageData(
+                    data, request=request, response=response, paginator=paginator, auth=auth
+                )
+
+                if not paginator.has_next_page:
+                    logger.info(f"Paginator {str(paginator)} does not have more pages")
+                    break
+        finally:
+            for _, future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def _get_stream_prefix(
+        self, paginator: Optional[BasePaginator], data_selector: Optional[jsonpath.TJsonPath]
+    ) -> Optional[str]:
+        """Returns the `ijson` prefix of the items selected by `data_selector` if responses can be
+        streamed, otherwise None. Streaming needs a known paginator that does not read the
+        response body and a selector that points to an array with a plain dotted path.
+        """
+        if self.stream_batch_size is None or paginator is None or paginator.reads_response_body:
+            return None
+        if not data_selector or not isinstance(data_selector, str):
+            return None
+        match = _STREAMABLE_PATH.match(data_selector)
+        if match is None:
+            return None
+        path = match.group(1)
+        return f"{path}.item" if path else "item"
+
+    @staticmethod
+    def _is_body_read(response: Response) -> bool:
+        """Checks if the body was already read, ie. by `response_actions` hooks that match on
+        content, or set by `response_cache`. Such responses cannot be streamed and are parsed
+        from `response.content`.
+        """
+        # `_content` is False until the body is read or replaced
+        return response._content_consumed or response._content is not False
+
+    def _stream_response(
+        self,
+        response: Response,
+        stream_prefix: str,
+        request: Request,
+        paginator: BasePaginator,
+        auth: AuthBase,
+    ) -> Iterator[PageData[Any]]:
+        """Parses items under `stream_prefix` from the response body as it downloads and yields
+        them in pages of at most `stream_batch_size` items. Paginator state is updated once the
+        body is consumed so the request for the next page is built after the last item.
+        """
+        import ijson
+
+        data: List[Any] = []
+        try:
+            response.raw.decode_content = True
+            items = ijson.items(response.raw, stream_prefix, use_float=True)
+            for data in chunks(items, self.stream_batch_size):
+                yield PageData(
+                    data, request=request, response=response, paginator=paginator, auth=auth
+                )
+        finally:
+            response.close()
+        if not data:
+            # same as non streamed responses, empty pages are yielded
+            yield PageData(data, request=request, response=response, paginator=paginator, auth=auth)
+        # the last batch tells range paginators if the page was empty
+        paginator.update_state(response, data)
+        paginator.update_request(request)
+
     def extract_response(self, response: Response, data_selector: jsonpath.TJsonPath) -> List[Any]:
         # we should compile data_selector
         data: Any = jsonpath.find_values(data_selector, response.json())
@@ -1,3 +1,4 @@
+import copy
 import warnings
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional
@@ -28,6 +29,13 @@ class BasePaginator(ABC):
         """
         return self._has_next_page
 
+    @property
+    def reads_response_body(self) -> bool:
+        """Tells if `update_state` reads the response body. Responses of paginators that only
+        look at headers or at the page data may be streamed by `RESTClient`.
+        """
+        return True
+
     def init_request(self, request: Request) -> None:  # noqa: B027, optional override
         """Initializes the request object with parameters for the first
         pagination request.
@@ -75,6 +83,10 @@ class BasePaginator(ABC):
 class SinglePagePaginator(BasePaginator):
     """A paginator for single-page API responses."""
 
+    @property
+    def reads_response_body(self) -> bool:
+        return False
+
     def update_state(self, response: Response, data: Optional[List[Any]] = None) -> None:
         self._has_next_page = False
 
@@ -102,6 +114,7 @@ class RangePaginator(BasePaginator):
         *,
         has_more_path: Optional[jsonpath.TJsonPath] = None,
         param_body_path: Optional[str] = None,
+        prefetch_pages: int = 0,
     ):
         """
         Args:
@@ -131,6 +144,9 @@ class RangePaginator(BasePaginator):
             has_more_path (jsonpath.TJsonPath): The JSONPath expression for
                 the boolean value indicating whether there are more items to fetch.
                 Defaults to None.
+            prefetch_pages (int): The number of page requests sent concurrently once the
+                end of the range is known from `total_path` or `maximum_value`. Pages are
+                still yielded in order. Defaults to 0 which requests pages one by one.
         """
         super().__init__()
         if (
@@ -158,12 +174,46 @@ class RangePaginator(BasePaginator):
         self.error_message_items = error_message_items
         self.stop_after_empty_page = stop_after_empty_page
         self.has_more_path = jsonpath.compile_path(has_more_path) if has_more_path else None
+        if prefetch_pages < 0:
+            raise ValueError("`prefetch_pages` must not be negative.")
+        self.prefetch_pages = prefetch_pages
+        self._total: Optional[int] = None
 
     def init_request(self, request: Request) -> None:
         self._has_next_page = True
         self.current_value = self.initial_value
+        self._total = None
         self.update_request(request)
 
+    @property
+    def reads_response_body(self) -> bool:
+        return self.total_path is not None or self.has_more_path is not None
+
+    def get_end_value(self) -> Optional[int]:
+        """Returns the value of the parameter at which pagination stops, if known from the total
+        in the last response or from `maximum_value`. Otherwise returns None.
+        """
+        end_values = []
+        if self._total is not None:
+            end_values.append(self._total + self.base_index)
+        if self.maximum_value is not None:
+            end_values.append(self.maximum_value)
+        return min(end_values) if end_values else None
+
+    def make_page_request(self, request: Request, value: int) -> Request:
+        """Creates a copy of `request` that fetches the page at `value` of the parameter.
+        Used to send requests for pages ahead of the current page.
+        """
+        page_request = copy.copy(request)
+        page_request.params = copy.copy(request.params)
+        page_request.json = copy.deepcopy(request.json)
+        current_value, self.current_value = self.current_value, value
+        try:
+            self.update_request(page_request)
+        finally:
+            self.current_value = current_value
+        return page_request
+
     def update_state(self, response: Response, data: Optional[List[Any]] = None) -> None:
         if self._stop_after_this_page(data):
             self._has_next_page = False
@@ -180,6 +230,7 @@ class RangePaginator(BasePaginator):
                     total = int(total)
                 except ValueError:
                     self._handle_invalid_total(total)
+                self._total = total
 
             self.current_value += self.value_step
 
@@ -341,6 +392,7 @@ class PageNumberPaginator(RangePaginator):
         *,
         has_more_path: Optional[jsonpath.TJsonPath] = None,
         page_body_path: Optional[str] = None,
+        prefetch_pages: int = 0,
     ):
         """
         Args:
@@ -368,6 +420,9 @@ class PageNumberPaginator(RangePaginator):
             has_more_path (jsonpath.TJsonPath): The JSONPath expression for
                 the boolean value indicating whether there are more items to fetch.
                 Defaults to None.
+            prefetch_pages (int): The number of page requests sent concurrently once
+                the last page is known from `total_path` or `maximum_page`. Defaults to 0
+                which requests pages one by one.
         """
         # For backward compatibility: set default cursor_param if both are None
         if page_param is None and page_body_path is None:
@@ -400,6 +455,7 @@ class PageNumberPaginator(RangePaginator):
             error_message_items="pages",
             stop_after_empty_page=stop_after_empty_page,
             has_more_path=has_more_path,
+            prefetch_pages=prefetch_pages,
         )
 
     def __str__(self) -> str:
@@ -499,6 +555,7 @@ class OffsetPaginator(RangePaginator):
         has_more_path: Optional[jsonpath.TJsonPath] = None,
         offset_body_path: Optional[str] = None,
         limit_body_path: Optional[str] = None,
+        prefetch_pages: int = 0,
     ) -> None:
         """
         Args:
@@ -529,6 +586,9 @@ class OffsetPaginator(RangePaginator):
             has_more_path (jsonpath.TJsonPath): The JSONPath expression for
                 the boolean value indicating whether there are more items to fetch.
                 Defaults to None.
+            prefetch_pages (int): The number of page requests sent concurrently once
+                the last offset is known from `total_path` or `maximum_offset`. Defaults to 0
+                which requests pages one by one.
         """
         # For backward compatibility: set default offset_param if both are None
         if offset_param is None and offset_body_path is None:
@@ -566,6 +626,7 @@ class OffsetPaginator(RangePaginator):
             stop_after_empty_page=stop_after_empty_page,
             has_more_path=has_more_path,
             param_body_path=offset_body_path,
+            prefetch_pages=prefetch_pages,
         )
         self.limit_param = limit_param
         self.limit_body_path = limit_body_path
@@ -706,6 +767,10 @@ class HeaderLinkPaginator(BaseNextUrlPaginator):
         super().__init__()
         self.links_next_key = links_next_key
 
+    @property
+    def reads_response_body(self) -> bool:
+        return False
+
     def update_state(self, response: Response, data: Optional[List[Any]] = None) -> None:
         """Extracts the next page URL from the 'Link' header in the response."""
         self._next_reference = response.links.get(self.links_next_key, {}).get("url")
@@ -940,6 +1005,10 @@ class HeaderCursorPaginator(BaseReferencePaginator):
         self.cursor_key = cursor_key
         self.cursor_param = cursor_param
 
+    @property
+    def reads_response_body(self) -> bool:
+        return False
+
     def update_state(self, response: Response, data: Optional[List[Any]] = None) -> None:
         """Extracts the next page cursor from the header in the response."""
         self._next_reference = response.headers.get(self.cursor_key)
@@ -246,6 +246,7 @@ def create_resources(
         request_data = endpoint_config.get("data")
         request_headers = endpoint_config.get("headers")
         paginator = create_paginator(endpoint_config.get("paginator"))
+        cache_policy = endpoint_config.get("response_cache") or {}
         processing_steps = endpoint_resource.pop("processing_steps", [])
 
         resolved_params: List[ResolvedParam] = resolved_param_map[resource_name]
@@ -269,6 +270,9 @@ def create_resources(
             auth=create_auth(endpoint_config.get("auth", client_config.get("auth"))),
             paginator=create_paginator(client_config.get("paginator")),
             session=client_config.get("session"),
+            stream_batch_size=client_config.get("stream_batch_size"),
+            response_cache=client_config.get("response_cache"),
+            cache_ttl=cache_policy.get("ttl"),
         )
 
         hooks = create_response_hooks(endpoint_config.get("response_actions"))
@@ -306,6 +310,7 @@ def create_resources(
                 incremental_object=incremental_object,
                 incremental_param=incremental_param,
                 incremental_cursor_transform=incremental_cursor_transform,
+                cache_immutable_before=cache_policy.get("immutable_before"),
             )
 
             resources[resource_name] = process(resources[resource_name], processing_steps)
@@ -336,6 +341,7 @@ def create_resources(
                 incremental_object=incremental_object,
                 incremental_param=incremental_param,
                 incremental_cursor_transform=incremental_cursor_transform,
+                cache_immutable_before=cache_policy.get("immutable_before"),
             )
 
             resources[resource_name] = process(resources[resource_name], processing_steps)
@@ -27,6 +27,7 @@ from dlt.common.utils import update_dict_nested, exclude_keys
 from dlt.common.typing import add_value_to_literal
 from dlt.common import jsonpath
 
+from dlt.extract.decorators import get_resource_metrics
 from dlt.extract.incremental import Incremental
 from dlt.extract.utils import ensure_table_schema_columns
 
@@ -50,7 +51,8 @@ from dlt.sources.helpers.rest_client.auth import (
     APIKeyAuth,
     OAuth2ClientCredentials,
 )
-from dlt.sources.helpers.rest_client.client import RESTClient, raise_for_status
+from dlt.sources.helpers.rest_client.cache import get_cache_status
+from dlt.sources.helpers.rest_client.client import PageData, RESTClient, raise_for_status
 
 from dlt.extract.resource import DltResource
 from dlt.sources.helpers.rest_client.typing import HTTPMethodBasic
@@ -1038,7 +1040,9 @@ def paginate_dependent_resource(
     incremental_object: Optional[Incremental[Any]],
     incremental_param: Optional[IncrementalParam],
     incremental_cursor_transform: Optional[Callable[..., Any]],
+    cache_immutable_before: Optional[Any] = None,
 ) -> Generator[Any, None, None]:
+    cache_immutable = _is_cache_immutable(incremental_object, cache_immutable_before)
     if incremental_object:
         params = _set_incremental_params(
             params,
@@ -1071,7 +1075,10 @@ def paginate_dependent_resource(
             paginator=paginator,
             data_selector=data_selector,
             hooks=hooks,
+            cache_immutable=cache_immutable,
         ):
+            if client.response_cache is not None:
+                _update_response_cache_metrics(child_page)
             if processed_data.parent_record:
                 for child_record in child_page:
                     child_record.update(processed_data.parent_record)
@@ -1092,7 +1099,9 @@ def paginate_resource(
     incremental_object: Optional[Incremental[Any]],
     incremental_param: Optional[IncrementalParam],
     incremental_cursor_transform: Optional[Callable[..., Any]],
+    cache_immutable_before: Optional[Any] = None,
 ) -> Generator[Any, None, None]:
+    cache_immutable = _is_cache_immutable(incremental_object, cache_immutable_before)
     format_kwargs = {}
     if incremental_object:
         params = _set_incremental_params(
@@ -1114,7 +1123,7 @@ def paginate_resource(
     json = expand_placeholders(json, format_kwargs, preserve_value_type=True)
     data = expand_placeholders(data, format_kwargs)
 
-    yield from client.paginate(
+    for page in client.paginate(
         method=method,
         path=path,
         headers=headers,
@@ -1124,4 +1133,33 @@ def paginate_resource(
         paginator=paginator,
         data_selector=data_selector,
         hooks=hooks,
+        cache_immutable=cache_immutable,
+    ):
+        if client.response_cache is not None:
+            _update_response_cache_metrics(page)
+        yield page
+
+
+def _is_cache_immutable(
+    incremental_object: Optional[Incremental[Any]], immutable_before: Optional[Any]
+) -> bool:
+    """Pages of an incremental range that ends before `immutable_before` do not change"""
+    if immutable_before is None or incremental_object is None:
+        return False
+    end_value = incremental_object.end_value
+    return end_value is not None and end_value <= immutable_before
+
+
+def _update_response_cache_metrics(page: PageData[Any]) -> None:
+    """Counts cache hits, revalidations and misses of the response that produced `page` in
+    the custom metrics of the current resource so they show up in the extract trace.
+    """
+    status = get_cache_status(page.response)
+    if status is None:
+        return
+    metrics = get_resource_metrics().setdefault(
+        "response_cache", {"hit": 0, "revalidated": 0, "miss": 0, "bytes_from_cache": 0}
     )
+    metrics[status] += 1
+    if status != "miss":
+        metrics["bytes_from_cache"] += len(page.response.content)
@@ -10,7 +10,7 @@ from typing import (
 )
 
 from dlt.common import jsonpath
-from dlt.common.typing import TypedDict
+from dlt.common.typing import TimedeltaSeconds, TypedDict
 from dlt.common.incremental.typing import IncrementalArgs
 from dlt.extract.items import TTableHintTemplate
 from dlt.extract.hints import TResourceHintsBase
@@ -23,6 +23,7 @@ from dlt.extract.resource import DltResource
 from requests import Session
 
 from dlt.sources.helpers.rest_client.typing import HTTPMethodBasic
+from dlt.sources.helpers.rest_client.cache import ResponseCache
 
 from dlt.sources.helpers.rest_client.paginators import (
     BasePaginator,
@@ -68,6 +69,7 @@ class PageNumberPaginatorConfig(PaginatorTypeConfig, total=False):
     total_path: Optional[jsonpath.TJsonPath]
     maximum_page: Optional[int]
     stop_after_empty_page: Optional[bool]
+    prefetch_pages: Optional[int]
 
 
 class OffsetPaginatorConfig(PaginatorTypeConfig, total=False):
@@ -80,6 +82,7 @@ class OffsetPaginatorConfig(PaginatorTypeConfig, total=False):
     total_path: Optional[jsonpath.TJsonPath]
     maximum_offset: Optional[int]
     stop_after_empty_page: Optional[bool]
+    prefetch_pages: Optional[int]
 
 
 class HeaderLinkPaginatorConfig(PaginatorTypeConfig, total=False):
@@ -198,6 +201,8 @@ class ClientConfig(TypedDict, total=False):
     auth: Optional[AuthConfig]
     paginator: Optional[PaginatorConfig]
     session: Optional[Session]
+    stream_batch_size: Optional[int]
+    response_cache: Optional[ResponseCache]
 
 
 class IncrementalRESTArgs(IncrementalArgs, total=False):
@@ -246,6 +251,15 @@ class ResponseActionDict(TypedDict, total=False):
 ResponseAction = Union[ResponseActionDict, Callable[..., Any]]
 
 
+class ResponseCachePolicyConfig(TypedDict, total=False):
+    """Per endpoint policy of the `response_cache` set in the client config. Cached pages
+    younger than `ttl` or requested with an incremental `end_value` not after
+    `immutable_before` are returned without revalidation."""
+
+    ttl: Optional[TimedeltaSeconds]
+    immutable_before: Optional[Any]
+
+
 class Endpoint(TypedDict, total=False):
     path: Optional[str]
     method: Optional[HTTPMethodBasic]
@@ -258,6 +272,7 @@ class Endpoint(TypedDict, total=False):
     incremental: Optional[IncrementalConfig]
     auth: Optional[AuthConfig]
     headers: Optional[Dict[str, Any]]
+    response_cache: Optional[ResponseCachePolicyConfig]
 
 
 class ProcessingSteps(TypedDict, total=False):
@@ -20,6 +20,7 @@ from .helpers import (
     _detect_precision_hints_deprecated,
     TQueryAdapter,
     TTableAdapter,
+    TPartitionStrategy,
 )
 from .schema_types import (
     table_to_resource_hints,
@@ -46,6 +47,9 @@ def sql_database(
     query_adapter_callback: Optional[TQueryAdapter] = None,
     resolve_foreign_keys: bool = False,
     engine_adapter_callback: Optional[Callable[[Engine], Engine]] = None,
+    partitions: Optional[int] = None,
+    partition_strategy: TPartitionStrategy = "range",
+    max_chunk_bytes: Optional[int] = None,
 ) -> Iterable[DltResource]:
     """
     A dlt source which loads data from an SQL database using SQLAlchemy.
@@ -97,6 +101,15 @@ def sql_database(
         engine_adapter_callback (Optional[Callable[[Engine], Engine]]): Callback to configure, modify an Engine instance that will be used to open a connection ie. to
             set transaction isolation level.
 
+        partitions (Optional[int]): Number of partitions each table is split into. Partitions are read concurrently, each on its own connection from the engine pool.
+            Tables are split on their single column primary key. Use `sql_table` to partition a table on another column.
+
+        partition_strategy (TPartitionStrategy): How tables are split into partitions. "range" (default) splits values between min and max of the partition column
+            into ranges of equal width and works with numeric, date and datetime columns. "modulo" assigns rows to partitions by remainder of an integer column.
+
+        max_chunk_bytes (Optional[int]): Memory ceiling for a single batch of rows of each table. Number of rows in a batch is adjusted from the observed row size
+            and never exceeds `chunk_size`.
+
     Yields:
         DltResource: DLT resources for each table to be loaded.
     """
@@ -151,6 +164,9 @@ def sql_database(
             query_adapter_callback=query_adapter_callback,
             resolve_foreign_keys=resolve_foreign_keys,
             engine_adapter_callback=engine_adapter_callback,
+            partitions=partitions,
+            partition_strategy=partition_strategy,
+            max_chunk_bytes=max_chunk_bytes,
         )
 
 
@@ -177,6 +193,10 @@ def sql_table(
     write_disposition: TWriteDispositionConfig = "append",
     primary_key: TColumnNames = None,
     merge_key: TColumnNames = None,
+    partitions: Optional[int] = None,
+    partition_column: Optional[str] = None,
+    partition_strategy: TPartitionStrategy = "range",
+    max_chunk_bytes: Optional[int] = None,
 ) -> DltResource:
     """
     A dlt resource which loads data from an SQL database table using SQLAlchemy.
@@ -236,6 +256,14 @@ def sql_table(
         primary_key (TColumnNames): A list of column names that comprise a private key. Typically used with "merge" write disposition to deduplicate loaded data.
         merge_key (TColumnNames): A list of column names that define a merge key. Typically used with "merge" write disposition to remove overlapping data ranges ie. to
             keep a single record for a given day.
+        partitions (Optional[int]): Number of partitions the table is split into. Partitions are read concurrently, each on its own connection from the engine pool,
+            and their data items are yielded as they arrive. Combined with `incremental`, only rows within the incremental range are partitioned.
+            `query_adapter_callback` must modify the passed `Select` so the query keeps the partition clause.
+        partition_column (Optional[str]): Column on which the table is split. Defaults to single column primary key.
+        partition_strategy (TPartitionStrategy): How the table is split into partitions. "range" (default) splits values between min and max of the partition column
+            into ranges of equal width and works with numeric, date and datetime columns. "modulo" assigns rows to partitions by remainder of an integer column.
+        max_chunk_bytes (Optional[int]): Memory ceiling for a single batch of rows. Number of rows in a batch is adjusted from the observed row size and never
+            exceeds `chunk_size`. The ceiling is shared by partitions read concurrently. Enables streaming mode on "connectorx" backend.
 
     Returns:
         DltResource: The dlt resource for loading data from the SQL database table.
@@ -303,6 +331,10 @@ def sql_table(
         excluded_columns=excluded_columns,
         query_adapter_callback=query_adapter_callback,
         resolve_foreign_keys=resolve_foreign_keys,
+        partitions=partitions,
+        partition_column=partition_column,
+        partition_strategy=partition_strategy,
+        max_chunk_bytes=max_chunk_bytes,
     )
 
 
@@ -316,4 +348,5 @@ __all__ = [
     "TableBackend",
     "TQueryAdapter",
     "TTableAdapter",
+    "TPartitionStrategy",
 ]
@@ -8,14 +8,22 @@ from typing import (
     Iterable,
     List,
     Literal,
+    NamedTuple,
     Optional,
     Iterator,
+    Sequence,
     Union,
 )
 import operator
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date  # noqa: I251
+from functools import partial
+from queue import Full, Queue
 
 import dlt
-from dlt.common import logger
+from dlt.common import Decimal, logger
 from dlt.common.configuration.specs import (
     BaseConfiguration,
     ConnectionStringCredentials,
@@ -43,12 +51,14 @@ from .schema_types import (
 )
 
 from dlt.common.libs.sql_alchemy import (
+    Column,
     Engine,
     CompileError,
     create_engine,
     MetaData,
     sa,
     TextClause,
+    ColumnElement,
 )
 
 TableBackend = Literal["sqlalchemy", "pyarrow", "pandas", "connectorx"]
@@ -58,6 +68,10 @@ TQueryAdapter = Union[
     Callable[[SelectAny, Table, Incremental[Any], Engine], SelectClause],
 ]
 TTableAdapter = Callable[[Table], Optional[Union[SelectAny, Table]]]
+TPartitionStrategy = Literal["range", "modulo"]
+
+MEMORY_PROBE_ROWS = 100
+"""Number of rows in the first batch, used to estimate row size when memory ceiling is set"""
 
 
 class TableLoader:
@@ -71,6 +85,10 @@ class TableLoader:
         incremental: Optional[Incremental[Any]] = None,
         query_adapter_callback: Optional[TQueryAdapter] = None,
         limit: Optional[LimitItem] = None,
+        partitions: Optional[int] = None,
+        partition_column: Optional[str] = None,
+        partition_strategy: TPartitionStrategy = "range",
+        max_chunk_bytes: Optional[int] = None,
     ) -> None:
         self.engine = engine
         self.backend = backend
@@ -80,6 +98,13 @@ class TableLoader:
         self.query_adapter_callback = query_adapter_callback
         self.incremental = incremental
         self.limit = limit
+        self.partitions = partitions or 1
+        # memory ceiling is shared by concurrently read partitions
+        self.max_chunk_bytes = max_chunk_bytes // self.partitions if max_chunk_bytes else None
+        self.partition_strategy = partition_strategy
+        self.partition_column = (
+            self._get_partition_column(partition_column) if self.partitions > 1 else None
+        )
         if incremental:
             column_name = extract_simple_field_name(incremental.cursor_path)
 
@@ -111,7 +136,7 @@ class TableLoader:
             self.range_start = None
             self.range_end = None
 
-    def _make_query(self) -> SelectAny:
+    def _make_query(self, partition_clause: Optional[ColumnElement] = None) -> SelectAny:
         table = self.table
         query = table.select()
 
@@ -122,9 +147,40 @@ class TableLoader:
             if limit is not None:
                 query = query.limit(limit)
 
+        if partition_clause is not None:
+            query = query.where(partition_clause)
+
         if not self.incremental:
             return query  # type: ignore[no-any-return]
         last_value_func = self.incremental.last_value_func
+        if last_value_func not in (max, min):
+            # Custom last_value, load everything and let incremental handle filtering
+            return query  # type: ignore[no-any-return]
+
+        where_clause = self._make_incremental_clause()
+        if where_clause is not None:
+            query = query.where(where_clause)
+
+        # generate order by from declared row order
+        order_by = None
+        if (self.row_order == "asc" and last_value_func is max) or (
+            self.row_order == "desc" and last_value_func is min
+        ):
+            order_by = self.cursor_column.asc()
+        elif (self.row_order == "asc" and last_value_func is min) or (
+            self.row_order == "desc" and last_value_func is max
+        ):
+            order_by = self.cursor_column.desc()
+        if order_by is not None:
+            query = query.order_by(order_by)
+
+        return query  # type: ignore[no-any-return]
+
+    def _make_incremental_clause(self) -> Optional[ColumnElement]:
+        """Generates where clause filtering rows according to incremental settings"""
+        if not self.incremental:
+            return None
+        last_value_func = self.incremental.last_value_func
 
         # generate where
         if last_value_func is max:  # Query ordered and filtered according to last_value function
@@ -134,7 +190,7 @@ class TableLoader:
             filter_op = operator.le if self.range_start == "closed" else operator.lt
             filter_op_end = operator.gt if self.range_end == "open" else operator.ge
         else:  # Custom last_value, load everything and let incremental handle filtering
-            return query  # type: ignore[no-any-return]
+            return None
 
         where_clause = True
         if self.last_value is not None:
@@ -149,77 +205,169 @@ class TableLoader:
         if self.on_cursor_value_missing == "exclude":
             where_clause = sa.and_(where_clause, self.cursor_column.isnot(None))
 
-        if where_clause is not True:
-            query = query.where(where_clause)
-
-        # generate order by from declared row order
-        order_by = None
-        if (self.row_order == "asc" and last_value_func is max) or (
-            self.row_order == "desc" and last_value_func is min
-        ):
-            order_by = self.cursor_column.asc()
-        elif (self.row_order == "asc" and last_value_func is min) or (
-            self.row_order == "desc" and last_value_func is max
-        ):
-            order_by = self.cursor_column.desc()
-        if order_by is not None:
-            query = query.order_by(order_by)
-
-        return query  # type: ignore[no-any-return]
+        if where_clause is True:
+            return None
+        return where_clause  # type: ignore[return-value]
 
-    def make_query(self) -> SelectClause:
-        if self.query_adapter_callback:
-            try:
-                return self.query_adapter_callback(  # type: ignore[call-arg]
-                    self._make_query(), self.table, self.incremental, self.engine
-                )
-            except TypeError as type_err:
-                if not is_typeerror_due_to_wrong_call(type_err, self.query_adapter_callback):
-                    raise
-                return self.query_adapter_callback(  # type: ignore[call-arg]
-                    self._make_query(), self.table
-                )
+    def make_query(self, partition_clause: Optional[ColumnElement] = None) -> SelectClause:
+        if not self.query_adapter_callback:
+            return self._make_query(partition_clause)
 
-        return self._make_query()
+        try:
+            query: SelectClause = self.query_adapter_callback(  # type: ignore[call-arg]
+                self._make_query(partition_clause), self.table, self.incremental, self.engine
+            )
+        except TypeError as type_err:
+            if not is_typeerror_due_to_wrong_call(type_err, self.query_adapter_callback):
+                raise
+            query = self.query_adapter_callback(  # type: ignore[call-arg]
+                self._make_query(partition_clause), self.table
+            )
+        # a new select or text clause drops the partition clause and each partition reads all rows
+        if partition_clause is not None and not any(
+            element is partition_clause for element in sa.sql.visitors.iterate(query)
+        ):
+            raise ValueError(
+                f"Query returned by `query_adapter_callback` for table `{self.table.name}` does"
+                " not contain the partition clause so each partition would read the same rows."
+                " Modify the passed `Select` (ie. with `where()`) instead of creating a new"
+                " query or read the table without `partitions`."
+            )
+        return query
+
+    def make_partition_clauses(self) -> List[Optional[ColumnElement]]:
+        """Generates where clauses that split the table into disjoint partitions. Range partitions
+        are computed from min and max value of the partition column within the incremental range.
+        Rows with NULL in the partition column go to the first partition.
+        """
+        if self.partition_column is None:
+            return [None]
+        column = self.partition_column
+        if self.partition_strategy == "modulo":
+            bucket = sa.func.abs(column % self.partitions)
+            clauses = [bucket == idx for idx in range(self.partitions)]
+        else:
+            bounds_query = sa.select(sa.func.min(column), sa.func.max(column)).select_from(
+                self.table
+            )
+            if (where_clause := self._make_incremental_clause()) is not None:
+                bounds_query = bounds_query.where(where_clause)
+            with self.engine.connect() as conn:
+                low, high = conn.execute(bounds_query).one()
+            if low is None:
+                return [None]
+            boundaries = _split_range(low, high, self.partitions)
+            if not boundaries:
+                return [None]
+            clauses = [column < boundaries[0]]
+            for start, end in zip(boundaries, boundaries[1:]):
+                clauses.append(sa.and_(column >= start, column < end))
+            clauses.append(column >= boundaries[-1])
+        clauses[0] = sa.or_(clauses[0], column.is_(None))
+        return clauses  # type: ignore[return-value]
 
     def load_rows(self, backend_kwargs: Dict[str, Any] = None) -> Iterator[TDataItem]:
         # make copy of kwargs
         backend_kwargs = dict(backend_kwargs or {})
-        query = self.make_query()
+        partition_clauses = self.make_partition_clauses()
+        if len(partition_clauses) == 1:
+            yield from self._load_query(self.make_query(partition_clauses[0]), backend_kwargs)
+        else:
+            logger.info(
+                f"Reading table `{self.table.name}` in {len(partition_clauses)} partitions by"
+                f" {self.partition_strategy} of column `{self.partition_column.name}`"
+            )
+            # each partition query is limited, enforce the limit on all partitions together
+            max_rows = self.limit.limit(self.chunk_size) if self.limit else None
+            yield from _iter_concurrently(
+                [
+                    partial(self._load_query, self.make_query(clause), backend_kwargs)
+                    for clause in partition_clauses
+                ],
+                max_rows=max_rows,
+            )
+
+    def _load_query(
+        self, query: SelectClause, backend_kwargs: Dict[str, Any]
+    ) -> Iterator[TDataItem]:
         if self.backend == "connectorx":
             yield from self._load_rows_connectorx(query, backend_kwargs)
         else:
             yield from self._load_rows(query, backend_kwargs)
 
+    def _get_partition_column(self, column_name: Optional[str]) -> Optional[Column]:
+        if column_name is None:
+            primary_key = [c for c in self.table.c if c.primary_key]
+            if len(primary_key) != 1:
+                logger.warning(
+                    f"Table `{self.table.name}` does not have a single column primary key and will"
+                    " be read in a single partition. Pass `partition_column` to partition it."
+                )
+                return None
+            column = primary_key[0]
+        else:
+            try:
+                column = self.table.c[column_name]
+            except KeyError as e:
+                raise KeyError(
+                    f"Partition column `{column_name}` does not exist in table `{self.table.name}`"
+                ) from e
+        if self.partition_strategy == "modulo" and not isinstance(column.type, sa.Integer):
+            raise ValueError(
+                f"Partition column `{column.name}` of table `{self.table.name}` must be an integer"
+                " to be partitioned by modulo"
+            )
+        return column  # type: ignore[no-any-return]
+
     def _load_rows(self, query: SelectClause, backend_kwargs: Dict[str, Any]) -> TDataItem:
+        batch_size = self.chunk_size
+        if self.max_chunk_bytes:
+            # row size is not known upfront, start with a small batch
+            batch_size = min(batch_size, MEMORY_PROBE_ROWS)
         with self.engine.connect() as conn:
-            result = conn.execution_options(yield_per=self.chunk_size).execute(query)
+            # request server side cursor so the driver does not buffer the whole result set
+            result = conn.execution_options(
+                stream_results=True, yield_per=batch_size, max_row_buffer=batch_size
+            ).execute(query)
             try:
                 # NOTE: cursor returns not normalized column names! may be quite useful in case of Oracle dialect
                 # that normalizes columns
                 # columns = [c[0] for c in result.cursor.description]
                 columns = list(result.keys())
-                for partition in result.partitions(size=self.chunk_size):
-                    if self.backend == "sqlalchemy":
-                        yield [dict(row._mapping) for row in partition]
-                    elif self.backend == "pandas":
-                        from dlt.common.libs.pandas_sql import _wrap_result
-
-                        df = _wrap_result(
-                            partition,
-                            columns,
-                            **{"dtype_backend": "pyarrow", **backend_kwargs},
-                        )
-                        yield df
-                    elif self.backend == "pyarrow":
-                        yield row_tuples_to_arrow(
-                            partition,
-                            columns=_add_missing_columns(self.columns, columns),
-                            tz=backend_kwargs.get("tz", "UTC"),
+                while partition := result.fetchmany(batch_size):
+                    rows_count = len(partition)
+                    item = self._rows_to_item(partition, columns, backend_kwargs)
+                    # do not keep driver rows while the item is processed downstream
+                    del partition
+                    if self.max_chunk_bytes:
+                        batch_size = _batch_size_for_memory(
+                            item, rows_count, self.max_chunk_bytes, self.chunk_size
                         )
+                    yield item
             finally:
                 result.close()
 
+    def _rows_to_item(
+        self, partition: Sequence[Any], columns: List[str], backend_kwargs: Dict[str, Any]
+    ) -> TDataItem:
+        if self.backend == "sqlalchemy":
+            return [dict(row._mapping) for row in partition]
+        elif self.backend == "pandas":
+            from dlt.common.libs.pandas_sql import _wrap_result
+
+            return _wrap_result(
+                partition,
+                columns,
+                **{"dtype_backend": "pyarrow", **backend_kwargs},
+            )
+        elif self.backend == "pyarrow":
+            return row_tuples_to_arrow(
+                partition,
+                columns=_add_missing_columns(self.columns, columns),
+                tz=backend_kwargs.get("tz", "UTC"),
+            )
+        raise ValueError(f"Backend `{self.backend}` cannot convert rows")
+
     def _load_rows_connectorx(
         self, query: SelectClause, backend_kwargs: Dict[str, Any]
     ) -> Iterator[TDataItem]:
@@ -236,6 +384,9 @@ class TableLoader:
             **backend_kwargs,
         }
 
+        if self.max_chunk_bytes and "return_type" not in backend_kwargs:
+            # batches are bounded only in streaming mode
+            backend_kwargs["return_type"] = "arrow_stream"
         is_streaming = False
         if "return_type" in backend_kwargs:
             if backend_kwargs["return_type"] == "arrow_stream":
@@ -303,6 +454,10 @@ def table_rows(
     excluded_columns: Optional[List[str]],
     query_adapter_callback: Optional[TQueryAdapter],
     resolve_foreign_keys: bool,
+    partitions: Optional[int] = None,
+    partition_column: Optional[str] = None,
+    partition_strategy: TPartitionStrategy = "range",
+    max_chunk_bytes: Optional[int] = None,
 ) -> Iterator[TDataItem]:
     if isinstance(table, str):  # Reflection is deferred
         table = Table(
@@ -361,6 +516,10 @@ def table_rows(
         chunk_size=chunk_size,
         limit=limit,
         query_adapter_callback=query_adapter_callback,
+        partitions=partitions,
+        partition_column=partition_column,
+        partition_strategy=partition_strategy,
+        max_chunk_bytes=max_chunk_bytes,
     )
     try:
         yield from loader.load_rows(backend_kwargs)
@@ -426,6 +585,117 @@ def _add_missing_columns(
     return schema_columns
 
 
+def _estimate_item_bytes(item: TDataItem) -> int:
+    """Estimates memory taken by data item yielded by a table backend"""
+    if isinstance(item, list):
+        # sample rows, getsizeof is slow on large batches
+        sample = item[:MEMORY_PROBE_ROWS]
+        sample_bytes = sum(
+            sys.getsizeof(row) + sum(sys.getsizeof(v) for v in row.values()) for row in sample
+        )
+        return sample_bytes * len(item) // max(len(sample), 1)
+    if hasattr(item, "nbytes"):
+        # arrow table
+        return int(item.nbytes)
+    if hasattr(item, "memory_usage"):
+        # pandas data frame
+        return int(item.memory_usage(index=False, deep=True).sum())
+    return 0
+
+
+def _batch_size_for_memory(
+    item: TDataItem, rows_count: int, max_chunk_bytes: int, chunk_size: int
+) -> int:
+    """Computes number of rows in the next batch so it fits in `max_chunk_bytes`"""
+    item_bytes = _estimate_item_bytes(item)
+    if not item_bytes or not rows_count:
+        return chunk_size
+    return max(1, min(chunk_size, max_chunk_bytes * rows_count // item_bytes))
+
+
+def _split_range(low: Any, high: Any, partitions: int) -> List[Any]:
+    """Splits range between `low` and `high` into at most `partitions` parts of equal width.
+    Returns inner boundaries in ascending order. Works for numbers, dates and datetimes.
+    """
+    if isinstance(low, int) and isinstance(high, int):
+        boundaries = [low + (high - low + 1) * idx // partitions for idx in range(1, partitions)]
+    elif isinstance(low, (float, Decimal, date)):
+        step = (high - low) / partitions
+        boundaries = [low + step * idx for idx in range(1, partitions)]
+    else:
+        raise ValueError(
+            f"Cannot split range of values of type `{type(low).__name__}` into partitions. Use"
+            " numeric, date or datetime partition column or `modulo` partition strategy."
+        )
+    return sorted(b for b in set(boundaries) if low < b <= high)
+
+
+_PARTITION_DONE = object()
+
+
+class _PartitionFailed(NamedTuple):
+    exception: BaseException
+
+
+def _iter_concurrently(
+    partitions: Sequence[Callable[[], Iterator[TDataItem]]],
+    max_rows: Optional[int] = None,
+) -> Iterator[TDataItem]:
+    """Runs each partition generator in its own thread and yields items in order of arrival.
+    Producers are stopped when any partition fails, when the consumer closes the generator or
+    when `max_rows` rows were yielded. The item that exceeds `max_rows` is truncated.
+    """
+    # keep at most one pending item per partition to bound memory
+    items: "Queue[Any]" = Queue(maxsize=len(partitions))
+    stop = threading.Event()
+
+    def _put(item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except Full:
+                pass
+        return False
+
+    def _produce(partition: Callable[[], Iterator[TDataItem]]) -> None:
+        if stop.is_set():
+            return
+        gen = partition()
+        try:
+            for item in gen:
+                if not _put(item):
+                    return
+            _put(_PARTITION_DONE)
+        except BaseException as ex:
+            _put(_PartitionFailed(ex))
+        finally:
+            gen.close()
+
+    pool = ThreadPoolExecutor(len(partitions), thread_name_prefix="dlt_sql_partition")
+    try:
+        for partition in partitions:
+            pool.submit(_produce, partition)
+        remaining = len(partitions)
+        while remaining:
+            item = items.get()
+            if item is _PARTITION_DONE:
+                remaining -= 1
+            elif isinstance(item, _PartitionFailed):
+                raise item.exception
+            elif max_rows is not None and len(item) >= max_rows:
+                # lists, arrow tables and data frames are sliced by rows
+                yield item[:max_rows]
+                return
+            else:
+                if max_rows is not None:
+                    max_rows -= len(item)
+                yield item
+    finally:
+        stop.set()
+        pool.shutdown(wait=True)
+
+
 def _execute_table_adapter(
     table: Table,
     adapter: Optional[TTableAdapter],
@@ -478,3 +748,7 @@ class SqlTableResourceConfiguration(BaseConfiguration):
     write_disposition: Optional[TWriteDispositionDict] = None
     primary_key: Optional[TColumnNames] = None
     merge_key: Optional[TColumnNames] = None
+    partitions: Optional[int] = None
+    partition_column: Optional[str] = None
+    partition_strategy: Optional[TPartitionStrategy] = "range"
+    max_chunk_bytes: Optional[int] = None
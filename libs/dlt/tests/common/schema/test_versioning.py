@@ -44,6 +44,60 @@ def test_content_hash() -> None:
     assert utils.generate_version_hash(eth_v4) != hash2
 
 
+def test_schema_hash_tracks_modified_tables() -> None:
+    eth_v11: TStoredSchema = load_yml_case("schemas/eth/ethereum_schema_v11")
+    schema = Schema.from_dict(eth_v11)  # type: ignore[arg-type]
+
+    def _full_hash() -> str:
+        return utils.generate_version_hash(schema.to_dict(bump_version=False))
+
+    version_hash = schema.version_hash
+    assert version_hash == _full_hash() == eth_v11["version_hash"]
+
+    # update table
+    schema.update_table(utils.new_table("event_user", columns=[utils.new_column("col1")]))
+    assert schema.version_hash == _full_hash() != version_hash
+    version_hash = schema.version_hash
+
+    # modify table returned by get_table in place
+    schema.get_table("blocks")["write_disposition"] = "replace"
+    assert schema.version_hash == _full_hash() != version_hash
+    version_hash = schema.version_hash
+
+    # modify table via tables
+    schema.tables["blocks"]["columns"]["number"]["nullable"] = True
+    assert schema.version_hash == _full_hash() != version_hash
+    version_hash = schema.version_hash
+
+    # drop table
+    schema.drop_tables(["event_user"])
+    assert schema.version_hash == _full_hash() != version_hash
+
+    # saved hash is the same as computed from scratch
+    stored_schema = schema.to_dict()
+    assert stored_schema["version_hash"] == utils.generate_version_hash(stored_schema)
+
+
+def test_schema_hash_table_reference_held_across_hashing() -> None:
+    eth_v11: TStoredSchema = load_yml_case("schemas/eth/ethereum_schema_v11")
+    schema = Schema.from_dict(eth_v11)  # type: ignore[arg-type]
+    # references taken before the hash is computed
+    blocks = schema.get_table("blocks")
+    tables = schema.tables
+    version, version_hash = schema._bump_version()
+
+    blocks["write_disposition"] = "replace"
+    assert schema.version_hash != version_hash
+    assert schema.version_hash == utils.generate_version_hash(schema.to_dict(bump_version=False))
+    assert schema._bump_version()[0] == version + 1
+    version_hash = schema.version_hash
+
+    tables["blocks"]["columns"]["number"]["nullable"] = True
+    assert schema.is_modified
+    assert schema._bump_version() == (version + 2, schema.version_hash)
+    assert schema.version_hash != version_hash
+
+
 def test_bump_version_no_stored_hash() -> None:
     eth_v3: TStoredSchema = load_yml_case("schemas/eth/ethereum_schema_v3")
     assert "version_hash" not in eth_v3
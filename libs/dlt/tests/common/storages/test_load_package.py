@@ -1,6 +1,7 @@
 import os
 import pytest
 from pathlib import Path
+from unittest import mock
 from os.path import join
 
 import dlt
@@ -14,6 +15,7 @@ from dlt.common.pendulum import pendulum
 from dlt.common.configuration.container import Container
 from dlt.common.storages.load_package import (
     LoadPackageStateInjectableContext,
+    PackageJobsJournal,
     create_load_id,
     destination_state,
     load_package_state,
@@ -282,9 +284,12 @@ def test_build_parse_job_path(load_storage: LoadStorage) -> None:
         ParsedLoadJobFileName.parse("tab.id.wrong_retry.jsonl")
 
 
-def test_load_package_listings(load_storage: LoadStorage) -> None:
+@pytest.mark.parametrize("jobs_journal", (False, True), ids=("folders", "jobs_journal"))
+def test_load_package_listings(load_storage: LoadStorage, jobs_journal: bool) -> None:
     # 100 csv files
     load_id = create_load_package(load_storage.new_packages, 100)
+    if jobs_journal:
+        load_storage.new_packages.create_jobs_journal(load_id)
     new_jobs = load_storage.new_packages.list_new_jobs(load_id)
     assert len(new_jobs) == 100
     assert len(load_storage.new_packages.list_job_with_states_for_table(load_id, "items_1")) == 100
@@ -395,6 +400,79 @@ def test_load_package_listings(load_storage: LoadStorage) -> None:
         assert os.path.isabs(job.file_path)
 
 
+def test_jobs_journal(load_storage: LoadStorage) -> None:
+    load_id = create_load_package(load_storage.new_packages, 10)
+    new_jobs = sorted(load_storage.new_packages.list_new_jobs(load_id))
+    # start and fail a job before journal is created
+    load_storage.new_packages.start_job(load_id, os.path.basename(new_jobs[0]))
+    load_storage.new_packages.fail_job(load_id, os.path.basename(new_jobs[0]), "error!")
+    load_storage.commit_new_load_package(load_id)
+    packages = load_storage.normalized_packages
+    packages.create_jobs_journal(load_id)
+    assert packages.has_jobs_journal(load_id)
+    # all job files are in new jobs folder
+    new_jobs_folder = packages.get_job_state_folder_path(load_id, "new_jobs")
+    assert len(packages.storage.list_folder_files(new_jobs_folder)) == 10
+    assert len(packages.list_new_jobs(load_id)) == 9
+    assert packages.list_failed_jobs(load_id) == [
+        os.path.join(new_jobs_folder, os.path.basename(new_jobs[0]))
+    ]
+    assert (
+        packages.get_job_failed_message(load_id, ParsedLoadJobFileName.parse(new_jobs[0]))
+        == "error!"
+    )
+
+    # jobs do not move
+    file_name = os.path.basename(new_jobs[1])
+    started_path = packages.start_job(load_id, file_name)
+    assert started_path == packages.storage.make_full_path(os.path.join(new_jobs_folder, file_name))
+    assert packages.get_job_file_path(load_id, "started_jobs", file_name) == os.path.join(
+        new_jobs_folder, file_name
+    )
+    # retry renames file in place
+    retry_path = packages.retry_job(load_id, file_name)
+    assert os.path.dirname(retry_path) == packages.storage.make_full_path(new_jobs_folder)
+    assert os.path.isfile(retry_path)
+    assert len(packages.storage.list_folder_files(new_jobs_folder)) == 10
+
+    # a crash leaves partially written entry
+    journal_path = packages.storage.make_full_path(packages.get_jobs_journal_path(load_id))
+    with open(journal_path, "ab") as f:
+        f.write(b'{"job":"broken')
+    # state is read by other storage instance
+    other_storage = LoadStorage(False, LoadStorage.ALL_SUPPORTED_FILE_FORMATS, load_storage.config)
+    assert sorted(other_storage.normalized_packages.list_new_jobs(load_id)) == sorted(
+        packages.list_new_jobs(load_id)
+    )
+    other_storage.normalized_packages.start_job(load_id, os.path.basename(retry_path))
+    # partial entry was dropped
+    with open(journal_path, "rb") as f:
+        assert b"broken" not in f.read()
+    packages.complete_job(load_id, os.path.basename(retry_path))
+    # journal is resolved once per package, not per job
+    with mock.patch.object(
+        PackageJobsJournal, "refresh", autospec=True, side_effect=PackageJobsJournal.refresh
+    ) as refresh_mock, mock.patch.object(
+        packages.storage, "has_file", wraps=packages.storage.has_file
+    ) as has_file_mock:
+        package_info = packages.get_load_package_info(load_id)
+        assert refresh_mock.call_count == 1
+        # only package completed and applied schema updates markers are checked
+        assert has_file_mock.call_count == 2
+    assert len(package_info.jobs["completed_jobs"]) == 1
+    assert len(package_info.jobs["failed_jobs"]) == 1
+    assert len(package_info.jobs["new_jobs"]) == 8
+    for job in package_info.jobs["completed_jobs"] + package_info.jobs["failed_jobs"]:
+        assert job.file_size > 0
+        assert os.path.isfile(job.file_path)
+
+    # journal moves with the package
+    load_storage.complete_load_package(load_id, aborted=False)
+    package_info = load_storage.loaded_packages.get_load_package_info(load_id)
+    assert len(package_info.jobs["completed_jobs"]) == 1
+    assert len(package_info.jobs["new_jobs"]) == 8
+
+
 def test_get_load_package_info_perf(load_storage: LoadStorage) -> None:
     import time
 
@@ -0,0 +1,95 @@
+import os
+from unittest import mock
+
+import pytest
+
+import dlt
+from dlt.dataset.cache import RelationResultCache
+
+from tests.utils import TEST_STORAGE_ROOT
+
+
+@pytest.fixture
+def result_cache() -> RelationResultCache:
+    return RelationResultCache(os.path.join(TEST_STORAGE_ROOT, "relation_results"))
+
+
+@pytest.fixture
+def pipeline() -> dlt.Pipeline:
+    pipeline = dlt.pipeline("_relation_result_cache", destination="duckdb")
+    pipeline.run([{"id": 1}, {"id": 2}, {"id": 3}], table_name="purchases")
+    return pipeline
+
+
+def test_arrow_and_df_from_result_cache(
+    pipeline: dlt.Pipeline, result_cache: RelationResultCache
+) -> None:
+    dataset = pipeline.dataset(result_cache=result_cache)
+    relation = dataset.purchases.where("id", "gt", 1).select("id")
+
+    expected = relation.arrow()
+    assert expected.num_rows == 2
+    assert result_cache.total_bytes > 0
+    # data frames are created by the destination driver on a miss
+    expected_df = relation.df()
+
+    with mock.patch.object(
+        dlt.Relation, "_wrap_func", autospec=True, side_effect=dlt.Relation._wrap_func
+    ) as wrap_mock:
+        assert dataset.purchases.where("id", "gt", 1).select("id").arrow().equals(expected)
+        cached_df = relation.df()
+        assert cached_df.equals(expected_df)
+        assert cached_df.dtypes.equals(expected_df.dtypes)
+        # only the newest load id was queried
+        assert [call.args[1] for call in wrap_mock.call_args_list] == ["fetchmany", "fetchmany"]
+
+    # other relations are not served from the cache
+    assert dataset.purchases.arrow().num_rows == 3
+    # chunked reads bypass the cache
+    assert relation.arrow(chunk_size=1).num_rows <= 2
+
+
+def test_result_cache_key_includes_destination(
+    pipeline: dlt.Pipeline, result_cache: RelationResultCache
+) -> None:
+    dataset = pipeline.dataset(result_cache=result_cache)
+    sql = dataset.purchases.to_sql()
+    key = dataset._get_result_cache_key(sql, "arrow")
+    assert key == dataset._get_result_cache_key(sql, "arrow")
+    assert key != dataset._get_result_cache_key(sql, "df")
+
+    # same configuration under another destination name does not share results
+    dataset._destination_fingerprint = None
+    with mock.patch.object(dataset.destination_client.config, "destination_name", "other_duckdb"):
+        assert key != dataset._get_result_cache_key(sql, "arrow")
+
+
+def test_result_cache_invalidated_by_new_load(
+    pipeline: dlt.Pipeline, result_cache: RelationResultCache
+) -> None:
+    dataset = pipeline.dataset(result_cache=result_cache)
+    assert dataset.purchases.arrow().num_rows == 3
+
+    pipeline.run([{"id": 4}], table_name="purchases")
+    assert dataset.purchases.arrow().num_rows == 4
+
+
+def test_result_cache_evicts_least_recently_used(
+    pipeline: dlt.Pipeline, result_cache: RelationResultCache
+) -> None:
+    dataset = pipeline.dataset(result_cache=result_cache)
+    dataset.purchases.where("id", "eq", 1).arrow()
+    # room for two results
+    result_cache.max_bytes = int(result_cache.total_bytes * 2.5)
+    dataset.purchases.where("id", "eq", 2).arrow()
+    dataset.purchases.where("id", "eq", 1).arrow()
+    dataset.purchases.where("id", "eq", 3).arrow()
+    assert result_cache.total_bytes <= result_cache.max_bytes
+    assert len(os.listdir(result_cache.cache_dir)) == 2
+
+    # index is rebuilt from the cache directory
+    reloaded = RelationResultCache(result_cache.cache_dir, max_bytes=result_cache.max_bytes)
+    assert reloaded.total_bytes == result_cache.total_bytes
+    reloaded.clear()
+    assert reloaded.total_bytes == 0
+    assert os.listdir(result_cache.cache_dir) == []
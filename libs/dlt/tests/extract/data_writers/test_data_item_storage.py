@@ -3,7 +3,8 @@ from typing import Type
 import pytest
 
 from dlt.common.configuration.container import Container
-from dlt.common.data_writers.writers import DataWriter
+from dlt.common.data_writers import BufferedDataWriter
+from dlt.common.data_writers.writers import DataWriter, JsonlWriter
 from dlt.common.destination.capabilities import DestinationCapabilitiesContext
 from dlt.common.metrics import DataWriterMetrics
 from dlt.common.schema.utils import new_column
@@ -53,3 +54,53 @@ def test_write_items(writer_type: Type[DataWriter]) -> None:
         assert len(item_storage.closed_files("load_2")) == 1
         item_storage.close_writers("load_2")
         assert len(item_storage.closed_files("load_2")) == 2
+
+
+def test_buffers_budget() -> None:
+    os.environ["DATA_WRITER__BUFFERS_MAX_BYTES"] = "10000"
+    writer_spec = JsonlWriter.writer_spec()
+    item_storage = ItemTestStorage(writer_spec)
+    budget = item_storage.buffers_budget
+    assert budget.max_bytes == 10000
+    t1 = {"col1": new_column("col1", "bigint")}
+
+    # many small tables stay buffered
+    for table_idx in range(10):
+        item_storage.write_data_item("load_1", "schema", f"small_{table_idx}", [{"col1": 1}], t1)
+    assert budget.flushes_count == 0
+    writers = item_storage.buffered_writers
+    assert all(w._file is None for w in writers.values())
+    assert budget.used_bytes == sum(w.buffered_items_bytes for w in writers.values())
+
+    # large table exceeds the budget and gets flushed first
+    item_storage.write_data_item("load_1", "schema", "large", [{"col1": i} for i in range(40)], t1)
+    large_writer = writers["load_1.schema.large"]
+    assert budget.flushes_count == 1
+    assert large_writer.buffered_items_bytes == 0
+    assert large_writer._file is not None
+    assert all(w._file is None for n, w in writers.items() if n != "load_1.schema.large")
+    # row size measured on flush
+    assert large_writer._row_size != BufferedDataWriter.DEFAULT_ROW_SIZE
+
+    item_storage.close_writers("load_1")
+    assert budget.used_bytes == 0
+
+
+def test_buffers_budget_flush_rotates_files() -> None:
+    os.environ["DATA_WRITER__BUFFERS_MAX_BYTES"] = "10000"
+    os.environ["DATA_WRITER__FILE_MAX_BYTES"] = "100"
+    item_storage = ItemTestStorage(JsonlWriter.writer_spec())
+    budget = item_storage.buffers_budget
+    t1 = {"col1": new_column("col1", "bigint")}
+
+    item_storage.write_data_item("load_1", "schema", "a", [{"col1": i} for i in range(30)], t1)
+    assert budget.flushes_count == 0
+    # writing to another table flushes the largest buffer which exceeds max file size
+    item_storage.write_data_item("load_1", "schema", "b", [{"col1": i} for i in range(20)], t1)
+    assert budget.flushes_count == 1
+    a_writer = item_storage.buffered_writers["load_1.schema.a"]
+    assert a_writer._file is None
+    assert len(a_writer.closed_files) == 1
+    assert a_writer.closed_files[0].items_count == 30
+    item_storage.close_writers("load_1")
+    assert len(item_storage.closed_files("load_1")) == 2
@@ -3,6 +3,7 @@ import asyncio
 import inspect
 from typing import ClassVar, List, Sequence
 import time
+import threading
 
 import pytest
 
@@ -10,7 +11,8 @@ import dlt
 from dlt.common import sleep
 from dlt.common.typing import TDataItems
 from dlt.extract.exceptions import CreatePipeException, ResourceExtractionError, UnclosablePipe
-from dlt.extract.items import DataItemWithMeta
+from dlt.extract.concurrency import FuturesPool
+from dlt.extract.items import DataItemWithMeta, ResolvablePipeItem
 from dlt.extract.items_transform import FilterItem, MapItem, YieldMapItem
 from dlt.extract.pipe import Pipe
 from dlt.extract.pipe_iterator import PipeIterator, ManagedPipeIterator, PipeItem
@@ -115,6 +117,211 @@ def test_rotation_on_none() -> None:
     assert time.time() - started < 3.5
 
 
+def test_futures_limit_per_resource() -> None:
+    in_flight = {"data1": 0, "data2": 0}
+    max_in_flight = {"data1": 0, "data2": 0}
+    lock = threading.Lock()
+
+    def source_gen(name: str):
+        @dlt.defer
+        def _next_item(p: int) -> int:
+            with lock:
+                in_flight[name] += 1
+                max_in_flight[name] = max(max_in_flight[name], in_flight[name])
+            time.sleep(0.02)
+            with lock:
+                in_flight[name] -= 1
+            return p
+
+        for i in range(10):
+            yield _next_item(i)
+
+    def get_pipes():
+        return [
+            Pipe.from_data("data1", source_gen("data1")),
+            Pipe.from_data("data2", source_gen("data2")),
+        ]
+
+    with PipeIterator.from_pipes(
+        get_pipes(), max_parallel_items=10, workers=10, max_parallel_items_per_resource=2
+    ) as pipes:
+        _l = list(pipes)
+        metrics = pipes.futures_pool_metrics
+    assert sorted(pi.item for pi in _l if pi.pipe.name == "data1") == list(range(10))
+    assert max_in_flight["data1"] <= 2
+    assert max_in_flight["data2"] <= 2
+    # all items were submitted and consumed
+    assert metrics.submitted_count == 20
+    assert metrics.in_flight == 0
+    assert metrics.done_pending == 0
+    assert metrics.max_in_flight <= 4
+    # saturated pipes are skipped so submit never waits for a slot
+    assert metrics.slot_waits_count == 0
+
+
+def test_futures_saturated_resource_does_not_block() -> None:
+    def slow_gen():
+        @dlt.defer
+        def _next_item(p: int) -> int:
+            time.sleep(0.3)
+            return p
+
+        for i in range(3):
+            yield _next_item(i)
+
+    def get_pipes():
+        return [
+            Pipe.from_data("slow", slow_gen()),
+            Pipe.from_data("fast", iter(range(10))),
+        ]
+
+    with PipeIterator.from_pipes(
+        get_pipes(), max_parallel_items=10, workers=10, max_parallel_items_per_resource=1
+    ) as pipes:
+        _l = list(pipes)
+    # fast items are not held back while slow pipe waits for its only slot
+    assert [pi.pipe.name for pi in _l] == ["fast"] * 10 + ["slow"] * 3
+    assert [pi.item for pi in _l if pi.pipe.name == "slow"] == [0, 1, 2]
+
+
+def test_futures_full_pool_does_not_block_data_items() -> None:
+    def slow_gen():
+        @dlt.defer
+        def _next_item(p: int) -> int:
+            time.sleep(0.3)
+            return p
+
+        for i in range(3):
+            yield _next_item(i)
+
+    def get_pipes():
+        return [
+            Pipe.from_data("slow", slow_gen()),
+            Pipe.from_data("fast", iter(range(10))),
+        ]
+
+    with PipeIterator.from_pipes(get_pipes(), max_parallel_items=1, workers=1) as pipes:
+        _l = list(pipes)
+        metrics = pipes.futures_pool_metrics
+    # data items are not held back while the slow pipe waits for a free slot in the pool
+    assert [pi.pipe.name for pi in _l] == ["fast"] * 10 + ["slow"] * 3
+    assert [pi.item for pi in _l if pi.pipe.name == "slow"] == [0, 1, 2]
+    assert metrics.slot_waits_count == 0
+
+
+@pytest.mark.parametrize("asyncio_native", [False, True])
+def test_preserve_items_order(asyncio_native: bool) -> None:
+    def source_gen(name: str):
+        @dlt.defer
+        def _next_item(p: int) -> int:
+            # later items finish first
+            time.sleep((10 - p) * 0.01)
+            return p
+
+        for i in range(10):
+            yield _next_item(i)
+
+    def get_pipes():
+        return [
+            Pipe.from_data("data1", source_gen("data1")),
+            Pipe.from_data("data2", source_gen("data2")),
+        ]
+
+    async def _consume_async(pipes: PipeIterator) -> List[PipeItem]:
+        return [pi async for pi in pipes]
+
+    with PipeIterator.from_pipes(
+        get_pipes(), max_parallel_items=10, workers=10, preserve_items_order=True
+    ) as pipes:
+        _l = asyncio.run(_consume_async(pipes)) if asyncio_native else list(pipes)
+    assert [pi.item for pi in _l if pi.pipe.name == "data1"] == list(range(10))
+    assert [pi.item for pi in _l if pi.pipe.name == "data2"] == list(range(10))
+
+
+def test_preserve_items_order_cancelled_future() -> None:
+    pool = FuturesPool(workers=1, poll_interval=5.0, preserve_items_order=True)
+    pipe = Pipe.from_data("data", [])
+    release = threading.Event()
+
+    def _item(p: int):
+        def _next_item() -> int:
+            # block the only worker so next items stay queued
+            if p == 0:
+                release.wait()
+            return p
+
+        return _next_item
+
+    futures = [pool.submit(ResolvablePipeItem(_item(p), None, pipe, None)) for p in range(3)]
+    try:
+        assert futures[1].cancel()
+        release.set()
+        resolved = []
+        while len(resolved) < 2:
+            # raises timeout if the cancelled future holds back the last item
+            if (pipe_item := pool.resolve_next_future(use_configured_timeout=True)) is not None:
+                resolved.append(pipe_item.item)
+        # cancelled future was dropped from the pool
+        assert pool.empty
+    finally:
+        pool.close()
+    assert resolved == [0, 2]
+
+
+def test_asyncio_native_pipe_iterator() -> None:
+    loop_threads = set()
+    in_flight = 0
+    max_in_flight = 0
+
+    async def async_gen(name: str):
+        for i in range(10):
+            loop_threads.add(threading.get_ident())
+            await asyncio.sleep(0.001)
+            yield f"{name}_{i}"
+
+    def get_pipes():
+        parent = Pipe.from_data("data", async_gen("data"))
+
+        async def enrich(item: str):
+            nonlocal in_flight, max_in_flight
+            loop_threads.add(threading.get_ident())
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            return item.upper()
+
+        # async transformer and sync map step
+        child = Pipe("enriched", [enrich], parent=parent)
+        child.append_step(MapItem(lambda item: item + "!"))
+        return [parent, child, Pipe.from_data("other", async_gen("other"))]
+
+    async def _consume():
+        with PipeIterator.from_pipes(
+            get_pipes(), max_parallel_items=20, asyncio_native=True
+        ) as pipes:
+            assert pipes.asyncio_native is True
+            _l = [pi async for pi in pipes]
+            return _l, pipes.futures_pool_metrics
+
+    _l, metrics = asyncio.run(_consume())
+    assert sorted(pi.item for pi in _l if pi.pipe.name == "data") == sorted(
+        f"data_{i}" for i in range(10)
+    )
+    assert sorted(pi.item for pi in _l if pi.pipe.name == "other") == sorted(
+        f"other_{i}" for i in range(10)
+    )
+    assert sorted(pi.item for pi in _l if pi.pipe.name == "enriched") == sorted(
+        f"DATA_{i}!" for i in range(10)
+    )
+    # everything ran in the main thread, no background loop was started
+    assert loop_threads == {threading.get_ident()}
+    # transformers were evaluated concurrently
+    assert max_in_flight > 1
+    assert metrics.in_flight == 0
+    assert metrics.done_pending == 0
+
+
 def test_add_step() -> None:
     data = [1, 2, 3]
     data_iter = iter(data)
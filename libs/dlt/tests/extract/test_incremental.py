@@ -41,6 +41,13 @@ from dlt.extract.incremental.exceptions import (
     IncrementalPrimaryKeyMissing,
 )
 from dlt.extract.incremental.lag import apply_lag
+from dlt.extract.incremental.transform import JsonIncremental
+from dlt.extract.incremental.unique_hashes import (
+    digest64,
+    digest_to_compact,
+    pack_compact_hashes,
+    unpack_compact_hashes,
+)
 from dlt.extract.items_transform import ValidateItem
 from dlt.extract.resource import DltResource
 from dlt.pipeline.exceptions import PipelineStepFailed
@@ -225,6 +232,69 @@ def test_unique_keys_are_deduplicated(item_type: TestDataItemFormat) -> None:
     assert rows == [(1, "a"), (2, "b"), (3, "c"), (3, "d"), (3, "e"), (3, "f"), (4, "g")]
 
 
+def test_compact_unique_hashes_helpers() -> None:
+    # compact hash is a prefix of the digest so digests in state can be converted
+    for value in ["1", '"a"', '{"id": 1}', ""]:
+        assert digest_to_compact(digest128(value)) == digest64(value)
+    hashes = {digest64(str(i)) for i in range(1000)}
+    packed = pack_compact_hashes(hashes)
+    assert len(packed) == 8 * 1000
+    # sorted, little endian unsigned integers
+    assert int.from_bytes(packed[:8], "little") == min(hashes)
+    assert unpack_compact_hashes(packed) == hashes
+    assert unpack_compact_hashes(b"") == set()
+    with pytest.raises(ValueError):
+        unpack_compact_hashes(packed[:-1])
+    with pytest.raises(ValueError):
+        dlt.sources.incremental("created_at", unique_hashes_format="bloom")  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("item_type", ALL_TEST_DATA_ITEM_FORMATS)
+def test_compact_unique_hashes(item_type: TestDataItemFormat) -> None:
+    data1 = [{"created_at": 1, "id": 0}] + [{"created_at": 2, "id": i} for i in range(1, 500)]
+    # all rows with created_at == 2 were already loaded
+    data2 = [{"created_at": 2, "id": i} for i in range(1, 510)] + [{"created_at": 3, "id": 510}]
+
+    @dlt.resource(primary_key="id")
+    def some_data(
+        created_at=dlt.sources.incremental("created_at", unique_hashes_format="digest"),
+        data: Optional[Sequence[Dict[str, Any]]] = None,
+    ):
+        data = data or data1
+        yield from chunks(data_to_item_format(item_type, data), 100)
+
+    p = dlt.pipeline(pipeline_name="p" + uniq_id())
+
+    def _state() -> Dict[str, Any]:
+        return p.state["sources"][p.default_schema_name]["resources"]["some_data"]["incremental"][
+            "created_at"
+        ]
+
+    def _extracted_count() -> int:
+        extract_info = p.last_trace.last_extract_info
+        return extract_info.metrics[extract_info.loads_ids[0]][0]["table_metrics"][
+            "some_data"
+        ].items_count
+
+    # digest hashes from the first run are converted when switching to compact format
+    p.extract(some_data())
+    assert len(_state()["unique_hashes"]) == 499
+    assert "unique_hashes_compact" not in _state()
+    compact_incremental = dlt.sources.incremental("created_at", unique_hashes_format="compact")
+    p.extract(some_data(created_at=compact_incremental, data=data2))
+    assert _extracted_count() == 11
+    assert _state()["unique_hashes"] == []
+    assert _state()["unique_hashes_compact"] == pack_compact_hashes([digest64(json.dumps(510))])
+
+    # compact hashes survive state serialization
+    p = dlt.attach(p.pipeline_name)
+    assert isinstance(_state()["unique_hashes_compact"], bytes)
+    data3 = [{"created_at": 3, "id": 510}, {"created_at": 3, "id": 511}]
+    p.extract(some_data(created_at=compact_incremental, data=data3))
+    assert _extracted_count() == 1
+    assert len(_state()["unique_hashes_compact"]) == 16
+
+
 def test_pandas_index_as_dedup_key() -> None:
     from dlt.common.libs.pandas import pandas_to_arrow, pandas as pd
 
@@ -4480,3 +4550,43 @@ def test_custom_metrics_in_incremental() -> None:
     # None items should increment unfiltered_items_count
     load_id = _run_with_items([None, None, {"id": 9, "value": "9"}], True)
     _assert_custom_metrics(load_id, 12, 6, 1, 1, 1)
+
+
+@pytest.mark.parametrize("last_value_func", [max, min])
+@pytest.mark.parametrize("cursor_path", ["updated_at", "data.updated_at"])
+@pytest.mark.parametrize("on_cursor_value_missing", ["include", "exclude"])
+def test_json_filter_rows_same_as_row_by_row(
+    last_value_func: Any, cursor_path: str, on_cursor_value_missing: Any
+) -> None:
+    random.seed(42)
+    rows = []
+    for idx in range(500):
+        value = random.randint(0, 20) if idx % 17 else None
+        if cursor_path == "updated_at":
+            rows.append({"id": idx, "updated_at": value})
+        else:
+            rows.append({"id": idx, "data": {"updated_at": value}})
+    rows.insert(10, None)
+
+    def _transform() -> JsonIncremental:
+        start_unique_hashes = {digest128(json.dumps(idx)) for idx in range(0, 500, 3)}
+        return JsonIncremental(
+            "some_data",
+            cursor_path,
+            initial_value=10,
+            start_value=10,
+            end_value=18 if last_value_func is max else 2,
+            last_value_func=last_value_func,
+            primary_key="id",
+            unique_hashes=start_unique_hashes,
+            on_cursor_value_missing=on_cursor_value_missing,
+        )
+
+    batch_transform, row_transform = _transform(), _transform()
+    for batch in chunks(rows, 101):
+        assert batch_transform.filter_rows(batch) == row_transform._filter_rows_one_by_one(batch)
+        assert batch_transform.last_value == row_transform.last_value
+        assert batch_transform.last_rows == row_transform.last_rows
+    assert batch_transform.compute_unique_values_batch(batch_transform.last_rows, "id") == [
+        row_transform.compute_unique_value(row, "id") for row in row_transform.last_rows
+    ]
@@ -253,3 +253,29 @@ def test_validation_with_contracts(yield_list: bool) -> None:
     assert len(items) == 3
     # c is gone from the last model
     assert "c" not in items[2]
+
+
+@pytest.mark.parametrize("yield_list", [True, False])
+def test_validation_custom_metrics(yield_list: bool) -> None:
+    @dlt.resource(columns=SimpleModel, schema_contract="discard_row")
+    def some_data() -> t.Iterator[TDataItems]:
+        items = [{"a": 1, "b": "z"}, {"a": "not_int", "b": "x"}, {"a": 2, "b": "y"}]
+        if yield_list:
+            yield items
+        else:
+            yield from items
+
+    r = some_data()
+    assert len(list(r)) == 2
+    metrics = r.validator.custom_metrics
+    assert metrics["validated_items_count"] == 3
+    assert metrics["discarded_items_count"] == 1
+    assert metrics["validation_time"] >= 0.0
+
+    # reported with the resource metrics in the extract trace
+    p = dlt.pipeline(pipeline_name="validation_metrics", destination="dummy")
+    extract_info = p.extract(some_data())
+    load_id = extract_info.loads_ids[0]
+    resource_metrics = extract_info.metrics[load_id][0]["resource_metrics"]["some_data"]
+    assert resource_metrics.custom_metrics["validated_items_count"] == 3
+    assert resource_metrics.custom_metrics["discarded_items_count"] == 1
@@ -32,9 +32,11 @@ from dlt.common.libs.pydantic import (
     apply_schema_contract_to_model,
     validate_and_filter_item,
     validate_and_filter_items,
+    validate_and_dump_items,
     create_list_model,
+    create_list_validator,
 )
-from pydantic import UUID4, BaseModel, Json, AnyHttpUrl, ConfigDict, ValidationError
+from pydantic import UUID4, BaseModel, Json, AnyHttpUrl, ConfigDict, Field, ValidationError
 
 from dlt.common.schema.exceptions import DataValidationError
 
@@ -561,6 +563,46 @@ def test_item_list_validation() -> None:
     assert len(items) == 3
 
 
+def test_item_list_validate_and_dump() -> None:
+    class ItemModel(BaseModel):
+        b: bool
+        opt: Optional[int] = Field(default=None, alias="optional")
+
+    discard_model = apply_schema_contract_to_model(ItemModel, "discard_row", "discard_row")
+    discard_validator = create_list_validator(discard_model)
+
+    items = [{"b": True, "optional": 1}, {"b": 2, "optional": "not int", "extra": 1.2}, {"b": 0}]
+    dumped = validate_and_dump_items(
+        "items", discard_model, discard_validator, items, "discard_row", "discard_row"
+    )
+    # same result as dumping each parsed model
+    expected = [
+        m.dict(by_alias=True)
+        for m in validate_and_filter_items(
+            "items", create_list_model(discard_model), list(items), "discard_row", "discard_row"
+        )
+    ]
+    assert dumped == expected == [{"b": True, "optional": 1}, {"b": False, "optional": None}]
+    # input list is not modified
+    assert len(items) == 3
+
+    freeze_model = apply_schema_contract_to_model(ItemModel, "freeze", "freeze")
+    with pytest.raises(DataValidationError) as val_ex:
+        validate_and_dump_items(
+            "items",
+            freeze_model,
+            create_list_validator(freeze_model),
+            [{"b": True}, {"b": False, "a": 2}],
+            "freeze",
+            "freeze",
+        )
+    # location is reported like for the list model
+    assert val_ex.value.column_name == str(("items", 1, "a"))
+    assert val_ex.value.schema_entity == "columns"
+    assert val_ex.value.table_schema is freeze_model
+    assert val_ex.value.data_item == {"b": False, "a": 2}
+
+
 def test_item_validation() -> None:
     class ItemModel(BaseModel):
         b: bool
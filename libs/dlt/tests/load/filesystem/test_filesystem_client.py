@@ -337,6 +337,40 @@ def test_append_write_disposition(layout: str, default_buckets_env: str) -> None
             assert list(sorted(paths)) == expected_files
 
 
+@pytest.mark.parametrize("bulk_delete", (False, True), ids=("per_file", "bulk"))
+def test_truncate_tables(bulk_delete: bool) -> None:
+    from fsspec.implementations.local import LocalFileSystem
+
+    client = _client_factory(filesystem("random_location"))
+    client.initialize_storage()
+    table_files = {}
+    for table_name in ("event_user", "event_loop"):
+        table_dir = client.get_table_dir(table_name)
+        client.fs_client.makedirs(table_dir, exist_ok=True)
+        table_files[table_name] = [
+            client.pathlib.join(table_dir, f"load_1.{file_id}.jsonl") for file_id in range(5)
+        ]
+        for file_path in table_files[table_name]:
+            client.fs_client.write_text(file_path, "{}", encoding="utf-8")
+
+    # local filesystem is not async, patch it in to use bulk deletes
+    with mock.patch(
+        "dlt.destinations.impl.filesystem.filesystem.AsyncFileSystem",
+        LocalFileSystem if bulk_delete else type("NoFs", (), {}),
+    ):
+        with mock.patch.object(client.fs_client, "rm", wraps=client.fs_client.rm) as rm_mock:
+            client.truncate_tables(["event_user"])
+        assert client.list_table_files("event_user") == []
+        assert sorted(client.list_table_files("event_loop")) == sorted(table_files["event_loop"])
+        if bulk_delete:
+            # a single call for all files
+            rm_mock.assert_called_once()
+            # files that were not deleted are detected
+            with mock.patch.object(client.fs_client, "rm"):
+                with pytest.raises(FileExistsError):
+                    client.truncate_tables(["event_loop"])
+
+
 def test_get_storage_version_current() -> None:
     filesystem_ = filesystem("random_location")
     client = _client_factory(filesystem_)
@@ -7,6 +7,7 @@ import pytest
 import dlt
 import os
 import shutil
+from unittest import mock
 
 
 from dlt import Pipeline
@@ -361,6 +362,88 @@ def test_auto_refresh_views(
         assert len(digits.fetchall()) == 5 if should_refresh else 3
 
 
+@pytest.mark.parametrize(
+    "destination_config",
+    destinations_configs(local_filesystem_configs=True),
+    ids=lambda x: x.name,
+)
+def test_table_files_listing_cache(destination_config: DestinationTestConfiguration) -> None:
+    from dlt.destinations.impl.filesystem.filesystem import FilesystemClient
+
+    pipeline = destination_config.setup_pipeline(
+        "read_pipeline",
+        dataset_name="test_table_files_listing_cache",
+        dev_mode=True,
+    )
+    pipeline.run([1, 2, 3], table_name="digits", loader_file_format=destination_config.file_format)
+
+    def _listed_tables(list_mock: mock.MagicMock) -> list:
+        tables = [call.args[1] for call in list_mock.call_args_list]
+        list_mock.reset_mock()
+        return tables
+
+    with mock.patch.object(
+        FilesystemClient,
+        "list_table_files",
+        autospec=True,
+        side_effect=FilesystemClient.list_table_files,
+    ) as list_mock:
+        with pipeline.dataset() as ds_:
+            assert len(ds_.digits.fetchall()) == 3
+            assert "digits" in _listed_tables(list_mock)
+
+        # new dataset reuses the listing of table files
+        with pipeline.dataset() as ds_:
+            assert len(ds_.digits.fetchall()) == 3
+            assert "digits" not in _listed_tables(list_mock)
+
+        # completed load invalidates the listing
+        pipeline.run(
+            [7, 8], table_name="digits", loader_file_format=destination_config.file_format
+        )
+        _listed_tables(list_mock)
+        with pipeline.dataset() as ds_:
+            assert len(ds_.digits.fetchall()) == 5
+            assert "digits" in _listed_tables(list_mock)
+
+        # views that always refresh list table files on each query
+        pipeline.destination.config_params["always_refresh_views"] = True
+        with pipeline.dataset() as ds_:
+            digits = ds_.digits
+            assert len(digits.fetchall()) == 5
+            _listed_tables(list_mock)
+            assert len(digits.fetchall()) == 5
+            assert "digits" in _listed_tables(list_mock)
+
+
+@pytest.mark.parametrize(
+    "destination_config",
+    destinations_configs(local_filesystem_configs=True),
+    ids=lambda x: x.name,
+)
+def test_table_files_listing_cache_removed_files(
+    destination_config: DestinationTestConfiguration,
+) -> None:
+    pipeline = destination_config.setup_pipeline(
+        "read_pipeline",
+        dataset_name="test_table_files_listing_cache_removed_files",
+        dev_mode=True,
+    )
+    pipeline.run([1, 2, 3], table_name="digits", loader_file_format=destination_config.file_format)
+    with pipeline.dataset() as ds_:
+        assert len(ds_.digits.fetchall()) == 3
+
+    # replace load that did not complete: files are replaced but no new load is recorded
+    with pipeline.destination_client() as client:
+        for file in client.list_table_files("digits"):  # type: ignore[attr-defined]
+            file_dir, file_name = os.path.split(file)
+            client.fs_client.mv(file, os.path.join(file_dir, "replaced_" + file_name))  # type: ignore[attr-defined]
+
+    # cached listing points to removed files so table is listed again
+    with pipeline.dataset() as ds_:
+        assert len(ds_.digits.fetchall()) == 3
+
+
 @pytest.mark.essential
 @pytest.mark.parametrize(
     "destination_config",
@@ -11,9 +11,10 @@ from dlt.common.schema.schema import Schema
 from dlt.common.utils import uniq_id
 
 from dlt.destinations import filesystem, redshift
+from dlt.destinations.impl.postgres.postgres_adapter import postgres_adapter
 
 
-from tests.cases import table_update_and_row
+from tests.cases import assert_all_data_types_row, table_update_and_row
 from tests.load.pipeline.utils import get_load_package_jobs
 from tests.load.utils import (
     destinations_configs,
@@ -165,6 +166,51 @@ def test_postgres_adbc_parquet_loading(destination_config: DestinationTestConfig
     assert len(jobs) == 1
 
 
+@pytest.mark.parametrize(
+    "destination_config",
+    destinations_configs(default_sql_configs=True, subset=["postgres"]),
+    ids=lambda x: x.name,
+)
+@pytest.mark.parametrize("with_geometry", [False, True], ids=["binary", "text"])
+def test_postgres_jsonl_copy_loading(
+    destination_config: DestinationTestConfiguration, with_geometry: bool
+) -> None:
+    column_schemas, data_types = table_update_and_row()
+    if with_geometry:
+        # geometry has no binary encoder so the job falls back to COPY text format
+        column_schemas["col_geom"] = {"name": "col_geom", "data_type": "text"}
+        data_types["col_geom"] = "POINT(1 1)"
+
+    pipeline = destination_config.setup_pipeline("test_postgres_jsonl_copy_loading", dev_mode=True)
+
+    @dlt.resource(file_format="jsonl", columns=column_schemas, max_table_nesting=0)
+    def data_types_resource():
+        yield [data_types] * 10
+
+    resource = data_types_resource()
+    if with_geometry:
+        postgres_adapter(resource, geometry="col_geom")
+    info = pipeline.run(resource)
+    assert_load_info(info)
+    jobs = get_load_package_jobs(
+        info.load_packages[0], "completed_jobs", "data_types_resource", ".jsonl"
+    )
+    assert len(jobs) == 1
+
+    with pipeline.sql_client() as sql_client:
+        qual_name = sql_client.make_qualified_table_name
+        columns = ",".join(sql_client.escape_column_name(c) for c in column_schemas)
+        db_rows = sql_client.execute_sql(
+            f"SELECT {columns} FROM {qual_name('data_types_resource')}"
+        )
+        assert len(db_rows) == 10
+        if with_geometry:
+            column_schemas.pop("col_geom")
+        assert_all_data_types_row(
+            sql_client.capabilities, list(db_rows[0])[: len(column_schemas)], schema=column_schemas
+        )
+
+
 # TODO: uncomment and finalize when we implement encoding for psycopg2
 # @pytest.mark.parametrize(
 #     "destination_config",
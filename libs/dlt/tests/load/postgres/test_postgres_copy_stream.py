@@ -0,0 +1,116 @@
+import io
+import struct
+from typing import Iterator
+
+import pytest
+
+from dlt.common import Decimal
+from dlt.common.json import json
+
+from dlt.destinations.impl.postgres.copy_stream import (
+    PG_COPY_BINARY_HEADER,
+    PG_COPY_BINARY_TRAILER,
+    CopyStreamEncoder,
+    PipelinedChunksReader,
+    get_binary_encoder,
+)
+
+
+def _decode_numeric(data: bytes) -> Decimal:
+    ndigits, weight, sign, dscale = struct.unpack(">hhHh", data[:8])
+    digits = struct.unpack(f">{ndigits}h", data[8:])
+    value = sum(Decimal(d) * Decimal(10000) ** (weight - i) for i, d in enumerate(digits))
+    return -value if sign == 0x4000 else value
+
+
+def test_numeric_encoding() -> None:
+    encoder = get_binary_encoder("numeric(38,9)")
+    data = encoder(Decimal("12345.678"))
+    assert struct.unpack(">hhHh3h", data) == (3, 1, 0, 3, 1, 2345, 6780)
+    # sign, leading fraction zeros, integer values and zero
+    for value in ["-0.001", "0.001", "1000000", "0", "99999999.99999", "2323.34"]:
+        data = encoder(value)
+        assert _decode_numeric(data) == Decimal(value)
+    assert struct.unpack(">hhHh", encoder(Decimal("0.001"))[:8]) == (1, -1, 0, 3)
+    assert struct.unpack(">hhHh", encoder("NaN")) == (0, 0, 0xC000, 0)
+    assert struct.unpack(">hhHh", encoder(Decimal("Infinity"))) == (0, 0, 0xD000, 0)
+    assert struct.unpack(">hhHh", encoder(Decimal("-Infinity"))) == (0, 0, 0xF000, 0)
+    assert struct.unpack(">hhHh", encoder(float("-inf"))) == (0, 0, 0xF000, 0)
+
+
+def test_datetime_encoding() -> None:
+    ts = get_binary_encoder("timestamp (6) with time zone")
+    assert struct.unpack(">q", ts("2000-01-01T00:00:01.5Z")) == (1500000,)
+    assert struct.unpack(">q", ts("2000-01-01T02:00:00+02:00")) == (0,)
+    # naive timestamps are not shifted
+    assert struct.unpack(">q", ts("1999-12-31T23:59:59")) == (-1000000,)
+    assert struct.unpack(">i", get_binary_encoder("date")("2000-01-31")) == (30,)
+    assert struct.unpack(">q", get_binary_encoder("time without time zone")("00:01:00.000001")) == (
+        60000001,
+    )
+
+
+def test_binary_encoders_selection() -> None:
+    assert get_binary_encoder("bigint")(2**56) == struct.pack(">q", 2**56)
+    assert get_binary_encoder("smallint")(-1) == struct.pack(">h", -1)
+    assert get_binary_encoder("varchar(10)")("🦆") == "🦆".encode("utf-8")
+    assert get_binary_encoder("jsonb")({"a": 1}) == b'\x01{"a":1}'
+    assert get_binary_encoder("json")([1]) == b"[1]"
+    assert get_binary_encoder("bytea")("AAE=") == b"\x00\x01"
+    assert get_binary_encoder("geometry(Geometry, 4326)") is None
+
+
+def test_binary_stream() -> None:
+    encoder = CopyStreamEncoder(["id", "name"], ["bigint", "varchar"])
+    assert encoder.copy_format == "binary"
+    rows = [{"id": 1, "name": "a"}, {"id": 2}]
+    f = io.BytesIO(b"\n".join(json.dumpb(row) for row in rows) + b"\n")
+    stream = b"".join(encoder.iter_chunks(f, rows_per_chunk=1))
+    assert stream.startswith(PG_COPY_BINARY_HEADER)
+    assert stream.endswith(PG_COPY_BINARY_TRAILER)
+    body = stream[len(PG_COPY_BINARY_HEADER) : -len(PG_COPY_BINARY_TRAILER)]
+    assert body == (struct.pack(">hiqi", 2, 8, 1, 1) + b"a" + struct.pack(">hiqi", 2, 8, 2, -1))
+
+
+def test_text_stream_fallback() -> None:
+    encoder = CopyStreamEncoder(
+        ["id", "geom", "doc", "blob", "flag"],
+        ["bigint", "geometry(Geometry, 4326)", "jsonb", "bytea", "boolean"],
+    )
+    assert encoder.copy_format == "text"
+    data = encoder.encode_rows(
+        [
+            {"id": 1, "geom": "POINT(1 1)", "doc": {"a": "\t\\"}, "blob": "AAE=", "flag": True},
+            {"id": 2, "geom": "a\nb"},
+        ]
+    )
+    assert data == (
+        b'1\tPOINT(1 1)\t{"a":"\\\\t\\\\\\\\"}\t\\\\x0001\tt\n' + b"2\ta\\nb\t\\N\t\\N\t\\N\n"
+    )
+
+
+def test_pipelined_chunks_reader() -> None:
+    chunks = [bytes([i]) * 1000 for i in range(20)]
+    reader = PipelinedChunksReader(iter(chunks), max_pending_chunks=2)
+    data = b""
+    while block := reader.read(333):
+        data += block
+    reader.close()
+    assert data == b"".join(chunks)
+
+
+def test_pipelined_chunks_reader_exception() -> None:
+    def _chunks() -> Iterator[bytes]:
+        yield b"abc"
+        raise ValueError("encoding failed")
+
+    reader = PipelinedChunksReader(_chunks())
+    assert reader.read() == b"abc"
+    with pytest.raises(ValueError):
+        reader.read()
+    reader.close()
+
+    # closing before all chunks are read stops the producer
+    reader = PipelinedChunksReader(iter([b"x"] * 100), max_pending_chunks=1)
+    assert reader.read(1) == b"x"
+    reader.close()
@@ -1,6 +1,7 @@
 from functools import partial
 from typing import Callable, Any, Literal
 from dataclasses import dataclass
+from datetime import date, datetime  # noqa: I251
 
 import pytest
 
@@ -11,7 +12,15 @@ from dlt.common.exceptions import MissingDependencyException
 from dlt.extract.items_transform import LimitItem
 
 try:
-    from dlt.sources.sql_database.helpers import TableLoader, TableBackend
+    from dlt.sources.sql_database.helpers import (
+        TableLoader,
+        TableBackend,
+        TPartitionStrategy,
+        MEMORY_PROBE_ROWS,
+        _batch_size_for_memory,
+        _estimate_item_bytes,
+        _split_range,
+    )
     from dlt.sources.sql_database.schema_types import table_to_columns
     from tests.load.sources.sql_database.postgres_source import PostgresSourceDB
     import sqlalchemy as sa
@@ -477,6 +486,156 @@ def test_make_query_incremental_range_end_closed(
     assert query.compare(expected)
 
 
+def test_split_range() -> None:
+    assert _split_range(1, 100, 4) == [26, 51, 76]
+    # no empty partitions for narrow ranges
+    assert _split_range(1, 2, 4) == [2]
+    assert _split_range(5, 5, 4) == []
+    assert _split_range(0.0, 1.0, 2) == [0.5]
+    assert _split_range(date(2024, 1, 1), date(2024, 1, 5), 2) == [date(2024, 1, 3)]
+    assert _split_range(datetime(2024, 1, 1), datetime(2024, 1, 1, 4), 4) == [
+        datetime(2024, 1, 1, 1),
+        datetime(2024, 1, 1, 2),
+        datetime(2024, 1, 1, 3),
+    ]
+    with pytest.raises(ValueError):
+        _split_range("a", "z", 2)
+
+
+@pytest.mark.parametrize("partition_strategy", ["range", "modulo"])
+def test_make_partition_clauses(
+    postgres_db: PostgresSourceDB, partition_strategy: TPartitionStrategy
+) -> None:
+    table = postgres_db.get_table("chat_message")
+    loader = TableLoader(
+        postgres_db.engine,
+        "sqlalchemy",
+        table,
+        table_to_columns(table),
+        partitions=4,
+        partition_strategy=partition_strategy,
+    )
+    # partitioned on primary key by default
+    assert loader.partition_column is table.c.id
+    clauses = loader.make_partition_clauses()
+    assert len(clauses) == 4
+
+    # partitions are disjoint and cover all rows
+    ids = []
+    with postgres_db.engine.connect() as conn:
+        for clause in clauses:
+            ids.extend(row.id for row in conn.execute(loader.make_query(clause)))
+    assert sorted(ids) == sorted(postgres_db.table_infos["chat_message"]["ids"])
+
+
+def test_partition_column_validation(postgres_db: PostgresSourceDB) -> None:
+    table = postgres_db.get_table("chat_message")
+    with pytest.raises(KeyError):
+        TableLoader(
+            postgres_db.engine,
+            "sqlalchemy",
+            table,
+            table_to_columns(table),
+            partitions=2,
+            partition_column="not_a_column",
+        )
+    with pytest.raises(ValueError):
+        TableLoader(
+            postgres_db.engine,
+            "sqlalchemy",
+            table,
+            table_to_columns(table),
+            partitions=2,
+            partition_column="created_at",
+            partition_strategy="modulo",
+        )
+    # single partition reads without partition clause
+    loader = TableLoader(
+        postgres_db.engine, "sqlalchemy", table, table_to_columns(table), partitions=1
+    )
+    assert loader.make_partition_clauses() == [None]
+
+
+def test_partitioned_query_limit(postgres_db: PostgresSourceDB) -> None:
+    table = postgres_db.get_table("chat_message")
+    loader = TableLoader(
+        postgres_db.engine,
+        "sqlalchemy",
+        table,
+        table_to_columns(table),
+        chunk_size=3,
+        limit=LimitItem(2, None, False),
+        partitions=4,
+    )
+    # limit of 2 chunks applies to all partitions together
+    rows = [row for item in loader.load_rows() for row in item]
+    assert len(rows) == 6
+    assert len({row["id"] for row in rows}) == 6
+
+
+def test_partitioned_query_adapter_keeps_partition(postgres_db: PostgresSourceDB) -> None:
+    table = postgres_db.get_table("chat_message")
+
+    def _filter_query(query, table):
+        return query.where(table.c.id > 0)
+
+    loader = TableLoader(
+        postgres_db.engine,
+        "sqlalchemy",
+        table,
+        table_to_columns(table),
+        partitions=2,
+        query_adapter_callback=_filter_query,
+    )
+    clauses = loader.make_partition_clauses()
+    assert all(loader.make_query(clause) is not None for clause in clauses)
+
+    # new queries drop the partition clause
+    def _new_query(query, table):
+        return sa.select(table.c.id)
+
+    def _text_query(query, table):
+        return sa.text(f"SELECT * FROM {table.fullname}")
+
+    for adapter in (_new_query, _text_query):
+        loader.query_adapter_callback = adapter
+        with pytest.raises(ValueError):
+            loader.make_query(clauses[0])
+        # single partition may use any query
+        assert loader.make_query(None) is not None
+
+
+def test_batch_size_for_memory() -> None:
+    rows = [{"id": idx, "content": "x" * 1000} for idx in range(100)]
+    row_bytes = _estimate_item_bytes(rows) // 100
+    assert row_bytes > 1000
+    # fits as many rows as possible below the ceiling
+    assert _batch_size_for_memory(rows, 100, row_bytes * 10, 1000) == 10
+    # never exceeds chunk size and never goes below one row
+    assert _batch_size_for_memory(rows, 100, row_bytes * 10000, 1000) == 1000
+    assert _batch_size_for_memory(rows, 100, 1, 1000) == 1
+    # unknown size keeps chunk size
+    assert _batch_size_for_memory([], 0, 1, 1000) == 1000
+
+
+@pytest.mark.parametrize("backend", ["sqlalchemy", "pyarrow", "pandas"])
+def test_load_rows_max_chunk_bytes(postgres_db: PostgresSourceDB, backend: TableBackend) -> None:
+    table = postgres_db.get_table("chat_message")
+    loader = TableLoader(
+        postgres_db.engine,
+        backend,
+        table,
+        table_to_columns(table),
+        chunk_size=1000,
+        max_chunk_bytes=4096,
+    )
+    lengths = [len(item) for item in loader.load_rows()]
+    assert sum(lengths) == postgres_db.table_infos["chat_message"]["row_count"]
+    # first batch probes row size, next batches are bound by memory ceiling
+    assert lengths[0] <= MEMORY_PROBE_ROWS
+    assert max(lengths[1:]) < MEMORY_PROBE_ROWS
+
+
 def mock_column(field: str, mock_type: Literal["json", "array"] = "json") -> TDataItem:
     """"""
     import pyarrow as pa
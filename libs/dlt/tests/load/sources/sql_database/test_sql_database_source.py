@@ -38,6 +38,7 @@ try:
         sql_database,
         sql_table,
         remove_nullability_adapter,
+        TPartitionStrategy,
     )
     from dlt.sources.sql_database.helpers import unwrap_json_connector_x
     from tests.load.sources.sql_database.postgres_source import PostgresSourceDB
@@ -494,6 +495,42 @@ def test_load_sql_table_resource_incremental_end_value(
             assert rows[-1]["id"] == start_id
 
 
+@pytest.mark.parametrize("backend", ["sqlalchemy", "pyarrow", "pandas", "connectorx"])
+@pytest.mark.parametrize(
+    "partition_column,partition_strategy",
+    [(None, "range"), ("id", "modulo"), ("created_at", "range")],
+)
+def test_load_sql_table_partitioned(
+    postgres_db: PostgresSourceDB,
+    backend: TableBackend,
+    partition_column: str,
+    partition_strategy: TPartitionStrategy,
+) -> None:
+    if backend == "connectorx":
+        pytest.importorskip("sqlalchemy", minversion="2.0")
+    ids = postgres_db.table_infos["chat_message"]["ids"]
+    start_id = ids[len(ids) // 3]
+
+    table = sql_table(
+        credentials=postgres_db.credentials,
+        schema=postgres_db.schema,
+        table="chat_message",
+        backend=backend,
+        chunk_size=17,
+        partitions=4,
+        partition_column=partition_column,
+        partition_strategy=partition_strategy,
+        incremental=dlt.sources.incremental("id", initial_value=start_id),
+    )
+    pipeline = make_pipeline("duckdb")
+    info = pipeline.run(table)
+    assert_load_info(info)
+    rows = load_tables_to_dicts(pipeline, "chat_message")["chat_message"]
+    assert sorted(row["id"] for row in rows) == [id_ for id_ in ids if id_ >= start_id]
+    # incremental state is computed over all partitions
+    assert table.state["incremental"]["id"]["last_value"] == max(ids)
+
+
 @pytest.mark.parametrize("backend", ["sqlalchemy", "pyarrow", "pandas", "connectorx"])
 @pytest.mark.parametrize("defer_table_reflect", (False, True))
 def test_load_sql_table_resource_select_columns(
@@ -3,14 +3,22 @@ Tests to test the parallelism settings on the loader
 NOTE: there are tests in custom destination to check parallelism settings are applied
 """
 
-from typing import Tuple, Any, cast
+import os
+import pytest
+from typing import Sequence, Tuple, Any, cast
 
-from dlt.load.utils import filter_new_jobs, get_available_worker_slots
+from dlt.load.jobs_index import PackageJobsIndex
+from dlt.load.utils import get_available_worker_slots, pick_new_jobs
 from dlt.load.configuration import LoaderConfiguration
+from dlt.common.configuration import ConfigurationValueError, resolve_configuration
 from dlt.common.destination import DestinationCapabilitiesContext
 from dlt.common.utils import uniq_id
+from dlt.common.storages import FileStorage, PackageStorage
+from dlt.common.storages.load_package import create_load_id
 from dlt.common.storages.load_storage import ParsedLoadJobFileName
 
+from tests.utils import TEST_STORAGE_ROOT, autouse_test_storage
+
 
 def create_job_name(table: str, index: int) -> str:
     uid = uniq_id()
@@ -21,6 +29,17 @@ def get_caps_conf() -> Tuple[DestinationCapabilitiesContext, LoaderConfiguration
     return DestinationCapabilitiesContext(), LoaderConfiguration()
 
 
+def create_jobs_index(job_names: Sequence[str]) -> PackageJobsIndex:
+    storage = PackageStorage(
+        FileStorage(os.path.join(TEST_STORAGE_ROOT, "load"), makedirs=True), "normalized"
+    )
+    load_id = create_load_id()
+    storage.create_package(load_id)
+    for job_name in job_names:
+        storage.storage.save(storage.get_job_file_path(load_id, "new_jobs", job_name), "x")
+    return PackageJobsIndex(storage, load_id)
+
+
 def test_get_available_worker_slots() -> None:
     caps, conf = get_caps_conf()
 
@@ -62,16 +81,16 @@ def test_table_sequential_parallelism_strategy() -> None:
     caps, conf = get_caps_conf()
 
     # default is 20
-    assert len(filter_new_jobs(job_names, caps, conf, [], 20)) == 20
+    assert len(pick_new_jobs(create_jobs_index(job_names), caps, conf, [], 20)) == 20
 
     # table sequential will give us 8, one for each table
     conf.parallelism_strategy = "table-sequential"
-    filtered = filter_new_jobs(job_names, caps, conf, [], 20)
-    assert len(filtered) == 8
-    assert len({ParsedLoadJobFileName.parse(j).table_name for j in job_names}) == 8
+    picked = pick_new_jobs(create_jobs_index(job_names), caps, conf, [], 20)
+    assert len(picked) == 8
+    assert len({ParsedLoadJobFileName.parse(j).table_name for j in picked}) == 8
 
     # only free available slots are also applied
-    assert len(filter_new_jobs(job_names, caps, conf, [], 3)) == 3
+    assert len(pick_new_jobs(create_jobs_index(job_names), caps, conf, [], 3)) == 3
 
 
 def test_strategy_preference() -> None:
@@ -83,36 +102,168 @@ def test_strategy_preference() -> None:
 
     # nothing set will default to parallel
     assert (
-        len(filter_new_jobs(job_names, caps, conf, [], get_available_worker_slots(conf, caps, [])))
+        len(
+            pick_new_jobs(
+                create_jobs_index(job_names),
+                caps,
+                conf,
+                [],
+                get_available_worker_slots(conf, caps, []),
+            )
+        )
         == 20
     )
 
     caps.loader_parallelism_strategy = "table-sequential"
     assert (
-        len(filter_new_jobs(job_names, caps, conf, [], get_available_worker_slots(conf, caps, [])))
+        len(
+            pick_new_jobs(
+                create_jobs_index(job_names),
+                caps,
+                conf,
+                [],
+                get_available_worker_slots(conf, caps, []),
+            )
+        )
         == 8
     )
 
     caps.loader_parallelism_strategy = "sequential"
     assert (
-        len(filter_new_jobs(job_names, caps, conf, [], get_available_worker_slots(conf, caps, [])))
+        len(
+            pick_new_jobs(
+                create_jobs_index(job_names),
+                caps,
+                conf,
+                [],
+                get_available_worker_slots(conf, caps, []),
+            )
+        )
         == 1
     )
 
     # config may override (will go back to default 20)
     conf.parallelism_strategy = "parallel"
     assert (
-        len(filter_new_jobs(job_names, caps, conf, [], get_available_worker_slots(conf, caps, [])))
+        len(
+            pick_new_jobs(
+                create_jobs_index(job_names),
+                caps,
+                conf,
+                [],
+                get_available_worker_slots(conf, caps, []),
+            )
+        )
         == 20
     )
 
     conf.parallelism_strategy = "table-sequential"
     assert (
-        len(filter_new_jobs(job_names, caps, conf, [], get_available_worker_slots(conf, caps, [])))
+        len(
+            pick_new_jobs(
+                create_jobs_index(job_names),
+                caps,
+                conf,
+                [],
+                get_available_worker_slots(conf, caps, []),
+            )
+        )
         == 8
     )
 
 
 def test_no_input() -> None:
     caps, conf = get_caps_conf()
-    assert filter_new_jobs([], caps, conf, [], 50) == []
+    assert pick_new_jobs(create_jobs_index([]), caps, conf, [], 50) == []
+
+
+def test_pick_new_jobs_from_index() -> None:
+    storage = PackageStorage(
+        FileStorage(os.path.join(TEST_STORAGE_ROOT, "load"), makedirs=True), "normalized"
+    )
+    load_id = create_load_id()
+    storage.create_package(load_id)
+    # 4 tables with 5 jobs each, size grows with job index and table number
+    for y in range(4):
+        for i in range(5):
+            storage.storage.save(
+                storage.get_job_file_path(load_id, "new_jobs", create_job_name(f"t{y}", i)),
+                "x" * (i * 10 + y),
+            )
+    # a large sql followup job
+    sql_job = f"t0.{uniq_id()}.0.sql"
+    storage.storage.save(storage.get_job_file_path(load_id, "new_jobs", sql_job), "x" * 1000)
+    caps, conf = get_caps_conf()
+    jobs_index = PackageJobsIndex(storage, load_id)
+    assert jobs_index.new_jobs_count == 21
+
+    # largest first
+    new_jobs = jobs_index.list_new_jobs()
+    assert os.path.basename(new_jobs[0]) == sql_job
+    sizes = [os.path.getsize(storage.storage.make_full_path(job)) for job in new_jobs]
+    assert sizes == sorted(sizes, reverse=True)
+
+    # at most one sql job and two jobs per table
+    conf.max_parallel_jobs_per_table = 2
+    conf.max_parallel_jobs_per_file_format = {"sql": 1}
+    picked = pick_new_jobs(jobs_index, caps, conf, [], 20)
+    assert [ParsedLoadJobFileName.parse(job).table_name for job in picked] == [
+        "t0",
+        "t3",
+        "t2",
+        "t1",
+        "t0",
+        "t3",
+        "t2",
+        "t1",
+    ]
+    assert os.path.basename(picked[0]) == sql_job
+    # picked jobs are not picked again
+    assert set(picked).isdisjoint(pick_new_jobs(jobs_index, caps, conf, [], 20))
+
+    # index is updated when jobs move
+    jobs_index = PackageJobsIndex(storage, load_id)
+    picked = pick_new_jobs(jobs_index, caps, conf, [], 20)
+    for job in picked:
+        jobs_index.move_job(os.path.basename(job), "started_jobs")
+    assert jobs_index.new_jobs_count == 13
+    running = [ParsedLoadJobFileName.parse(job) for job in picked]
+    # all tables are at the limit
+    assert jobs_index.pick_new_jobs(20, running, max_jobs_per_table=2) == []
+    # retried job gets back to new jobs
+    retried = ParsedLoadJobFileName.parse(picked[1])
+    jobs_index.move_job(retried.file_name(), "new_jobs", retried.with_retry().file_name())
+    assert jobs_index.new_jobs_count == 14
+    assert jobs_index.pick_new_jobs(20, running[:1] + running[2:], max_jobs_per_table=2) == [
+        storage.get_job_file_path(load_id, "new_jobs", retried.with_retry().file_name())
+    ]
+
+    # table sequential strategy picks one job per table
+    conf.parallelism_strategy = "table-sequential"
+    picked = pick_new_jobs(jobs_index, caps, conf, [], 20)
+    assert sorted(ParsedLoadJobFileName.parse(job).table_name for job in picked) == [
+        "t0",
+        "t1",
+        "t2",
+        "t3",
+    ]
+
+
+def test_max_parallel_jobs_validation() -> None:
+    with pytest.raises(ConfigurationValueError):
+        resolve_configuration(
+            LoaderConfiguration(), explicit_value={"max_parallel_jobs_per_table": 0}
+        )
+    with pytest.raises(ConfigurationValueError):
+        resolve_configuration(
+            LoaderConfiguration(),
+            explicit_value={"max_parallel_jobs_per_file_format": {"sql": 1, "parquet": 0}},
+        )
+    config = resolve_configuration(
+        LoaderConfiguration(),
+        explicit_value={
+            "max_parallel_jobs_per_table": 1,
+            "max_parallel_jobs_per_file_format": {"sql": 1},
+        },
+    )
+    assert config.max_parallel_jobs_per_table == 1
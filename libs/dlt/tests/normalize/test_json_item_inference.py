@@ -193,6 +193,51 @@ def test_coerce_row(item_normalizer: JsonLItemsNormalizer) -> None:
     assert not isinstance(exc_val.value.coerced_value, bytes)
 
 
+def test_coerce_row_compiled_plan(item_normalizer: JsonLItemsNormalizer) -> None:
+    row = {"id": 1, "name": "a", "ts": "2022-05-10T00:17:15.300000+02:00", "flag": None}
+    new_row, new_table = item_normalizer._coerce_row("plan", None, row)
+    new_table["columns"]["flag"]["data_type"] = "bool"
+    item_normalizer.schema.update_table(new_table)
+    # table did not exist when plan was requested
+    assert item_normalizer._coercion_plans["plan"][tuple(row)] is None
+    item_normalizer._coercion_plans.clear()
+
+    # all columns complete: plan is compiled and reused
+    row_2 = {"id": 2, "name": "b", "ts": "2022-05-10T05:30:45.500000-03:00", "flag": None}
+    fast_row, new_table = item_normalizer._coerce_row("plan", None, dict(row_2))
+    assert new_table is None
+    plan = item_normalizer._coercion_plans["plan"][tuple(row_2)]
+    assert [p[:2] for p in plan] == [
+        ("id", "bigint"),
+        ("name", "text"),
+        ("ts", "timestamp"),
+        ("flag", "bool"),
+    ]
+    # plan gives the same result as the slow path
+    item_normalizer._coercion_plans["plan"][tuple(row_2)] = None
+    slow_row, _ = item_normalizer._coerce_row("plan", None, dict(row_2))
+    assert (
+        fast_row == slow_row == {
+            "id": 2,
+            "name": "b",
+            "ts": pendulum.parse("2022-05-10T08:30:45.500000+00:00"),
+        }
+    )
+    item_normalizer._coercion_plans.clear()
+
+    # values that do not fit the plan go to the slow path and create variants
+    new_row, new_table = item_normalizer._coerce_row(
+        "plan", None, {"id": "x", "name": "c", "ts": None, "flag": True}
+    )
+    assert new_row == {"id__v_text": "x", "name": "c", "flag": True}
+    assert list(new_table["columns"]) == ["id__v_text"]
+    # other field sets have their own plans
+    new_row, new_table = item_normalizer._coerce_row("plan", None, {"name": 1, "id": "2"})
+    assert new_row == {"name": "1", "id": 2}
+    assert new_table is None
+    assert len(item_normalizer._coercion_plans["plan"]) == 2
+
+
 def test_coerce_row_iso_timestamp(item_normalizer: JsonLItemsNormalizer) -> None:
     timestamp_str = "2022-05-10T00:17:15.300000+00:00"
     # will generate timestamp type
@@ -1072,3 +1117,23 @@ def test_filter_hints_no_table(
     # make sure the column order is the same when inferring from newly created table
     rows = schema.filter_row_with_hint("event_bot", "not_null", coerced_row)
     assert list(rows.keys()) == ["timestamp", "sender_id"]
+
+
+def test_merge_schema_update_per_table(item_normalizer: JsonLItemsNormalizer) -> None:
+    partial_a = utils.new_table("event", columns=[utils.new_column("a", "bigint")])
+    partial_b = utils.new_table("event", columns=[utils.new_column("b", "text")])
+    partial_other = utils.new_table("other", columns=[utils.new_column("c", "bool")])
+
+    schema_update: TSchemaUpdate = {}
+    item_normalizer._merge_schema_update(schema_update, {"event": [partial_a]})
+    item_normalizer._merge_schema_update(
+        schema_update, {"event": [partial_b], "other": [partial_other]}
+    )
+
+    # a single merged partial table is kept per table name
+    assert len(schema_update["event"]) == 1
+    assert list(schema_update["event"][0]["columns"].keys()) == ["a", "b"]
+    assert len(schema_update["other"]) == 1
+    assert list(schema_update["other"][0]["columns"].keys()) == ["c"]
+    # merged partials are not modified in place
+    assert list(partial_a["columns"].keys()) == ["a"]
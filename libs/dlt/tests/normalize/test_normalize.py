@@ -1,4 +1,5 @@
 import os
+import itertools
 from copy import deepcopy
 import pytest
 from fnmatch import fnmatch
@@ -6,7 +7,7 @@ from typing import Dict, Iterator, List, Sequence, Tuple
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 
 from dlt.common import logger
-from dlt.common import json
+from dlt.common import json, pendulum
 from dlt.common.destination.capabilities import TLoaderFileFormat
 from dlt.common.schema.exceptions import CannotCoerceColumnException
 from dlt.common.schema.schema import Schema
@@ -21,7 +22,12 @@ from dlt.common.configuration.container import Container
 from dlt.extract.extract import ExtractStorage
 from dlt.normalize import Normalize
 from dlt.normalize.validate import validate_and_update_schema
-from dlt.normalize.worker import group_worker_files
+from dlt.normalize.worker import (
+    group_worker_files_by_size,
+    load_schema_snapshot,
+    publish_schema_snapshot,
+    remove_schema_snapshots,
+)
 from dlt.normalize.exceptions import NormalizeJobFailed
 
 from tests.cases import JSON_TYPED_DICT, JSON_TYPED_DICT_TYPES
@@ -305,6 +311,12 @@ def test_multiprocessing_row_counting(
         for t, m in step_info.metrics[step_info.loads_ids[0]][0]["table_metrics"].items()
     }
     assert row_counts == step_info.row_counts
+    # per worker stats are collected
+    worker_metrics = step_info.metrics[step_info.loads_ids[0]][0]["worker_metrics"]
+    assert 1 <= len(worker_metrics) <= 4
+    assert sum(m.files_count for m in worker_metrics.values()) == 1
+    assert all(0.0 <= m.utilization <= 1.0 for m in worker_metrics.values())
+    assert step_info.asdict()["worker_metrics"][0]["files_count"] == 1
 
 
 @pytest.mark.parametrize("caps", ALL_CAPABILITIES, indirect=True)
@@ -517,43 +529,124 @@ def test_collect_metrics_on_exception(raw_normalize: Normalize) -> None:
     raw_normalize.get_step_info(MockPipeline("multiprocessing_pipeline", True))  # type: ignore[abstract]
 
 
-def test_group_worker_files() -> None:
-    files = ["f%03d" % idx for idx in range(0, 100)]
+def test_columnar_only_in_json_normalizer_config() -> None:
+    from dlt.normalize.configuration import (
+        ItemsNormalizerConfiguration,
+        JsonNormalizerConfiguration,
+        NormalizeConfiguration,
+    )
 
-    assert group_worker_files([], 4) == []
-    assert group_worker_files(["f001"], 1) == [["f001"]]
-    assert group_worker_files(["f001"], 100) == [["f001"]]
-    assert group_worker_files(files[:4], 4) == [["f000"], ["f001"], ["f002"], ["f003"]]
-    assert group_worker_files(files[:5], 4) == [
-        ["f000"],
-        ["f001"],
-        ["f002"],
-        ["f003", "f004"],
-    ]
-    assert group_worker_files(files[:8], 4) == [
-        ["f000", "f001"],
-        ["f002", "f003"],
-        ["f004", "f005"],
-        ["f006", "f007"],
-    ]
-    assert group_worker_files(files[:8], 3) == [
-        ["f000", "f001"],
-        ["f002", "f003", "f006"],
-        ["f004", "f005", "f007"],
-    ]
-    assert group_worker_files(files[:5], 3) == [
-        ["f000"],
-        ["f001", "f003"],
-        ["f002", "f004"],
+    config = NormalizeConfiguration()
+    assert isinstance(config.json_normalizer, JsonNormalizerConfiguration)
+    assert config.json_normalizer.columnar is False
+    assert "columnar" not in ItemsNormalizerConfiguration.get_resolvable_fields()
+    assert "columnar" not in config.parquet_normalizer
+    assert "columnar" not in config.model_normalizer
+
+
+def test_columnar_json_normalizer(mocker: MockerFixture) -> None:
+    from dlt.common.libs.pyarrow import pyarrow as pa
+    from dlt.destinations import duckdb
+    from dlt.normalize.items_normalizers import ColumnarJsonLItemsNormalizer
+
+    def _items(start: int) -> List[StrAny]:
+        return [
+            {
+                "id": i,
+                "name": f"name {i}",
+                "score": 1.5 * i,
+                "meta": {"a": i, "b": "x"} if i % 4 else None,
+                "tags": ["t1", "t2"][: i % 3],
+                "children": [{"cid": j, "grand": [j, j + 1]} for j in range(i % 3)],
+                "opt": None if i % 2 else "o",
+            }
+            for i in range(start, start + 10)
+        ]
+
+    def _normalize(columnar: bool) -> Tuple[Dict[str, pa.Table], Schema]:
+        os.environ["NORMALIZE__JSON_NORMALIZER__COLUMNAR"] = str(columnar)
+        caps = duckdb().capabilities()
+        caps.preferred_loader_file_format = "parquet"
+        with Container().injectable_context(caps):
+            normalize = next(init_normalize())
+            # first package creates the schema so row-wise normalizer is used
+            extract_items(
+                normalize.normalize_storage,
+                _items(0),
+                load_or_create_schema(normalize, "test_schema"),
+                "items",
+            )
+            normalize_pending(normalize)
+            spy = mocker.spy(ColumnarJsonLItemsNormalizer, "_normalize_chunk_columnar")
+            extract_items(
+                normalize.normalize_storage,
+                _items(10),
+                load_or_create_schema(normalize, "test_schema"),
+                "items",
+            )
+            load_id = normalize_pending(normalize)
+            if columnar:
+                # all chunks in the second package fit the schema
+                assert spy.call_count == 1
+                assert spy.spy_exception is None
+            else:
+                assert spy.call_count == 0
+            mocker.stop(spy)
+        tables: Dict[str, pa.Table] = {}
+        for job in normalize.load_storage.normalized_packages.list_new_jobs(load_id):
+            assert job.endswith(".parquet")
+            table_name = ParsedLoadJobFileName.parse(job).table_name
+            tables[table_name] = pa.parquet.read_table(
+                normalize.load_storage.normalized_packages.storage.make_full_path(job)
+            )
+        return tables, normalize.schema_storage.load_schema("test_schema")
+
+    row_tables, row_schema = _normalize(False)
+    columnar_tables, columnar_schema = _normalize(True)
+    assert row_schema.tables == columnar_schema.tables
+    assert set(row_tables) == set(columnar_tables) == set(row_schema.data_table_names())
+
+    def _parent_positions(tables: Dict[str, pa.Table], table_name: str) -> List[int]:
+        # translate random row ids into positions of the parent rows
+        parent_name = row_schema.tables[table_name]["parent"]
+        parent_ids = tables[parent_name]["_dlt_id"].to_pylist()
+        return [parent_ids.index(p_id) for p_id in tables[table_name]["_dlt_parent_id"].to_pylist()]
+
+    for table_name, row_table in row_tables.items():
+        columnar_table = columnar_tables[table_name]
+        assert row_table.schema == columnar_table.schema
+        for col_name in row_table.column_names:
+            if col_name in ("_dlt_id", "_dlt_parent_id", "_dlt_load_id"):
+                continue
+            assert row_table[col_name] == columnar_table[col_name], col_name
+        if "_dlt_parent_id" in row_table.column_names:
+            assert _parent_positions(row_tables, table_name) == _parent_positions(
+                columnar_tables, table_name
+            )
+        assert len(set(columnar_table["_dlt_id"].to_pylist())) == columnar_table.num_rows
+
+
+def test_group_worker_files_by_size() -> None:
+    assert group_worker_files_by_size([], 4) == []
+    assert group_worker_files_by_size([("f001", 0)], 4) == [["f001"]]
+    # 2 workers x 2 units, unit size 25
+    files = [("f%03d" % idx, 10) for idx in range(0, 10)]
+    assert group_worker_files_by_size(files, 2, 2) == [
+        ["f000", "f001", "f002"],
+        ["f003", "f004", "f005"],
+        ["f006", "f007", "f008"],
+        ["f009"],
     ]
-
-    # check if sorted
-    files = ["tab1.1", "chd.3", "tab1.2", "chd.4", "tab1.3"]
-    assert group_worker_files(files, 3) == [
+    # large file forms its own unit and is scheduled first
+    files = [("tab1.1", 10), ("chd.3", 100), ("tab1.2", 10), ("chd.4", 10), ("tab1.3", 10)]
+    assert group_worker_files_by_size(files, 2, 2) == [
         ["chd.3"],
-        ["chd.4", "tab1.2"],
-        ["tab1.1", "tab1.3"],
+        ["chd.4", "tab1.1", "tab1.2", "tab1.3"],
     ]
+    # every file present exactly once
+    files = [("f%03d" % idx, idx * 7 % 13) for idx in range(0, 100)]
+    units = group_worker_files_by_size(files, 3)
+    assert sorted(itertools.chain(*units)) == sorted(f for f, _ in files)
 
 
 EXPECTED_ETH_TABLES = [
@@ -786,6 +879,104 @@ def test_update_schema_column_conflict(rasa_normalize: Normalize) -> None:
     assert "col2" in schema.tables["event_slot"]["columns"]
 
 
+@pytest.mark.parametrize("pool_cls", [ThreadPoolExecutor, ProcessPoolExecutor])
+def test_parallel_workers_agree_column_types(raw_normalize: Normalize, pool_cls: type) -> None:
+    schema = Schema("conflict")
+    extractor = ExtractStorage(raw_normalize.normalize_storage.config)
+    load_id = extractor.create_load_package(schema)
+    # same table in two files, "value" has different types in each of them
+    for items in [
+        [{"id": idx, "value": idx} for idx in range(10)],
+        [{"id": idx, "value": f"text_{idx}"} for idx in range(10)],
+    ]:
+        extractor.item_storages["object"].write_data_item(
+            load_id, schema.name, "items", items, None
+        )
+        extractor.close_writers(load_id)
+    extractor.commit_new_load_package(load_id, schema)
+    assert len(raw_normalize.normalize_storage.extracted_packages.list_new_jobs(load_id)) == 2
+
+    with pool_cls(max_workers=2) as p:
+        raw_normalize.run(p)
+
+    step_info = raw_normalize.get_step_info(MockPipeline("multiprocessing_pipeline", True))  # type: ignore[abstract]
+    assert step_info.row_counts["items"] == 20
+    # first worker decided the type, no task was redone
+    worker_metrics = step_info.metrics[load_id][0]["worker_metrics"].values()
+    assert sum(m.discarded_tasks_count for m in worker_metrics) == 0
+    assert sum(m.tasks_count for m in worker_metrics) == 2
+    if pool_cls is ThreadPoolExecutor:
+        # threads of the pool are reported separately
+        assert all(m.worker_id.startswith(f"{os.getpid()}-") for m in worker_metrics)
+    columns = raw_normalize.schema_storage.load_schema("conflict").tables["items"]["columns"]
+    if columns["value"]["data_type"] == "bigint":
+        assert columns["value__v_text"]["data_type"] == "text"
+    else:
+        assert columns["value"]["data_type"] == "text"
+        assert "value__v_text" not in columns
+
+
+@pytest.mark.parametrize("read_chunk_size", [1, 1024 * 1024])
+def test_normalize_jsonl_chunks(
+    raw_normalize: Normalize, read_chunk_size: int, mocker: MockerFixture
+) -> None:
+    from dlt.normalize.items_normalizers import JsonLItemsNormalizer
+
+    mocker.patch.object(JsonLItemsNormalizer, "READ_CHUNK_SIZE", read_chunk_size)
+    spy_chunk = mocker.spy(JsonLItemsNormalizer, "_normalize_chunk")
+    # write a line per 2 items, new columns show up in later lines
+    os.environ["DATA_WRITER__BUFFER_MAX_ITEMS"] = "1"
+    items = [{"id": idx, f"col_{idx // 4}": pendulum.datetime(2024, 1, 1)} for idx in range(10)]
+    schema = Schema("chunks")
+    extractor = ExtractStorage(raw_normalize.normalize_storage.config)
+    load_id = extractor.create_load_package(schema)
+    for idx in range(0, len(items), 2):
+        extractor.item_storages["object"].write_data_item(
+            load_id, schema.name, "items", items[idx : idx + 2], None
+        )
+    extractor.close_writers(load_id)
+    extractor.commit_new_load_package(load_id, schema)
+    schema_files = raw_normalize.normalize_storage.extracted_packages.list_new_jobs(load_id)
+    assert len(schema_files) == 1
+
+    raw_normalize._step_info_start_load_id(load_id)
+    raw_normalize.load_storage.new_packages.create_package(load_id)
+    result = raw_normalize.map_single(schema, load_id, schema_files)
+    # one line per chunk or all lines in a single chunk
+    assert spy_chunk.call_count == (5 if read_chunk_size == 1 else 1)
+    # all partial tables are merged into a single update per file
+    assert len(result.schema_updates) == 1
+    assert sum(m.items_count for m in result.file_metrics) == 10
+    columns = schema.get_table_columns("items")
+    # typed values were decoded
+    assert all(columns[f"col_{idx}"]["data_type"] == "timestamp" for idx in range(3))
+
+
+def test_schema_snapshot(raw_normalize: Normalize) -> None:
+    schema = Schema("snapshot")
+    load_id = extract_items(raw_normalize.normalize_storage, [{"id": 1}], schema, "items")
+    extracted_packages = raw_normalize.normalize_storage.extracted_packages
+    package_path = extracted_packages.get_package_path(load_id)
+    stored_schema = schema.to_dict()
+    snapshot = publish_schema_snapshot(extracted_packages.storage, package_path, stored_schema)
+    assert snapshot.version_hash == schema.version_hash
+    assert os.path.isfile(snapshot.file_path)
+
+    # each load returns a private copy
+    loaded_schema = load_schema_snapshot(snapshot)
+    assert loaded_schema == stored_schema
+    loaded_schema["tables"].clear()
+    assert load_schema_snapshot(snapshot) == stored_schema
+    # stored schemas are passed through
+    assert load_schema_snapshot(stored_schema) is stored_schema
+
+    remove_schema_snapshots(extracted_packages.storage, package_path)
+    assert not os.path.isfile(snapshot.file_path)
+    # package is intact
+    assert len(extracted_packages.list_new_jobs(load_id)) == 1
+    assert extracted_packages.load_schema(load_id).name == "snapshot"
+
+
 def test_removal_of_normalizer_schema_section_and_add_seen_data(raw_normalize: Normalize) -> None:
     extract_cases(
         raw_normalize,
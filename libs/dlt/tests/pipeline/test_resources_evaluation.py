@@ -1,11 +1,21 @@
 from typing import Any, List
 import time
 import threading
+import multiprocessing
 import random
 from itertools import product
 
 import dlt, asyncio, pytest, os
-from dlt.extract.exceptions import ResourceExtractionError
+from dlt.extract.exceptions import (
+    InvalidProcessParallelResource,
+    ProcessParallelFunctionNotImportable,
+    ResourceExtractionError,
+)
+
+# forkserver is not tested, it hangs on CI
+START_METHODS = sorted(
+    set(multiprocessing.get_all_start_methods()).intersection(["fork", "spawn"])
+)
 
 
 def test_async_iterator_resource() -> None:
@@ -124,6 +134,46 @@ def test_async_generator_transformer() -> None:
             assert {r[0] for r in rows} == {"at", "bt", "ct"}
 
 
+def test_asyncio_native_extract() -> None:
+    os.environ["EXTRACT__ASYNCIO_NATIVE"] = "true"
+    os.environ["EXTRACT__MAX_PARALLEL_ITEMS"] = "100"
+    loop_threads = set()
+
+    @dlt.resource
+    async def async_resource():
+        for i in range(50):
+            loop_threads.add(threading.get_ident())
+            yield {"i": i}
+
+    @dlt.transformer(data_from=async_resource)
+    async def async_transformer(item):
+        loop_threads.add(threading.get_ident())
+        await asyncio.sleep(0.1)
+        yield {"i": item["i"], "t": True}
+
+    @dlt.resource(parallelized=True)
+    def parallel_resource():
+        for i in range(5):
+            yield {"i": i}
+
+    pipeline_1 = dlt.pipeline("pipeline_1", destination="duckdb", dev_mode=True)
+    started = time.time()
+    pipeline_1.run([async_resource, async_transformer, parallel_resource])
+    # 50 transformer items sleeping 0.1s each were awaited concurrently
+    assert time.time() - started < 5.0
+    # async code ran in the extracting thread
+    assert loop_threads == {threading.get_ident()}
+
+    with pipeline_1.sql_client() as c:
+        for table_name, expected in [
+            ("async_resource", 50),
+            ("async_transformer", 50),
+            ("parallel_resource", 5),
+        ]:
+            with c.execute_query(f"SELECT COUNT(*) FROM {table_name}") as cur:
+                assert cur.fetchone()[0] == expected
+
+
 @pytest.mark.parametrize("next_item_mode", ["fifo", "round_robin"])
 @pytest.mark.parametrize(
     "resource_mode", ["both_sync", "both_async", "first_async", "second_async"]
@@ -400,6 +450,73 @@ def test_test_parallelized_resource_transformers() -> None:
     assert len(transformer_threads) > 1 and threading.get_ident() not in transformer_threads
 
 
+@dlt.transformer(parallelized="process")
+def multiply_in_process(item, factor: int = 10):
+    return {"value": item * factor, "pid": os.getpid()}
+
+
+@dlt.transformer(parallelized="process")
+def multiply_in_process_gen(item):
+    for i in range(2):
+        yield {"value": item * 10 + i, "pid": os.getpid()}
+
+
+@pytest.mark.parametrize("start_method", START_METHODS)
+@pytest.mark.parametrize("preserve_items_order", [True, False])
+def test_process_parallelized_transformers(preserve_items_order: bool, start_method: str) -> None:
+    os.environ["EXTRACT__PRESERVE_ITEMS_ORDER"] = str(preserve_items_order)
+    prev_start_method = multiprocessing.get_start_method()
+    multiprocessing.set_start_method(start_method, force=True)
+
+    @dlt.resource
+    def numbers():
+        yield from range(1, 7)
+
+    try:
+        result = list(numbers | multiply_in_process(factor=100))
+        assert sorted(r["value"] for r in result) == [i * 100 for i in range(1, 7)]
+        # evaluated in other processes
+        assert all(r["pid"] != os.getpid() for r in result)
+        if preserve_items_order:
+            assert [r["value"] for r in result] == [i * 100 for i in range(1, 7)]
+
+        result = list(numbers | multiply_in_process_gen)
+        assert sorted(r["value"] for r in result) == sorted(
+            i * 10 + j for i in range(1, 7) for j in range(2)
+        )
+        assert all(r["pid"] != os.getpid() for r in result)
+    finally:
+        multiprocessing.set_start_method(prev_start_method, force=True)
+
+    # only transformers may be evaluated in a process pool
+    with pytest.raises(InvalidProcessParallelResource):
+        dlt.resource(numbers, name="numbers_in_process", parallelized="process")
+
+
+def test_process_parallelized_transformer_must_be_importable() -> None:
+    # worker processes import the function by name which is not possible for inner functions
+    with pytest.raises(ProcessParallelFunctionNotImportable) as py_ex:
+
+        @dlt.transformer(parallelized="process")
+        def multiply_inner(item):
+            return item * 10
+
+    assert py_ex.value.resource_name == "multiply_inner"
+    assert "<locals>" in py_ex.value.f_qualname
+
+    @dlt.source
+    def numbers_source():
+        @dlt.transformer(parallelized="process")
+        def multiply_inner(item):
+            return item * 10
+
+        return dlt.resource([1, 2, 3], name="numbers") | multiply_inner
+
+    # transformers defined in source bodies are rejected when the source is created
+    with pytest.raises(ProcessParallelFunctionNotImportable):
+        numbers_source()
+
+
 def test_parallelized_resource_bare_generator() -> None:
     main_thread = threading.get_ident()
     threads = set()
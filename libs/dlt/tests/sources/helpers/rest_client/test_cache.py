@@ -0,0 +1,129 @@
+import os
+from typing import Any, List
+
+import pytest
+import requests_mock
+from requests import Response
+
+from dlt.sources.helpers.rest_client import RESTClient
+from dlt.sources.helpers.rest_client.cache import ResponseCache, get_cache_status
+from dlt.sources.helpers.rest_client.paginators import SinglePagePaginator
+
+from tests.utils import TEST_STORAGE_ROOT
+
+
+@pytest.fixture
+def cache_dir() -> str:
+    return os.path.join(TEST_STORAGE_ROOT, "rest_client_cache")
+
+
+def test_ttl_returns_cached_response(cache_dir: str) -> None:
+    client = RESTClient(
+        base_url="https://api.example.com",
+        paginator=SinglePagePaginator(),
+        response_cache=ResponseCache(cache_dir),
+        cache_ttl=3600,
+    )
+    with requests_mock.Mocker() as m:
+        m.get("https://api.example.com/items?page=1", json=[{"id": 1}])
+        first = list(client.paginate("/items", params={"page": 1}))
+        second = list(client.paginate("/items", params={"page": 1}))
+        assert m.call_count == 1
+
+    assert first == second == [[{"id": 1}]]
+    assert get_cache_status(first[0].response) == "miss"
+    assert get_cache_status(second[0].response) == "hit"
+
+
+def test_conditional_request_revalidates(cache_dir: str) -> None:
+    client = RESTClient(base_url="https://api.example.com", response_cache=ResponseCache(cache_dir))
+    with requests_mock.Mocker() as m:
+        m.get(
+            "https://api.example.com/items",
+            [
+                {"json": [{"id": 1}], "headers": {"ETag": '"v1"'}},
+                {"status_code": 304, "headers": {"ETag": '"v1"'}},
+            ],
+        )
+        list(client.paginate("/items", paginator=SinglePagePaginator()))
+        pages = list(client.paginate("/items", paginator=SinglePagePaginator()))
+        assert m.call_count == 2
+        assert m.request_history[1].headers["If-None-Match"] == '"v1"'
+
+    assert pages == [[{"id": 1}]]
+    assert get_cache_status(pages[0].response) == "revalidated"
+
+
+def test_immutable_skips_revalidation(cache_dir: str) -> None:
+    client = RESTClient(base_url="https://api.example.com", response_cache=ResponseCache(cache_dir))
+    with requests_mock.Mocker() as m:
+        m.get("https://api.example.com/items", json=[{"id": 1}], headers={"ETag": '"v1"'})
+        list(client.paginate("/items", paginator=SinglePagePaginator()))
+        pages = list(
+            client.paginate("/items", paginator=SinglePagePaginator(), cache_immutable=True)
+        )
+        assert m.call_count == 1
+
+    assert get_cache_status(pages[0].response) == "hit"
+
+
+def test_response_hooks_run_on_cached_response(cache_dir: str) -> None:
+    client = RESTClient(
+        base_url="https://api.example.com",
+        response_cache=ResponseCache(cache_dir),
+        cache_ttl=3600,
+    )
+    seen: List[int] = []
+
+    def response_hook(response: Response, *args: Any, **kwargs: Any) -> None:
+        seen.append(response.status_code)
+
+    with requests_mock.Mocker() as m:
+        m.get("https://api.example.com/items", json=[{"id": 1}])
+        for _ in range(2):
+            list(
+                client.paginate(
+                    "/items",
+                    paginator=SinglePagePaginator(),
+                    hooks={"response": [response_hook]},
+                )
+            )
+    assert seen == [200, 200]
+
+
+def test_uncacheable_responses_are_not_stored(cache_dir: str) -> None:
+    cache = ResponseCache(cache_dir)
+    client = RESTClient(base_url="https://api.example.com", response_cache=cache)
+    with requests_mock.Mocker() as m:
+        # no validators and no ttl
+        m.get("https://api.example.com/items", json=[{"id": 1}])
+        list(client.paginate("/items", paginator=SinglePagePaginator()))
+    assert cache.total_bytes == 0
+
+
+def test_evicts_least_recently_used(cache_dir: str) -> None:
+    body = [{"id": i, "value": "x" * 100} for i in range(10)]
+    cache = ResponseCache(cache_dir)
+    client = RESTClient(base_url="https://api.example.com", response_cache=cache, cache_ttl=3600)
+
+    def get_page(page: int) -> None:
+        list(client.paginate("/items", params={"page": page}, paginator=SinglePagePaginator()))
+
+    with requests_mock.Mocker() as m:
+        for page in range(3):
+            m.get(f"https://api.example.com/items?page={page}", json=body)
+        get_page(0)
+        # room for two responses
+        cache.max_bytes = int(cache.total_bytes * 2.5)
+        for page in (1, 0, 2):
+            get_page(page)
+        assert m.call_count == 3
+        # page 1 is the least recently used and was evicted
+        get_page(0)
+        assert m.call_count == 3
+        get_page(1)
+        assert m.call_count == 4
+    assert cache.total_bytes <= cache.max_bytes
+
+    # index is rebuilt from the cache directory
+    assert ResponseCache(cache_dir, max_bytes=cache.max_bytes).total_bytes == cache.total_bytes
@@ -1,4 +1,5 @@
 import os
+import sys
 from base64 import b64encode
 from typing import Any, Dict, cast, List, Optional
 from unittest.mock import patch, ANY
@@ -10,6 +11,7 @@ from requests.exceptions import HTTPError
 import requests_mock
 
 from dlt.common import logger
+from dlt.common.exceptions import MissingDependencyException
 from dlt.common.typing import TSecretStrValue
 from dlt.sources.helpers.requests import Client
 from dlt.sources.helpers.rest_client import RESTClient
@@ -27,7 +29,11 @@ from dlt.sources.helpers.rest_client.paginators import (
     JSONLinkPaginator,
     BaseReferencePaginator,
     JSONResponseCursorPaginator,
+    OffsetPaginator,
+    PageNumberPaginator,
+    HeaderLinkPaginator,
 )
+from dlt.sources.rest_api.config_setup import create_response_hooks
 
 from .conftest import DEFAULT_PAGE_SIZE, DEFAULT_TOTAL_PAGES, assert_pagination
 
@@ -175,6 +181,128 @@ class TestRESTClient:
         pages = list(pages_iter)
         assert pages == []
 
+    @pytest.mark.parametrize("prefetch_pages", [0, 1, 3, 10])
+    def test_paginate_prefetch_pages(self, rest_client: RESTClient, prefetch_pages: int) -> None:
+        requested_pages: List[str] = []
+
+        def response_hook(response: Response, *args: Any, **kwargs: Any) -> None:
+            requested_pages.append(response.request.url)
+
+        pages = list(
+            rest_client.paginate(
+                "/posts",
+                paginator=PageNumberPaginator(
+                    base_page=1, total_path="total_pages", prefetch_pages=prefetch_pages
+                ),
+                hooks={"response": [response_hook]},
+            )
+        )
+        assert_pagination(pages)
+        # total is known so no page past the end is requested
+        assert sorted(requested_pages) == [
+            f"https://api.example.com/posts?page={page}" for page in range(1, 6)
+        ]
+        # pages are yielded in order
+        assert [page.response.json()["page"] for page in pages] == [1, 2, 3, 4, 5]
+
+    def test_paginate_prefetch_stops_after_empty_page(self, rest_client: RESTClient) -> None:
+        requested_offsets: List[int] = []
+
+        def response_hook(response: Response, *args: Any, **kwargs: Any) -> None:
+            requested_offsets.append(int(response.request.url.split("offset=")[1].split("&")[0]))
+
+        pages = list(
+            rest_client.paginate(
+                "/posts_offset_limit",
+                paginator=OffsetPaginator(
+                    limit=10, total_path=None, maximum_offset=1000, prefetch_pages=4
+                ),
+                hooks={"response": [response_hook]},
+            )
+        )
+        assert [len(page) for page in pages] == [10, 10, 5, 0]
+        assert [item["id"] for page in pages for item in page] == list(range(25))
+        # pending requests past the empty page are dropped
+        assert len(requested_offsets) <= 4 + 4
+
+    def test_paginate_prefetch_error(self, rest_client: RESTClient) -> None:
+        def response_hook(response: Response, *args: Any, **kwargs: Any) -> None:
+            if "page=3" in response.request.url:
+                raise HTTPError("page 3 failed", response=response)
+
+        pages = []
+        with pytest.raises(HTTPError):
+            for page in rest_client.paginate(
+                "/posts",
+                paginator=PageNumberPaginator(
+                    base_page=1, total_path="total_pages", prefetch_pages=3
+                ),
+                hooks={"response": [response_hook]},
+            ):
+                pages.append(page)
+        # pages before the failed one are yielded in order
+        assert [page.response.json()["page"] for page in pages] == [1, 2]
+
+    def test_paginate_stream_batches(self) -> None:
+        rest_client = RESTClient(base_url="https://api.example.com", stream_batch_size=2)
+
+        pages = list(
+            rest_client.paginate(
+                "/posts_header_link", paginator=HeaderLinkPaginator(), data_selector="$"
+            )
+        )
+        # each page of 5 posts is split into batches of at most 2 items
+        assert [len(page) for page in pages] == [2, 2, 1] * 5
+        assert [item["id"] for page in pages for item in page] == list(range(25))
+
+    def test_stream_batch_size_requires_ijson(self) -> None:
+        with patch.dict(sys.modules, {"ijson": None}):
+            with pytest.raises(MissingDependencyException) as dep_ex:
+                RESTClient(base_url="https://api.example.com", stream_batch_size=2)
+        assert "ijson" in str(dep_ex.value)
+
+    def test_paginate_stream_falls_back_if_body_is_read(self) -> None:
+        rest_client = RESTClient(base_url="https://api.example.com", stream_batch_size=2)
+
+        # total is read from the response body so the pages are not streamed
+        pages = list(
+            rest_client.paginate(
+                "/posts",
+                paginator=PageNumberPaginator(base_page=1, total_path="total_pages"),
+                data_selector="data",
+            )
+        )
+        assert_pagination(pages)
+
+    def test_paginate_stream_falls_back_if_hook_reads_body(self) -> None:
+        rest_client = RESTClient(base_url="https://api.example.com", stream_batch_size=2)
+
+        # content based response action reads `response.text` before items are streamed
+        hooks = create_response_hooks([{"content": "Not found", "action": "ignore"}])
+        pages = list(
+            rest_client.paginate(
+                "/posts_header_link",
+                paginator=HeaderLinkPaginator(),
+                data_selector="$",
+                hooks=hooks,
+            )
+        )
+        # pages are parsed from the read body and not split into batches
+        assert [len(page) for page in pages] == [5] * 5
+        assert [item["id"] for page in pages for item in page] == list(range(25))
+
+    def test_paginate_stream_offset_stops_after_empty_page(self) -> None:
+        rest_client = RESTClient(base_url="https://api.example.com", stream_batch_size=4)
+
+        pages = list(
+            rest_client.paginate(
+                "/posts_offset_limit",
+                paginator=OffsetPaginator(limit=10, total_path=None, stop_after_empty_page=True),
+                data_selector="data",
+            )
+        )
+        assert [len(page) for page in pages] == [4, 4, 2, 4, 4, 2, 4, 1, 0]
+
     def test_basic_auth_success(self, rest_client: RESTClient):
         response = rest_client.get(
             "/protected/posts/basic-auth",